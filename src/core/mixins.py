@@ -0,0 +1,46 @@
+from django.http import HttpRequest
+from django.utils.cache import patch_vary_headers
+
+
+class PartialResponseMixin:
+    """
+    Частичные ответы для htmx. Если запрос пришёл от htmx (заголовок HX-Request),
+    вместо всей страницы рендерится только выдача: `partial_template_name`, а для
+    следующих страниц (параметр cursor) – `partial_page_template_name`.
+    Курсор следующей страницы дублируется в заголовке X-Next-Cursor.
+
+    В контексте `partial` – признак частичного ответа; вью может пропустить
+    данные, нужные только полной странице (боковая панель и т.п.).
+    """
+
+    request: HttpRequest
+    partial_template_name: str
+    partial_page_template_name: str
+
+    def is_partial_request(self) -> bool:
+        return (
+            self.request.headers.get("HX-Request") == "true"
+            and self.request.headers.get("HX-Boosted") != "true"
+        )
+
+    def get_template_names(self):
+        if self.is_partial_request():
+            if self.request.GET.get("cursor"):
+                return [self.partial_page_template_name]
+            return [self.partial_template_name]
+        return super().get_template_names()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["partial"] = self.is_partial_request()
+        return context
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        # Полная страница и фрагмент по одному URL – кэши должны их различать.
+        patch_vary_headers(response, ["HX-Request"])
+
+        page = context.get("page_obj")
+        if context["partial"] and page is not None and page.has_next():
+            response["X-Next-Cursor"] = page.next_cursor
+        return response
@@ -0,0 +1,235 @@
+"""
+Keyset-пагинация для списков каталога.
+
+Вместо OFFSET следующая страница выбирается условием "после последней строки
+предыдущей страницы" по полям сортировки, поэтому время ответа не зависит от
+номера страницы. Последняя строка кодируется в подписанный курсор (параметр
+`cursor`), подделать или "перелистнуть" его на другую сортировку нельзя.
+"""
+
+import datetime
+import json
+from dataclasses import dataclass
+from functools import cached_property
+
+from django.core import signing
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.http import Http404
+
+CURSOR_SALT = "core.pagination.cursor"
+
+# Ниже этого значения оценка планировщика уточняется точным COUNT(*).
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder обрезает datetime до миллисекунд, а курсору нужна
+    точность до микросекунд, иначе строки с близким `created` потеряются."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorSerializer(signing.JSONSerializer):
+    def dumps(self, obj):
+        return CursorEncoder(separators=(",", ":")).encode(obj).encode("latin-1")
+
+
+@dataclass
+class KeysetPage:
+    object_list: list
+    next_cursor: str | None
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def cursor_encode(ordering: tuple[str, ...], values: list) -> str:
+    return signing.dumps(
+        {"o": list(ordering), "v": values},
+        salt=CURSOR_SALT,
+        serializer=CursorSerializer,
+        compress=True,
+    )
+
+
+def cursor_decode(ordering: tuple[str, ...], cursor: str) -> list:
+    """Значения полей сортировки из курсора. ValueError – если курсор
+    повреждён или выдан для другой сортировки."""
+    try:
+        payload = signing.loads(cursor, salt=CURSOR_SALT)
+    except signing.BadSignature as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if payload.get("o") != list(ordering) or len(payload.get("v", [])) != len(ordering):
+        raise ValueError("Cursor does not match ordering")
+    return payload["v"]
+
+
+def _keyset_filter(ordering: tuple[str, ...], values: list) -> Q:
+    """
+    Условие "строго после" для лексикографической сортировки:
+    (a < a0) OR (a = a0 AND b < b0) OR ... с учётом направления каждого поля.
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def keyset_paginate(
+    queryset: QuerySet,
+    ordering: tuple[str, ...],
+    per_page: int,
+    cursor: str | None = None,
+) -> KeysetPage:
+    """
+    Одна страница `queryset` в порядке `ordering`. Последнее поле сортировки
+    должно быть уникальным (обычно id), иначе страницы могут терять строки.
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(
+            _keyset_filter(ordering, cursor_decode(ordering, cursor))
+        )
+
+    # Лишняя строка показывает, есть ли следующая страница, без COUNT.
+    rows = list(queryset[: per_page + 1])
+    object_list = rows[:per_page]
+
+    next_cursor = None
+    if len(rows) > per_page:
+        last = object_list[-1]
+        next_cursor = cursor_encode(
+            ordering, [getattr(last, field.lstrip("-")) for field in ordering]
+        )
+
+    return KeysetPage(object_list=object_list, next_cursor=next_cursor)
+
+
+def queryset_estimated_count(
+    queryset: QuerySet, threshold: int = ESTIMATED_COUNT_THRESHOLD
+) -> int:
+    """
+    Количество строк queryset без полного COUNT(*) на больших таблицах.
+
+    Для запроса без фильтров берётся pg_class.reltuples, для остальных – оценка
+    планировщика из EXPLAIN. Если оценка меньше `threshold` (или статистики ещё
+    нет), выполняется точный COUNT – на малых выборках он дешёвый.
+    """
+    return queryset_count_or_estimate(queryset, threshold)[0]
+
+
+def queryset_count_or_estimate(
+    queryset: QuerySet, threshold: int = ESTIMATED_COUNT_THRESHOLD
+) -> tuple[int, bool]:
+    """То же, что queryset_estimated_count, но вместе с признаком того, что
+    возвращена оценка планировщика, а не точный COUNT."""
+    connection = connections[queryset.db]
+    queryset = queryset.order_by()
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where and not queryset.query.distinct:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+        else:
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        row = cursor.fetchone()
+
+    if isinstance(row[0], int):
+        estimate = row[0]
+    else:
+        plan = json.loads(row[0]) if isinstance(row[0], str) else row[0]
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+    # reltuples = -1, пока таблицу ни разу не анализировали.
+    if estimate < threshold:
+        return queryset.count(), False
+    return estimate, True
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator с приблизительным количеством (см. queryset_estimated_count).
+    Подходит для ModelAdmin.paginator и ListView.paginator_class."""
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            return queryset_estimated_count(self.object_list)
+        return super().count
+
+
+class KeysetPaginationMixin:
+    """
+    Keyset-пагинация для ListView. В контекст попадают `page_obj` (KeysetPage),
+    `next_page_query` – строка запроса следующей страницы – и `result_count`
+    (одна оценка количества на весь ответ, см. queryset_estimated_count;
+    отключается через `count_results = False`). `result_count_is_estimate`
+    истинно, если вместо точного COUNT взята оценка планировщика.
+    """
+
+    paginate_by: int | None = 24
+    max_paginate_by = 60
+    keyset_ordering: tuple[str, ...] = ("-created", "-id")
+    count_results = True
+
+    def get_keyset_ordering(self) -> tuple[str, ...]:
+        return self.keyset_ordering
+
+    def get_paginate_by(self, queryset):
+        try:
+            per_page = int(self.request.GET.get("per_page", self.paginate_by))
+        except ValueError:
+            per_page = self.paginate_by
+        return max(1, min(per_page, self.max_paginate_by))
+
+    def get_result_count(self, queryset) -> tuple[int, bool]:
+        """Количество и признак того, что оно приблизительное."""
+        return queryset_count_or_estimate(queryset)
+
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            page = keyset_paginate(
+                queryset,
+                ordering=self.get_keyset_ordering(),
+                per_page=page_size,
+                cursor=self.request.GET.get("cursor"),
+            )
+        except ValueError as exc:
+            raise Http404("Невірне посилання на сторінку") from exc
+        return None, page, page.object_list, page.has_next()
+
+    def get_context_data(self, **kwargs):
+        queryset = kwargs.pop("object_list", self.object_list)
+        context = super().get_context_data(object_list=queryset, **kwargs)
+
+        page = context["page_obj"]
+        if page.has_next():
+            query = self.request.GET.copy()
+            query["cursor"] = page.next_cursor
+            context["next_page_query"] = query.urlencode()
+
+        if self.count_results:
+            (
+                context["result_count"],
+                context["result_count_is_estimate"],
+            ) = self.get_result_count(queryset)
+        return context
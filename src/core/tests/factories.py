@@ -1,5 +1,8 @@
 import factory
 from exchange.models import Category
+from orders.models import Order
+from projects.models import Project
+from services.models import Service
 from users.models import CustomUser
 
 from core.tests import faker
@@ -37,3 +40,37 @@ class CategoryFactory(factory.django.DjangoModelFactory):
         model = Category
 
     title = factory.LazyAttribute(lambda _: faker.words(nb=5)[70:])
+
+
+class ServiceFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Service
+
+    provider = factory.SubFactory(CustomUserFactory)
+    category = factory.SubFactory(CategoryFactory)
+    title = factory.LazyAttribute(lambda _: faker.sentence(nb_words=4)[:70])
+    description = factory.LazyAttribute(lambda _: " ".join(faker.sentences(nb=3)))
+    requirements = factory.LazyAttribute(lambda _: faker.sentence())
+    price = factory.LazyAttribute(lambda _: faker.random_int(min=100, max=10000))
+    term = factory.LazyAttribute(lambda _: faker.random_int(min=1, max=30))
+
+
+class ProjectFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Project
+
+    customer = factory.SubFactory(CustomUserFactory)
+    category = factory.SubFactory(CategoryFactory)
+    title = factory.LazyAttribute(lambda _: faker.sentence(nb_words=4)[:70])
+    description = factory.LazyAttribute(lambda _: " ".join(faker.sentences(nb=3)))
+    price = factory.LazyAttribute(lambda _: faker.random_int(min=100, max=10000))
+
+
+class OrderFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Order
+
+    customer = factory.SubFactory(CustomUserFactory)
+    service = factory.SubFactory(ServiceFactory)
+    provider = factory.LazyAttribute(lambda order: order.service.provider)
+    price = factory.LazyAttribute(lambda order: order.service.price)
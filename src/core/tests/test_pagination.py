@@ -0,0 +1,57 @@
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from services.models import Service
+
+from core.pagination import (
+    EstimatedCountPaginator,
+    queryset_count_or_estimate,
+    queryset_estimated_count,
+)
+from core.tests.factories import CustomUserFactory, ServiceFactory
+
+
+class EstimatedCountTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ServiceFactory.create_batch(5, price=100)
+        ServiceFactory.create_batch(3, price=900)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE services_service")
+
+    def test_exact_count_below_threshold(self):
+        queryset = Service.objects.filter(price=900)
+
+        self.assertEqual(queryset_estimated_count(queryset), 3)
+
+    def test_estimate_above_threshold(self):
+        # С нулевым порогом возвращается оценка без COUNT(*).
+        with self.assertNumQueries(1):
+            estimate = queryset_estimated_count(Service.objects.all(), threshold=0)
+        self.assertEqual(estimate, 8)
+
+        with self.assertNumQueries(1):
+            queryset_estimated_count(Service.objects.filter(price=100), threshold=0)
+
+    def test_estimate_flag(self):
+        queryset = Service.objects.filter(price=900)
+
+        self.assertEqual(queryset_count_or_estimate(queryset), (3, False))
+        self.assertEqual(
+            queryset_count_or_estimate(Service.objects.all(), threshold=0), (8, True)
+        )
+
+    def test_paginator(self):
+        paginator = EstimatedCountPaginator(Service.objects.order_by("id"), 3)
+
+        self.assertEqual(paginator.count, 8)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_admin_changelist(self):
+        admin = CustomUserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(admin)
+
+        response = self.client.get(reverse("admin:services_service_changelist"))
+
+        self.assertIsInstance(response.context["cl"].paginator, EstimatedCountPaginator)
+        self.assertEqual(response.context["cl"].result_count, 8)
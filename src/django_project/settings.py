@@ -53,6 +53,10 @@ CSRF_TRUSTED_ORIGINS = env.list(
     ],
 )
 
+# Absolute site address for links in emails sent outside of a request (Celery).
+SITE_URL = env.str("SITE_URL", "https://exchange.amgold.ru")
+DEFAULT_FROM_EMAIL = env.str("DEFAULT_FROM_EMAIL", "noreply@exchange.amgold.ru")
+
 if DEBUG:
     # Configure DJDT to show up in Docker
     DEBUG_TOOLBAR_CONFIG = {
@@ -70,6 +74,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
+    "django.forms",
     # Third-party apps
     "debug_toolbar",
     "allauth",
@@ -83,6 +89,7 @@ INSTALLED_APPS = [
     "services.apps.ServicesConfig",
     "projects.apps.ProjectsConfig",
     "orders.apps.OrdersConfig",
+    "search.apps.SearchConfig",
 ]
 
 MIDDLEWARE = [
@@ -114,39 +121,42 @@ TEMPLATES = [
                 "django.contrib.messages.context_processors.messages",
                 # Local
                 "exchange.context_processors.user_mode",
+                "orders.context_processors.order_counters",
             ],
         },
     },
 ]
 
+# Шаблоны виджетов форм ищутся в общих шаблонах проекта (templates/exchange/widgets/).
+FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
+
 WSGI_APPLICATION = "django_project.wsgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-# Database
-# Default: PostgreSQL via env. Optional: set DB_ENGINE=sqlite to use SQLite (e.g., on PythonAnywhere free tier).
-DB_ENGINE = env.str("DB_ENGINE", default="postgres")
-
-if DB_ENGINE.lower() == "sqlite":
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
-        }
-    }
-else:
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": env("DB_NAME"),
-            "USER": env("DB_USER"),
-            "PASSWORD": env("DB_PASSWORD"),
-            "HOST": env("DB_HOST"),
-            "PORT": env("DB_PORT"),
-        }
+# Нужен PostgreSQL: полнотекстовый поиск, pg_trgm, ArrayField и генерируемые
+# колонки на SQLite не работают.
+
+# Порог похожести pg_trgm для нечёткого поиска (оператор `%>`). Значение по
+# умолчанию в PostgreSQL (0.6) отсекает большинство опечаток в одно-два слова.
+SEARCH_TRIGRAM_WORD_SIMILARITY = env.float("SEARCH_TRIGRAM_WORD_SIMILARITY", 0.4)
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": env("DB_NAME"),
+        "USER": env("DB_USER"),
+        "PASSWORD": env("DB_PASSWORD"),
+        "HOST": env("DB_HOST"),
+        "PORT": env("DB_PORT"),
+        "OPTIONS": {
+            "options": "-c pg_trgm.word_similarity_threshold="
+            f"{SEARCH_TRIGRAM_WORD_SIMILARITY}",
+        },
     }
+}
 
 
 # Password validation
@@ -239,6 +249,28 @@ REDIS_DB = env.int("REDIS_DB", 0)
 
 # Celery
 CELERY_BROKER_URL = "redis://redis:6379"
+CELERY_BEAT_SCHEDULE = {
+    "service-sync-view-counts": {
+        "task": "services.tasks.service_sync_view_counts",
+        "schedule": env.int("SERVICE_VIEW_COUNT_SYNC_INTERVAL", 15 * 60),
+    },
+    "saved-search-send-notifications": {
+        "task": "search.tasks.saved_search_send_notifications_task",
+        "schedule": env.int("SAVED_SEARCH_NOTIFY_INTERVAL", 10 * 60),
+    },
+    "search-events-rollup": {
+        "task": "search.tasks.search_events_rollup_task",
+        "schedule": env.int("SEARCH_EVENTS_ROLLUP_INTERVAL", 60),
+    },
+    "category-counters-reconcile": {
+        "task": "exchange.tasks.category_counters_reconcile_task",
+        "schedule": env.int("CATEGORY_COUNTERS_RECONCILE_INTERVAL", 60 * 60),
+    },
+    "order-counters-reconcile": {
+        "task": "orders.tasks.order_counters_reconcile_task",
+        "schedule": env.int("ORDER_COUNTERS_RECONCILE_INTERVAL", 60 * 60),
+    },
+}
 
 
 # Logging
@@ -14,6 +14,7 @@ urlpatterns = (
         path("services/", include("services.urls")),
         path("projects/", include("projects.urls")),
         path("orders/", include("orders.urls")),
+        path("search/", include("search.urls")),
     ]
     + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
     + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,7 +1,9 @@
+from core.pagination import EstimatedCountPaginator
 from django.contrib import admin
-from django.utils import timezone
 
 from exchange.models import Category, Chat, Message, CategoryProposal
+from exchange.selectors import category_proposal_list_with_similar
+from exchange.services import category_proposals_approve, category_proposals_reject
 
 
 @admin.register(Category)
@@ -11,6 +13,7 @@ class CategoryAdmin(admin.ModelAdmin):
         "title",
         "parent",
     ]
+    list_select_related = ["parent"]
     ordering = [
         "id",
         "parent",
@@ -29,10 +32,16 @@ class ChatAdmin(admin.ModelAdmin):
         "-created",
     ]
 
+    def get_queryset(self, request):
+        # Темы чатов (GenericForeignKey) – одним запросом на тип темы.
+        return super().get_queryset(request).prefetch_related("topic")
+
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
     model = Message
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = [
         "id",
         "chat",
@@ -55,33 +64,31 @@ class CategoryProposalAdmin(admin.ModelAdmin):
         "parent",
         "user",
         "status",
+        "similar_count",
         "created",
     ]
     list_filter = ["status", "parent"]
     search_fields = ["title", "description"]
     actions = ["approve_proposals", "reject_proposals"]
 
-    @admin.action(description="Схвалити обрані та створити категорії")
+    def get_queryset(self, request):
+        return category_proposal_list_with_similar().select_related("parent", "user")
+
+    @admin.display(description="Схожі на модерації")
+    def similar_count(self, obj):
+        return len(obj.similar_ids)
+
+    @admin.action(description="Схвалити обрані разом зі схожими")
     def approve_proposals(self, request, queryset):
-        created_count = 0
-        updated = 0
-        for proposal in queryset:
-            # Create Category if not exists
-            Category.objects.get_or_create(title=proposal.title, parent=proposal.parent)
-            if proposal.status != CategoryProposal.Status.APPROVED:
-                proposal.status = CategoryProposal.Status.APPROVED
-                proposal.updated = timezone.now()
-                proposal.save(update_fields=["status", "updated"])
-                updated += 1
-                created_count += 1
-        self.message_user(request, f"Схвалено {updated} запропонованих категорій.")
+        approved, created = category_proposals_approve(
+            queryset.values_list("pk", flat=True)
+        )
+        self.message_user(
+            request,
+            f"Схвалено {approved} запропонованих категорій, створено {created} категорій.",
+        )
 
-    @admin.action(description="Відхилити обрані")
+    @admin.action(description="Відхилити обрані разом зі схожими")
     def reject_proposals(self, request, queryset):
-        count = 0
-        for proposal in queryset.exclude(status=CategoryProposal.Status.REJECTED):
-            proposal.status = CategoryProposal.Status.REJECTED
-            proposal.updated = timezone.now()
-            proposal.save(update_fields=["status", "updated"])
-            count += 1
+        count = category_proposals_reject(queryset.values_list("pk", flat=True))
         self.message_user(request, f"Відхилено {count} запропонованих категорій.")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from exchange.services import category_tree_rebuild
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает пути рубрик в дереве (нужно после loaddata)."
+
+    def handle(self, *args, **options):
+        total = category_tree_rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Оновлено рубрик: {total}"))
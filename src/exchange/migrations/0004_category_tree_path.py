@@ -0,0 +1,69 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:04
+
+from django.db import migrations, models
+
+
+def fill_category_tree(apps, schema_editor):
+    Category = apps.get_model("exchange", "Category")
+    categories = {category.pk: category for category in Category.objects.all()}
+    tree = {}
+
+    def build(pk):
+        if pk not in tree:
+            category = categories[pk]
+            if category.parent_id:
+                path, depth, breadcrumb = build(category.parent_id)
+                tree[pk] = (
+                    f"{path}{pk}/",
+                    depth + 1,
+                    f"{breadcrumb} / {category.title}",
+                )
+            else:
+                tree[pk] = (f"/{pk}/", 0, category.title)
+        return tree[pk]
+
+    for pk, category in categories.items():
+        category.path, category.depth, category.breadcrumb = build(pk)
+    Category.objects.bulk_update(
+        categories.values(), ["path", "depth", "breadcrumb"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="breadcrumb",
+            field=models.CharField(
+                default="", editable=False, max_length=1000, verbose_name="повна назва"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="depth",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="рівень вкладеності"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="path",
+            field=models.CharField(
+                default="", editable=False, max_length=255, verbose_name="шлях у дереві"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["path"],
+                name="category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+        migrations.RunPython(fill_category_tree, migrations.RunPython.noop),
+    ]
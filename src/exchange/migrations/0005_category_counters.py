@@ -0,0 +1,69 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:10
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_category_counters(apps, schema_editor):
+    Category = apps.get_model("exchange", "Category")
+
+    def actual_count(model):
+        return Coalesce(
+            Subquery(
+                model.objects.filter(category=OuterRef("pk"), is_active=True)
+                .order_by()
+                .values("category")
+                .annotate(total=Count("pk"))
+                .values("total")
+            ),
+            0,
+        )
+
+    Category.objects.update(
+        service_count=actual_count(apps.get_model("services", "Service")),
+        project_count=actual_count(apps.get_model("projects", "Project")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0004_category_tree_path"),
+        ("projects", "0006_created_id_index"),
+        ("services", "0009_range_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="project_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="кількість проєктів"
+            ),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="service_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="кількість послуг"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                condition=models.Q(("service_count__gt", 0)),
+                fields=["-service_count"],
+                name="category_service_count_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                condition=models.Q(("project_count__gt", 0)),
+                fields=["-project_count"],
+                name="category_project_count_idx",
+            ),
+        ),
+        migrations.RunPython(fill_category_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:17
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0005_category_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="categoryproposal",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="category_proposal_title_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from exchange.selectors import category_list_only_available
+from exchange.widgets import CategoryPickerWidget
+
+
+class CategoryPickerMixin:
+    """
+    Поле `category` формы создания или редактирования публикации: выбрать можно
+    только рубрику без подрубрик, выбор – поиском (CategoryPickerWidget).
+    Queryset поля используется только при проверке отправленной формы.
+    """
+
+    def get_form(self, form_class=None):
+        form = super().get_form(form_class)
+        field = form.fields["category"]
+        field.queryset = category_list_only_available()
+        field.widget = CategoryPickerWidget(attrs=field.widget.attrs)
+        field.widget.is_required = field.required
+        return form
@@ -1,11 +1,22 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Concat, Substr
 from users.models import CustomUser
 
 
 class Category(models.Model):
-    """Категорія послуги или проєкта."""
+    """
+    Категорія послуги или проєкта.
+
+    Дерево рубрик хранится ещё и как материализованный путь: `path` – id всех
+    предков и самой рубрики ("/1/5/12/"), `depth` – уровень вложенности,
+    `breadcrumb` – полный путь названий. Поля пересчитываются в save() для
+    рубрики и всех её потомков, поэтому предки, потомки и "хлебные крошки"
+    получаются одним запросом по индексу, без обхода `parent`.
+    """
 
     title = models.CharField(
         verbose_name="назва",
@@ -19,19 +30,139 @@ class Category(models.Model):
         blank=True,
         related_name="subcategories",
     )
+    path = models.CharField(
+        verbose_name="шлях у дереві",
+        max_length=255,
+        default="",
+        editable=False,
+    )
+    depth = models.PositiveSmallIntegerField(
+        verbose_name="рівень вкладеності",
+        default=0,
+        editable=False,
+    )
+    breadcrumb = models.CharField(
+        verbose_name="повна назва",
+        max_length=1000,
+        default="",
+        editable=False,
+    )
+    #
+    # Количество активных услуг и проектов, размещённых прямо в рубрике.
+    # Обновляются сигналами при сохранении и удалении услуг и проектов (см.
+    # exchange.signals), расхождения исправляет периодическая задача
+    # exchange.tasks.category_counters_reconcile_task.
+    #
+    service_count = models.PositiveIntegerField(
+        verbose_name="кількість послуг",
+        default=0,
+        editable=False,
+    )
+    project_count = models.PositiveIntegerField(
+        verbose_name="кількість проєктів",
+        default=0,
+        editable=False,
+    )
 
     class Meta:
         ordering = ["title"]
         verbose_name = "категорія"
         verbose_name_plural = "категорії"
+        indexes = [
+            # Поиск потомков – `path LIKE '/1/5/%'`.
+            models.Index(
+                fields=["path"],
+                name="category_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            # Боковые панели каталогов: только непустые рубрики, по убыванию.
+            models.Index(
+                fields=["-service_count"],
+                name="category_service_count_idx",
+                condition=models.Q(service_count__gt=0),
+            ),
+            models.Index(
+                fields=["-project_count"],
+                name="category_project_count_idx",
+                condition=models.Q(project_count__gt=0),
+            ),
+        ]
 
     def __str__(self):
-        title = self.title
-        parent = self.parent
-        while parent:
-            title = f"{parent.title} / {title}"
-            parent = parent.parent
-        return title
+        return self.breadcrumb or self.title
+
+    def clean(self):
+        if self.pk and self.parent and f"/{self.pk}/" in self.parent.path:
+            raise ValidationError(
+                {"parent": "Категорія не може бути вкладена сама в себе."}
+            )
+
+    def save(self, *args, **kwargs):
+        old = None
+        if self.pk:
+            old = (
+                Category.objects.filter(pk=self.pk)
+                .values("path", "depth", "breadcrumb")
+                .first()
+            )
+        parent = None
+        if self.parent_id:
+            parent = Category.objects.values("path", "depth", "breadcrumb").get(
+                pk=self.parent_id
+            )
+        # clean() вызывают только формы, поэтому цикл проверяем и здесь.
+        if old and old["path"] and parent and parent["path"].startswith(old["path"]):
+            raise ValidationError(
+                {"parent": "Категорія не може бути вкладена сама в себе."}
+            )
+        super().save(*args, **kwargs)
+        self._update_tree(old, parent)
+
+    def _update_tree(self, old: dict | None, parent: dict | None) -> None:
+        """Пересчитывает путь рубрики и одним UPDATE переносит её поддерево."""
+        tree: dict
+        if parent:
+            tree = {
+                "path": f"{parent['path']}{self.pk}/",
+                "depth": parent["depth"] + 1,
+                "breadcrumb": f"{parent['breadcrumb']} / {self.title}",
+            }
+        else:
+            tree = {"path": f"/{self.pk}/", "depth": 0, "breadcrumb": self.title}
+        self.path = tree["path"]
+        self.depth = tree["depth"]
+        self.breadcrumb = tree["breadcrumb"]
+        if old == tree:
+            return
+
+        Category.objects.filter(pk=self.pk).update(**tree)
+        if old and old["path"]:
+            descendants = Category.objects.filter(path__startswith=old["path"])
+            descendants.exclude(pk=self.pk).update(
+                path=Concat(
+                    models.Value(tree["path"]), Substr("path", len(old["path"]) + 1)
+                ),
+                depth=models.F("depth") + tree["depth"] - old["depth"],
+                breadcrumb=Concat(
+                    models.Value(tree["breadcrumb"]),
+                    Substr("breadcrumb", len(old["breadcrumb"]) + 1),
+                ),
+            )
+
+    @property
+    def ancestor_ids(self) -> list[int]:
+        return [int(pk) for pk in self.path.strip("/").split("/")[:-1]]
+
+    def get_ancestors(self) -> models.QuerySet:
+        """Предки от корня к рубрике – один запрос по первичному ключу."""
+        return Category.objects.filter(pk__in=self.ancestor_ids).order_by("depth")
+
+    def get_descendants(self, include_self: bool = False) -> models.QuerySet:
+        """Всё поддерево рубрики – один запрос по индексу `path`."""
+        queryset = Category.objects.filter(path__startswith=self.path)
+        if not include_self:
+            queryset = queryset.exclude(pk=self.pk)
+        return queryset
 
 
 class CategoryProposal(models.Model):
@@ -56,6 +187,14 @@ class CategoryProposal(models.Model):
         ordering = ["-created"]
         verbose_name = "запропонована категорія"
         verbose_name_plural = "запропоновані категорії"
+        indexes = [
+            # Поиск похожих предложений (оператор pg_trgm `%`).
+            GinIndex(
+                fields=["title"],
+                name="category_proposal_title_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.get_status_display()})"
@@ -1,52 +1,136 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Count, Q, QuerySet
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import OuterRef, Q, QuerySet
+from django.db.models.functions import Coalesce
 from orders.models import Order
 
-from exchange.models import Category, Chat, Message
+from exchange.models import Category, CategoryProposal, Chat, Message
+from exchange.tree import CategoryNode, category_tree
 
 
 def category_list() -> QuerySet:
+    """Рубрики с двумя уровнями подкатегорий. Полное название рубрики хранится в
+    `breadcrumb`, поэтому предков подгружать не нужно."""
     return Category.objects.prefetch_related(
-        "parent", "parent__parent", "subcategories", "subcategories__subcategories"
+        "subcategories", "subcategories__subcategories"
     ).all()
 
 
+def category_list_tree() -> tuple[CategoryNode, ...]:
+    """Корневые рубрики дерева в памяти, с детьми (`children`)."""
+    return category_tree().roots
+
+
 def category_list_only_available() -> QuerySet:
     """Возвращает только категории, доступные для назначения услугам и проектам –
     то есть не имеющие подкатегорий."""
-    return category_list().filter(subcategories=None).all()
+    leaf_ids = [node.pk for node in category_tree().leaves()]
+    return Category.objects.filter(pk__in=leaf_ids)
+
+
+def category_search_available(query: str, limit: int = 20) -> list[CategoryNode]:
+    """Рубрики из category_list_only_available(), в полном названии которых есть
+    все слова запроса, – поиск по индексу дерева в памяти, без запроса к БД."""
+    return category_tree().search_leaves(query, limit)
 
 
 def category_list_only_with_services() -> QuerySet:
-    """Возвращает категории, в которых есть услуги, с количеством услуг."""
-    return (
-        category_list()
-        .annotate(service_count=Count("services"))
-        .filter(service_count__gt=0)
-        .order_by("-service_count")
-        .all()
-    )
+    """Возвращает категории, в которых есть активные услуги, с количеством услуг
+    (хранимый счётчик, частичный индекс)."""
+    return Category.objects.filter(service_count__gt=0).order_by("-service_count")
 
 
 def category_list_only_with_projects() -> QuerySet:
-    """Возвращает категории, в которых есть активные проекты, с количеством таких проектов."""
-    return (
-        category_list()
-        .annotate(project_count=Count("projects", filter=Q(projects__is_active=True)))
-        .filter(project_count__gt=0)
-        .order_by("-project_count")
-        .all()
-    )
+    """Возвращает категории, в которых есть активные проекты, с количеством таких
+    проектов (хранимый счётчик, частичный индекс)."""
+    return Category.objects.filter(project_count__gt=0).order_by("-project_count")
+
+
+def category_subtree_ids(category_id: int) -> list[int]:
+    """
+    id рубрики и всех её потомков (из дерева в памяти), так что товары рубрики
+    любого уровня находятся одним условием `category_id IN (...)`.
+    """
+    node = category_tree().get(category_id)
+    return list(node.subtree_ids) if node else []
+
+
+def category_path_ids(category_ids) -> set[int]:
+    """id указанных рубрик и всех их предков."""
+    tree = category_tree()
+    return {
+        pk
+        for category_id in category_ids
+        if (node := tree.get(category_id))
+        for pk in node.path_ids
+    }
 
 
 def category_get_by_id(category_id: int) -> Category | None:
-    return (
-        Category.objects.filter(id=category_id)
-        .prefetch_related("parent")
-        .prefetch_related("parent__parent")
-        .first()
+    node = category_tree().get(category_id)
+    return node.as_category() if node else None
+
+
+# Минимальная триграммная похожесть названий предложений в одном кластере:
+# "Ремонт авто" и "ремонт автомобілів" – 0.55, "Ремонт авто" и "Ремонт квартир" – 0.35.
+CATEGORY_PROPOSAL_SIMILARITY = 0.5
+
+
+def category_proposal_list_with_similar() -> QuerySet:
+    """
+    Предложения рубрик с `similar_ids` – id похожих предложений на модерации с тем
+    же родителем. Похожие находит оператор `%` по триграммному индексу, порог
+    уточняется по similarity().
+    """
+    similar = (
+        CategoryProposal.objects.filter(
+            status=CategoryProposal.Status.PENDING,
+            title__trigram_similar=OuterRef("title"),
+        )
+        .annotate(parent_key=Coalesce("parent_id", 0))
+        .filter(parent_key=Coalesce(OuterRef("parent_id"), 0))
+        .annotate(similarity=TrigramSimilarity("title", OuterRef("title")))
+        .filter(similarity__gte=CATEGORY_PROPOSAL_SIMILARITY)
+        .exclude(pk=OuterRef("pk"))
+        .order_by("pk")
+        .values("pk")
+    )
+    return CategoryProposal.objects.annotate(similar_ids=ArraySubquery(similar))
+
+
+def category_proposal_clusters(proposal_ids) -> list[list[CategoryProposal]]:
+    """
+    Кластеры для модерации: указанные предложения вместе со всеми похожими
+    (похожесть транзитивна) – два запроса на всю очередь. Предложения в кластере
+    упорядочены по дате, первое – самое раннее.
+    """
+    proposal_ids = {int(pk) for pk in proposal_ids}
+    edges = category_proposal_list_with_similar().filter(
+        Q(pk__in=proposal_ids) | Q(status=CategoryProposal.Status.PENDING)
     )
 
+    roots: dict[int, int] = {}
+
+    def find(pk: int) -> int:
+        while roots.setdefault(pk, pk) != pk:
+            roots[pk] = roots[roots[pk]]
+            pk = roots[pk]
+        return pk
+
+    for pk, similar_ids in edges.values_list("pk", "similar_ids"):
+        for similar_id in similar_ids:
+            roots[find(similar_id)] = find(pk)
+
+    selected_roots = {find(pk) for pk in proposal_ids}
+    clusters: dict[int, list[CategoryProposal]] = {}
+    proposals = CategoryProposal.objects.filter(
+        pk__in=[pk for pk in roots if find(pk) in selected_roots]
+    ).order_by("created", "pk")
+    for proposal in proposals:
+        clusters.setdefault(find(proposal.pk), []).append(proposal)
+    return list(clusters.values())
+
 
 def message_list_for_topic(topic: Order) -> QuerySet:
     """Выбирает все сообщения из чата, связанноого с указанной "темой"."""
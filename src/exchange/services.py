@@ -1,8 +1,17 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 from orders.models import Order
+from projects.models import Project
+from search.services import autocomplete_index_category
+from services.models import Service
 from users.models import CustomUser
 
-from exchange.models import Chat, Message
+from exchange.models import Category, CategoryProposal, Chat, Message
+from exchange.selectors import category_proposal_clusters
+from exchange.tree import category_tree_changed
 
 
 def chat_get_or_create(sender: CustomUser, recipient: CustomUser, topic: Order) -> Chat:
@@ -46,3 +55,185 @@ def message_create(
     )
     message.save()
     return message
+
+
+def category_tree_rebuild() -> int:
+    """
+    Пересчитывает path, depth и breadcrumb всех рубрик. Нужен после loaddata
+    и других массовых загрузок, которые сохраняют рубрики в обход
+    Category.save(). Возвращает количество исправленных рубрик.
+    """
+    categories = {category.pk: category for category in Category.objects.all()}
+    tree = {}
+
+    def build(pk: int) -> tuple[str, int, str]:
+        if pk not in tree:
+            category = categories[pk]
+            if category.parent_id:
+                path, depth, breadcrumb = build(category.parent_id)
+                tree[pk] = (
+                    f"{path}{pk}/",
+                    depth + 1,
+                    f"{breadcrumb} / {category.title}",
+                )
+            else:
+                tree[pk] = (f"/{pk}/", 0, category.title)
+        return tree[pk]
+
+    changed = []
+    for pk, category in categories.items():
+        values = build(pk)
+        if values != (category.path, category.depth, category.breadcrumb):
+            category.path, category.depth, category.breadcrumb = values
+            changed.append(category)
+
+    Category.objects.bulk_update(
+        changed, ["path", "depth", "breadcrumb"], batch_size=500
+    )
+    category_tree_version_bump()
+    return len(changed)
+
+
+def category_tree_version_bump() -> None:
+    """
+    Сбрасывает дерево рубрик в памяти всех воркеров (см. exchange.tree). Версия
+    увеличивается после коммита; до него изменения видит только текущая
+    транзакция, а после отката дерево остаётся прежним.
+    """
+    category_tree_changed()
+
+
+def category_counter_move(field: str, old_category_id, new_category_id) -> None:
+    """
+    Переносит единицу счётчика `field` (service_count или project_count) из
+    рубрики `old_category_id` в `new_category_id` одним UPDATE. None означает,
+    что публикация там не учитывается: новая, неактивная или удалённая.
+    """
+    if old_category_id == new_category_id:
+        return
+
+    deltas = {
+        category_id: delta
+        for category_id, delta in ((old_category_id, -1), (new_category_id, 1))
+        if category_id
+    }
+    Category.objects.filter(pk__in=deltas).update(
+        **{
+            field: Greatest(
+                F(field)
+                + Case(
+                    *(When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()),
+                    default=Value(0),
+                ),
+                Value(0),
+            )
+        }
+    )
+
+
+def _category_actual_count(model) -> Coalesce:
+    return Coalesce(
+        Subquery(
+            model.objects.filter(category=OuterRef("pk"), is_active=True)
+            .order_by()
+            .values("category")
+            .annotate(total=Count("pk"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def category_counters_reconcile() -> int:
+    """
+    Пересчитывает service_count и project_count рубрик, которые разошлись с
+    фактическим количеством активных публикаций (массовые update() и delete()
+    в обход сигналов, сбои между сохранением и обновлением счётчика).
+    Возвращает количество исправленных рубрик.
+    """
+    drifted = list(
+        Category.objects.annotate(
+            actual_services=_category_actual_count(Service),
+            actual_projects=_category_actual_count(Project),
+        )
+        .filter(
+            ~Q(service_count=F("actual_services"))
+            | ~Q(project_count=F("actual_projects"))
+        )
+        .values_list("pk", flat=True)
+    )
+    if drifted:
+        Category.objects.filter(pk__in=drifted).update(
+            service_count=_category_actual_count(Service),
+            project_count=_category_actual_count(Project),
+        )
+    return len(drifted)
+
+
+def category_proposals_approve(proposal_ids) -> tuple[int, int]:
+    """
+    Одобряет предложения вместе с похожими (category_proposal_clusters): на
+    кластер создаётся одна рубрика с названием самого раннего предложения, если
+    такой ещё нет у того же родителя. Рубрики создаются одним bulk_create,
+    статусы обновляются одним UPDATE. Возвращает (одобрено, создано рубрик).
+    """
+    clusters = category_proposal_clusters(proposal_ids)
+    parent_ids = {cluster[0].parent_id for cluster in clusters}
+    parents = Category.objects.in_bulk([pk for pk in parent_ids if pk])
+
+    siblings = Category.objects.filter(parent_id__in=parents)
+    if None in parent_ids:
+        siblings |= Category.objects.filter(parent__isnull=True)
+    existing = {
+        (parent_id, title.casefold())
+        for parent_id, title in siblings.values_list("parent_id", "title")
+    }
+
+    new_categories = {}
+    for cluster in clusters:
+        first = cluster[0]
+        key = (first.parent_id, first.title.casefold())
+        if key not in existing and key not in new_categories:
+            new_categories[key] = Category(title=first.title, parent_id=first.parent_id)
+
+    with transaction.atomic():
+        created = Category.objects.bulk_create(new_categories.values())
+        # bulk_create не вызывает Category.save() – путь в дереве заполняем сами.
+        for category in created:
+            parent = parents.get(category.parent_id)
+            if parent:
+                category.path = f"{parent.path}{category.pk}/"
+                category.depth = parent.depth + 1
+                category.breadcrumb = f"{parent.breadcrumb} / {category.title}"
+            else:
+                category.path = f"/{category.pk}/"
+                category.depth = 0
+                category.breadcrumb = category.title
+        Category.objects.bulk_update(created, ["path", "depth", "breadcrumb"])
+
+        approved = (
+            CategoryProposal.objects.filter(
+                pk__in=[proposal.pk for cluster in clusters for proposal in cluster]
+            )
+            .exclude(status=CategoryProposal.Status.APPROVED)
+            .update(status=CategoryProposal.Status.APPROVED, updated=timezone.now())
+        )
+        if created:
+            category_tree_version_bump()
+
+    for category in created:
+        autocomplete_index_category(category)
+    return approved, len(created)
+
+
+def category_proposals_reject(proposal_ids) -> int:
+    """Отклоняет предложения вместе с похожими одним UPDATE. Возвращает
+    количество отклонённых."""
+    clusters = category_proposal_clusters(proposal_ids)
+    return (
+        CategoryProposal.objects.filter(
+            pk__in=[proposal.pk for cluster in clusters for proposal in cluster]
+        )
+        .exclude(status=CategoryProposal.Status.REJECTED)
+        .update(status=CategoryProposal.Status.REJECTED, updated=timezone.now())
+    )
@@ -0,0 +1,61 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from projects.models import Project
+from services.models import Service
+
+from exchange.models import Category
+from exchange.services import category_counter_move, category_tree_version_bump
+
+CATEGORY_COUNTER_FIELDS = {Service: "service_count", Project: "project_count"}
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_tree_changed(sender, **kwargs):
+    category_tree_version_bump()
+
+
+#
+# Перед сохранением публикации одним запросом запоминаем её прежние рубрику и
+# активность: по ним переносятся счётчики рубрик (ниже) и сбрасывается кэш
+# выдачи прежней рубрики (search.signals).
+#
+@receiver(pre_save, sender=Service)
+@receiver(pre_save, sender=Project)
+def publication_remember_saved(sender, instance, **kwargs):
+    saved = None
+    if instance.pk:
+        saved = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("category_id", "is_active")
+            .first()
+        )
+    instance._saved_category_id, instance._saved_is_active = saved or (None, False)
+
+
+#
+# Счётчики публикаций в рубриках: счётчик переносится из рубрики, где
+# публикация учитывалась (если была активна), в текущую.
+#
+@receiver(post_save, sender=Service)
+@receiver(post_save, sender=Project)
+def category_counter_saved(sender, instance, **kwargs):
+    category_counter_move(
+        CATEGORY_COUNTER_FIELDS[sender],
+        (
+            getattr(instance, "_saved_category_id", None)
+            if getattr(instance, "_saved_is_active", False)
+            else None
+        ),
+        instance.category_id if instance.is_active else None,
+    )
+
+
+@receiver(post_delete, sender=Service)
+@receiver(post_delete, sender=Project)
+def category_counter_deleted(sender, instance, **kwargs):
+    category_counter_move(
+        CATEGORY_COUNTER_FIELDS[sender],
+        instance.category_id if instance.is_active else None,
+        None,
+    )
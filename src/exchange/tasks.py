@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from exchange.services import category_counters_reconcile
+
+
+@shared_task
+def category_counters_reconcile_task() -> int:
+    return category_counters_reconcile()
@@ -0,0 +1,59 @@
+from io import StringIO
+
+from core.tests.factories import CategoryFactory
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+
+from exchange.models import Category
+
+
+class CategoryTreeTest(TestCase):
+    def setUp(self):
+        self.root = CategoryFactory(title="Розробка")
+        self.site = CategoryFactory(title="Сайти", parent=self.root)
+        self.leaf = CategoryFactory(title="Лендінги", parent=self.site)
+
+    def test_path_and_breadcrumb(self):
+        leaf = Category.objects.get(pk=self.leaf.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(str(leaf), "Розробка / Сайти / Лендінги")
+        self.assertEqual(leaf.depth, 2)
+        self.assertEqual(leaf.path, f"/{self.root.pk}/{self.site.pk}/{self.leaf.pk}/")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(leaf.get_ancestors()), [self.root, self.site])
+        with self.assertNumQueries(1):
+            self.assertEqual(set(self.root.get_descendants()), {self.site, self.leaf})
+
+    def test_move_and_rename_update_subtree(self):
+        design = CategoryFactory(title="Дизайн")
+
+        self.site.parent = design
+        self.site.title = "Веб-дизайн"
+        self.site.save()
+
+        leaf = Category.objects.get(pk=self.leaf.pk)
+        self.assertEqual(leaf.breadcrumb, "Дизайн / Веб-дизайн / Лендінги")
+        self.assertEqual(leaf.path, f"/{design.pk}/{self.site.pk}/{self.leaf.pk}/")
+        self.assertEqual(list(self.root.get_descendants()), [])
+
+    def test_move_into_own_subtree_rejected(self):
+        self.root.parent = self.leaf
+        with self.assertRaises(ValidationError):
+            self.root.save()
+
+        root = Category.objects.get(pk=self.root.pk)
+        self.assertIsNone(root.parent_id)
+        self.assertEqual(root.path, f"/{self.root.pk}/")
+
+    def test_rebuild(self):
+        # loaddata сохраняет рубрики в обход save().
+        Category.objects.update(path="", depth=0, breadcrumb="")
+
+        call_command("category_tree_rebuild", stdout=StringIO())
+
+        leaf = Category.objects.get(pk=self.leaf.pk)
+        self.assertEqual(leaf.breadcrumb, "Розробка / Сайти / Лендінги")
+        self.assertEqual(leaf.depth, 2)
@@ -0,0 +1,85 @@
+from core.tests.factories import CategoryFactory, ServiceFactory
+from django.db import DatabaseError, transaction
+from django.test import TestCase, TransactionTestCase
+
+from exchange.models import Category
+from exchange.selectors import (
+    category_get_by_id,
+    category_path_ids,
+    category_search_available,
+    category_subtree_ids,
+)
+from exchange.services import category_tree_version_bump
+from exchange.tree import category_tree
+
+
+class CategoryTreeCacheTest(TestCase):
+    def setUp(self):
+        self.root = CategoryFactory(title="Розробка")
+        self.leaf = CategoryFactory(title="Сайти", parent=self.root)
+
+    def test_steady_state_without_queries(self):
+        category_tree()
+
+        with self.assertNumQueries(0):
+            category = category_get_by_id(self.leaf.pk)
+            self.assertEqual(str(category), "Розробка / Сайти")
+            self.assertEqual(category, self.leaf)
+            self.assertEqual(
+                category_subtree_ids(self.root.pk), [self.root.pk, self.leaf.pk]
+            )
+            self.assertEqual(
+                [node.pk for node in category_search_available("розр сай")],
+                [self.leaf.pk],
+            )
+            self.assertIsNone(category_get_by_id("broken"))
+
+    def test_change_invalidates_tree(self):
+        category_tree()
+
+        bots = CategoryFactory(title="Боти", parent=self.root)
+
+        self.assertEqual(
+            category_subtree_ids(self.root.pk), [self.root.pk, bots.pk, self.leaf.pk]
+        )
+        self.assertEqual(
+            [node.pk for node in category_search_available("розробка")],
+            [bots.pk, self.leaf.pk],
+        )
+
+    def test_path_ids_without_stored_path(self):
+        # Так рубрики выглядят после loaddata до category_tree_rebuild.
+        Category.objects.update(path="", depth=0, breadcrumb="")
+        category_tree_version_bump()
+
+        self.assertEqual(
+            category_path_ids([self.leaf.pk]), {self.root.pk, self.leaf.pk}
+        )
+        ServiceFactory(category=self.leaf)
+
+
+class CategoryTreeTransactionTest(TransactionTestCase):
+    def setUp(self):
+        self.root = CategoryFactory(title="Розробка")
+        category_tree()
+
+    def test_rolled_back_category_not_cached(self):
+        with self.assertRaises(DatabaseError):
+            with transaction.atomic():
+                leaf = CategoryFactory(title="Сайти", parent=self.root)
+                # Транзакция видит свои изменения.
+                self.assertEqual(
+                    category_subtree_ids(self.root.pk), [self.root.pk, leaf.pk]
+                )
+                raise DatabaseError
+
+        self.assertIsNone(category_get_by_id(leaf.pk))
+        self.assertEqual(category_subtree_ids(self.root.pk), [self.root.pk])
+
+    def test_committed_category_cached(self):
+        with transaction.atomic():
+            leaf = CategoryFactory(title="Сайти", parent=self.root)
+
+        self.assertEqual(category_subtree_ids(self.root.pk), [self.root.pk, leaf.pk])
+        with self.assertNumQueries(0):
+            category_get_by_id(leaf.pk)
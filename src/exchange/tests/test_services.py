@@ -0,0 +1,121 @@
+from core.tests.factories import CategoryFactory, ProjectFactory, ServiceFactory
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from services.models import Service
+
+from exchange.models import Category, CategoryProposal
+from exchange.selectors import category_list_only_with_services
+from exchange.services import (
+    category_counters_reconcile,
+    category_proposals_approve,
+    category_proposals_reject,
+)
+
+
+class CategoryCountersTest(TestCase):
+    def setUp(self):
+        self.design = CategoryFactory(title="Дизайн")
+        self.sites = CategoryFactory(title="Сайти")
+
+    def counts(self, category):
+        category.refresh_from_db()
+        return category.service_count, category.project_count
+
+    def test_counters_follow_changes(self):
+        service = ServiceFactory(category=self.design)
+        ServiceFactory(category=self.design)
+        ProjectFactory(category=self.design)
+        self.assertEqual(self.counts(self.design), (2, 1))
+
+        service.category = self.sites
+        service.save()
+        self.assertEqual(self.counts(self.design), (1, 1))
+        self.assertEqual(self.counts(self.sites), (1, 0))
+
+        service.is_active = False
+        service.save()
+        self.assertEqual(self.counts(self.sites), (0, 0))
+
+        service.is_active = True
+        service.save()
+        service.delete()
+        self.assertEqual(self.counts(self.sites), (0, 0))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(category_list_only_with_services()), [self.design])
+
+    def test_saved_state_read_once(self):
+        service = ServiceFactory(category=self.design)
+        service.category = self.sites
+
+        with CaptureQueriesContext(connection) as queries:
+            service.save()
+
+        # Прежние рубрика и активность читаются одним запросом для счётчиков
+        # рубрик и для кэша каталога.
+        reads = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "services_service"."category_id"')
+        ]
+        self.assertEqual(len(reads), 1)
+        self.assertEqual(self.counts(self.sites), (1, 0))
+
+    def test_reconcile(self):
+        ServiceFactory(category=self.design)
+        # Массовое обновление проходит мимо сигналов.
+        Service.objects.update(category=self.sites)
+        Category.objects.filter(pk=self.sites.pk).update(project_count=5)
+
+        self.assertEqual(category_counters_reconcile(), 2)
+        self.assertEqual(self.counts(self.design), (0, 0))
+        self.assertEqual(self.counts(self.sites), (1, 0))
+        self.assertEqual(category_counters_reconcile(), 0)
+
+
+class CategoryProposalModerationTest(TestCase):
+    def setUp(self):
+        self.auto = CategoryFactory(title="Авто")
+        self.first = CategoryProposal.objects.create(
+            title="Ремонт авто", parent=self.auto
+        )
+        self.second = CategoryProposal.objects.create(
+            title="ремонт автомобілів", parent=self.auto
+        )
+        self.other_parent = CategoryProposal.objects.create(title="Ремонт авто")
+        self.unrelated = CategoryProposal.objects.create(
+            title="Ремонт квартир", parent=self.auto
+        )
+
+    def statuses(self):
+        return dict(CategoryProposal.objects.values_list("pk", "status"))
+
+    def test_approve_cluster(self):
+        self.assertEqual(category_proposals_approve([self.second.pk]), (2, 1))
+
+        category = Category.objects.get(parent=self.auto)
+        self.assertEqual(category.title, "Ремонт авто")
+        self.assertEqual(category.path, f"{self.auto.path}{category.pk}/")
+        self.assertEqual(category.breadcrumb, "Авто / Ремонт авто")
+
+        statuses = self.statuses()
+        self.assertEqual(statuses[self.first.pk], CategoryProposal.Status.APPROVED)
+        self.assertEqual(statuses[self.second.pk], CategoryProposal.Status.APPROVED)
+        self.assertEqual(
+            statuses[self.other_parent.pk], CategoryProposal.Status.PENDING
+        )
+        self.assertEqual(statuses[self.unrelated.pk], CategoryProposal.Status.PENDING)
+
+        # Рубрика уже есть – повторно не создаётся.
+        proposal = CategoryProposal.objects.create(
+            title="ремонт авто", parent=self.auto
+        )
+        self.assertEqual(category_proposals_approve([proposal.pk]), (1, 0))
+
+    def test_reject_cluster(self):
+        self.assertEqual(category_proposals_reject([self.first.pk]), 2)
+        self.assertEqual(
+            self.statuses()[self.second.pk], CategoryProposal.Status.REJECTED
+        )
+        self.assertFalse(Category.objects.filter(parent=self.auto).exists())
@@ -1,7 +1,12 @@
 from http import HTTPStatus
 
-from core.tests.factories import CategoryFactory
+from core.tests.factories import CategoryFactory, CustomUserFactory
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from exchange.tree import category_tree
 
 
 class CustomUserPublicProfileViewTest(TestCase):
@@ -20,3 +25,32 @@ class CustomUserPublicProfileViewTest(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         for category in self.categories:
             self.assertContains(response, category.title)
+
+
+class CategoryPickerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root = CategoryFactory(title="Розробка")
+        cls.leaf = CategoryFactory(title="Сайти", parent=cls.root)
+        cls.user = CustomUserFactory()
+
+    def test_search_endpoint(self):
+        response = self.client.get(reverse("exchange:category_search"), {"q": "сай"})
+
+        self.assertEqual(
+            response.json(),
+            {"results": [{"id": self.leaf.pk, "label": "Розробка / Сайти"}]},
+        )
+
+    def test_create_form_renders_picker(self):
+        self.client.force_login(self.user)
+        category_tree()
+
+        # Рендер формы не перебирает рубрики.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("services:create"))
+        self.assertFalse(
+            [q for q in queries if "exchange_category" in q["sql"]], queries
+        )
+        self.assertContains(response, "data-category-picker")
+        self.assertContains(response, "js/category_picker.")
@@ -0,0 +1,210 @@
+"""
+Дерево рубрик в памяти процесса.
+
+Рубрики меняются редко, а нужны почти на каждой странице, поэтому каждый
+воркер держит неизменяемую копию дерева: связи с родителем и детьми, признак
+листа, полное название и id поддерева уже посчитаны. Актуальность проверяется
+по версии в Redis (CATEGORY_TREE_VERSION_KEY), её увеличивает
+exchange.services.category_tree_version_bump после коммита изменений рубрик,
+после чего каждый воркер перечитывает дерево одним запросом.
+
+До коммита изменённое дерево видит только сама транзакция (category_tree_changed):
+оно читается отдельно и в общий кэш не попадает, так что после отката воркер
+не останется с несуществующими рубриками.
+"""
+
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from django.db import transaction
+from django_project.rds import redis
+
+from exchange.models import Category
+
+CATEGORY_TREE_VERSION_KEY = "category_tree:version"
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    pk: int
+    title: str
+    parent_id: int | None
+    path: str
+    depth: int
+    breadcrumb: str
+    children: tuple["CategoryNode", ...]
+    subtree_ids: tuple[int, ...]
+    # id предков от корня и самой рубрики – по связям с родителем, а не по
+    # `path`, который после loaddata может быть ещё не заполнен.
+    path_ids: tuple[int, ...]
+
+    def __str__(self):
+        return self.breadcrumb
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    def as_category(self) -> Category:
+        """Экземпляр модели без запроса к БД (новый на каждый вызов)."""
+        category = Category(
+            pk=self.pk,
+            title=self.title,
+            parent_id=self.parent_id,
+            path=self.path,
+            depth=self.depth,
+            breadcrumb=self.breadcrumb,
+        )
+        category._state.adding = False
+        category._state.db = "default"
+        return category
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    nodes: MappingProxyType
+    roots: tuple[CategoryNode, ...]
+    # Листья (рубрики, доступные для публикаций) по полному названию, вместе с
+    # названием в нижнем регистре для поиска.
+    leaf_index: tuple[tuple[str, CategoryNode], ...]
+
+    @classmethod
+    def build(cls, rows) -> "CategoryTree":
+        """Дерево из строк (pk, title, parent_id, path, depth, breadcrumb),
+        отсортированных по названию."""
+        children: dict[int | None, list[tuple]] = {}
+        for row in rows:
+            children.setdefault(row[2], []).append(row)
+
+        nodes: dict[int, CategoryNode] = {}
+
+        def build_node(row: tuple, parent_path_ids: tuple[int, ...]) -> CategoryNode:
+            pk, title, parent_id, path, depth, breadcrumb = row
+            path_ids = (*parent_path_ids, pk)
+            child_nodes = tuple(
+                build_node(child, path_ids) for child in children.get(pk, [])
+            )
+            node = CategoryNode(
+                pk=pk,
+                title=title,
+                parent_id=parent_id,
+                path=path,
+                depth=depth,
+                breadcrumb=breadcrumb,
+                children=child_nodes,
+                subtree_ids=(
+                    pk,
+                    *(pk for child in child_nodes for pk in child.subtree_ids),
+                ),
+                path_ids=path_ids,
+            )
+            nodes[node.pk] = node
+            return node
+
+        roots = tuple(build_node(row, ()) for row in children.get(None, []))
+        leaf_index = tuple(
+            sorted(
+                (
+                    (node.breadcrumb.casefold(), node)
+                    for node in nodes.values()
+                    if node.is_leaf
+                ),
+                key=lambda item: (item[0], item[1].pk),
+            )
+        )
+        return cls(nodes=MappingProxyType(nodes), roots=roots, leaf_index=leaf_index)
+
+    def get(self, pk) -> CategoryNode | None:
+        try:
+            return self.nodes.get(int(pk))
+        except (TypeError, ValueError):
+            return None
+
+    def leaves(self) -> list[CategoryNode]:
+        return [node for _, node in self.leaf_index]
+
+    def search_leaves(self, query: str, limit: int) -> list[CategoryNode]:
+        """Листья, в полном названии которых есть все слова запроса."""
+        words = query.casefold().split()
+        found = []
+        for label, node in self.leaf_index:
+            if all(word in label for word in words):
+                found.append(node)
+                if len(found) >= limit:
+                    break
+        return found
+
+
+_cached_tree: tuple[bytes, CategoryTree] | None = None
+# on_commit-колбэки транзакций, изменивших рубрики, и дерево с их изменениями.
+_uncommitted_hooks: list = []
+_uncommitted_tree: CategoryTree | None = None
+
+
+def category_tree_version() -> bytes:
+    version = redis.get(CATEGORY_TREE_VERSION_KEY)
+    if version is None:
+        # Случайное начальное значение: после очистки Redis версия не совпадёт
+        # со старой, закэшированной в воркерах.
+        redis.set(CATEGORY_TREE_VERSION_KEY, time.time_ns(), nx=True)
+        version = redis.get(CATEGORY_TREE_VERSION_KEY)
+    return version
+
+
+def _category_tree_load() -> CategoryTree:
+    rows = Category.objects.order_by("title", "pk").values_list(
+        "pk", "title", "parent_id", "path", "depth", "breadcrumb"
+    )
+    return CategoryTree.build(list(rows))
+
+
+def category_tree_changed() -> None:
+    """
+    Рубрики изменены в текущей транзакции. До коммита category_tree() читает
+    дерево с этими изменениями в обход общего кэша, после коммита увеличивает
+    версию в Redis. Если транзакция откатилась, Django отбрасывает её
+    on_commit-колбэки – по этому и видно, что изменений больше нет.
+    """
+    global _uncommitted_tree
+
+    def committed():
+        _category_tree_forget_uncommitted()
+        redis.incr(CATEGORY_TREE_VERSION_KEY)
+
+    _uncommitted_hooks.append(committed)
+    _uncommitted_tree = None
+    transaction.on_commit(committed)
+
+
+def _category_tree_forget_uncommitted() -> None:
+    global _uncommitted_tree
+    _uncommitted_hooks.clear()
+    _uncommitted_tree = None
+
+
+def _category_tree_uncommitted() -> bool:
+    if not _uncommitted_hooks:
+        return False
+    pending = {func for _, func, _ in transaction.get_connection().run_on_commit}
+    if any(hook in pending for hook in _uncommitted_hooks):
+        return True
+    # Транзакция откатилась: общий кэш по-прежнему соответствует БД.
+    _category_tree_forget_uncommitted()
+    return False
+
+
+def category_tree() -> CategoryTree:
+    """Актуальное дерево рубрик: один GET в Redis, запрос к БД – только после
+    изменения рубрик."""
+    global _cached_tree, _uncommitted_tree
+
+    if _category_tree_uncommitted():
+        if _uncommitted_tree is None:
+            _uncommitted_tree = _category_tree_load()
+        return _uncommitted_tree
+
+    version = category_tree_version()
+    if _cached_tree is None or _cached_tree[0] != version:
+        _cached_tree = (version, _category_tree_load())
+    return _cached_tree[1]
@@ -2,6 +2,7 @@ from django.urls import path
 
 from exchange.views import (
     CategoryListView,
+    CategorySearchView,
     message_create_view,
     set_user_mode,
     propose_category_view,
@@ -12,5 +13,6 @@ urlpatterns = [
     path("set_user_mode/", set_user_mode, name="set_user_mode"),
     path("categories/", CategoryListView.as_view(), name="category_list"),
     path("categories/propose/", propose_category_view, name="category_propose"),
+    path("categories/search/", CategorySearchView.as_view(), name="category_search"),
     path("messages/create/", message_create_view, name="message_create"),
 ]
@@ -1,15 +1,16 @@
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.views.decorators.http import require_POST
+from django.views import View
 from django.views.generic import ListView
 from orders.selectors import order_get_by_id
 from users.selectors import user_get_by_id
 
 from exchange.forms import MessageCreateForm, CategoryProposalForm
 from exchange.models import Category, CategoryProposal
-from exchange.selectors import category_list
+from exchange.selectors import category_list_tree, category_search_available
 from exchange.services import message_create
 
 
@@ -32,9 +33,23 @@ def set_user_mode(request):
 class CategoryListView(ListView):
     model = Category
     template_name = "exchange/category_list.html"
+    context_object_name = "category_list"
 
     def get_queryset(self):
-        return category_list()
+        return category_list_tree()
+
+
+class CategorySearchView(View):
+    """Рубрики для выбора в формах публикаций (CategoryPickerWidget)."""
+
+    def get(self, request, *args, **kwargs):
+        results = [
+            {"id": node.pk, "label": node.breadcrumb}
+            for node in category_search_available(request.GET.get("q", ""))
+        ]
+        response = JsonResponse({"results": results})
+        response["Cache-Control"] = "public, max-age=60"
+        return response
 
 
 @login_required
@@ -0,0 +1,25 @@
+from django import forms
+from django.urls import reverse
+
+from exchange.selectors import category_get_by_id
+
+
+class CategoryPickerWidget(forms.Widget):
+    """
+    Выбор рубрики поиском. Вместо <select> со всеми рубриками рендерится скрытое
+    поле с id и строка поиска, варианты подгружает static/js/category_picker.js
+    из exchange:category_search. Название выбранной рубрики берётся из дерева в
+    памяти, поэтому рендер не зависит от размера справочника.
+    """
+
+    template_name = "exchange/widgets/category_picker.html"
+
+    class Media:
+        js = ["js/category_picker.js"]
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        category = category_get_by_id(value) if value else None
+        context["widget"]["label"] = category.breadcrumb if category else ""
+        context["widget"]["search_url"] = reverse("exchange:category_search")
+        return context
@@ -15,6 +15,8 @@ class OrderAdmin(admin.ModelAdmin):
         "is_paid",
         "price",
     ]
+    list_select_related = ["customer", "provider", "service", "project"]
+    raw_id_fields = ["service", "project"]
     list_filter = [
         "status",
         "is_paid",
@@ -37,8 +39,8 @@ class OrderAdmin(admin.ModelAdmin):
             "Подробности заказа",
             {
                 "fields": [
-                    "item_ct",
-                    "item_id",
+                    "service",
+                    "project",
                     "price",
                     "comment",
                 ]
@@ -0,0 +1,19 @@
+from django.http import HttpRequest
+
+from orders.selectors import order_awaiting_count
+
+
+def order_counters(request: HttpRequest) -> dict:
+    """
+    Помещает в контекст `orders_awaiting_count` – количество заказов, ожидающих
+    действия пользователя в текущем режиме (значок в навигации). Берётся из
+    счётчиков в Redis, без запросов к БД.
+    """
+    if not request.user.is_authenticated:
+        return {}
+
+    return {
+        "orders_awaiting_count": order_awaiting_count(
+            request.user.pk, as_customer=request.session.get("user_mode") == "buyer"
+        ),
+    }
@@ -0,0 +1,62 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_order_items(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Order = apps.get_model("orders", "Order")
+
+    for app_label, model_name, field in (
+        ("services", "service", "service_id"),
+        ("projects", "project", "project_id"),
+    ):
+        content_type = ContentType.objects.filter(
+            app_label=app_label, model=model_name
+        ).first()
+        if content_type is None:
+            continue
+        # Заказы на уже удалённые услуги и проекты остаются без предмета.
+        Model = apps.get_model(app_label, model_name)
+        Order.objects.filter(
+            item_ct=content_type, item_id__in=Model.objects.values("pk")
+        ).update(**{field: models.F("item_id")})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("orders", "0003_alter_order_options_alter_order_comment_and_more"),
+        ("projects", "0006_created_id_index"),
+        ("services", "0009_range_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="project",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="orders",
+                to="projects.project",
+                verbose_name="проєкт",
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="service",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="orders",
+                to="services.service",
+                verbose_name="послуга",
+            ),
+        ),
+        migrations.RunPython(fill_order_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0004_order_service_project"),
+    ]
+
+    operations = [
+        # Откатить нельзя: заказы на удалённые услуги и проекты потеряли предмет,
+        # а item_ct и item_id обязательные. Без reverse_code Django откажется
+        # откатывать миграцию целиком, не тронув схему.
+        migrations.RunPython(migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="order",
+            name="item_ct",
+        ),
+        migrations.RemoveField(
+            model_name="order",
+            name="item_id",
+        ),
+        migrations.AddConstraint(
+            model_name="order",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("project__isnull", False),
+                    ("service__isnull", False),
+                    _negated=True,
+                ),
+                name="order_service_or_project",
+            ),
+        ),
+    ]
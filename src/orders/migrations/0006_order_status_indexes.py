@@ -0,0 +1,54 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0005_remove_order_item"),
+        ("projects", "0006_created_id_index"),
+        ("services", "0009_range_filter_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="customer",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="orders_as_customer",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="замовник",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="provider",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="orders_as_provider",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="виконавець",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["customer", "status", "-created", "-id"],
+                name="order_customer_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["provider", "status", "-created", "-id"],
+                name="order_provider_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0006_order_status_indexes"),
+        ("projects", "0006_created_id_index"),
+        ("services", "0009_range_filter_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["customer", "-created", "-id"],
+                name="order_customer_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["provider", "-created", "-id"],
+                name="order_provider_created_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,3 @@
-from django.contrib.contenttypes.fields import GenericForeignKey
-from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from users.models import CustomUser
 
@@ -19,6 +17,19 @@ class Order(models.Model):
         ("completed", "Завершено"),
     )
 
+    # Группы статусов для фильтров списка заказов
+    ACTIVE_STATUSES = (
+        "created",
+        "in_progress",
+        "submitted_by_provider",
+        "returned_by_customer",
+    )
+    COMPLETED_STATUSES = ("accepted_by_customer", "paid", "completed")
+    CANCELLED_STATUSES = ("cancelled_by_customer", "rejected_by_provider")
+    # Активные заказы, в которых следующий шаг за заказчиком / исполнителем
+    AWAITING_CUSTOMER_STATUSES = ("submitted_by_provider",)
+    AWAITING_PROVIDER_STATUSES = ("created", "in_progress", "returned_by_customer")
+
     customer = models.ForeignKey(
         CustomUser,
         verbose_name="замовник",
@@ -26,6 +37,8 @@ class Order(models.Model):
         blank=False,
         null=False,
         related_name="orders_as_customer",
+        # Индекс по customer_id – префикс составных индексов в Meta.indexes
+        db_index=False,
     )
     provider = models.ForeignKey(
         CustomUser,
@@ -34,24 +47,27 @@ class Order(models.Model):
         blank=False,
         null=False,
         related_name="orders_as_provider",
+        db_index=False,
     )
     #
-    # item - предмет замовленняа. Это может быть Project или Service.
+    # Предмет замовлення – послуга или проєкт (заполнено ровно одно из полей,
+    # см. Meta.constraints). Общий доступ к нему – свойство `item`.
     #
-    item_ct = models.ForeignKey(
-        ContentType,
-        blank=False,
-        null=False,
-        related_name="item_obj",
-        on_delete=models.CASCADE,
-    )
-    item_id = models.PositiveIntegerField(
-        null=False,
-        blank=False,
+    service = models.ForeignKey(
+        "services.Service",
+        verbose_name="послуга",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="orders",
     )
-    item = GenericForeignKey(
-        ct_field="item_ct",
-        fk_field="item_id",
+    project = models.ForeignKey(
+        "projects.Project",
+        verbose_name="проєкт",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="orders",
     )
     price = models.IntegerField(
         verbose_name="вартість",
@@ -96,6 +112,42 @@ class Order(models.Model):
         ordering = ["-created"]
         verbose_name = "замовлення"
         verbose_name_plural = "замовлення"
+        indexes = [
+            # Списки "Мої замовлення" с keyset-пагинацией: без фильтра и с
+            # группой статусов (status IN (...)) – заказы читаются по этим
+            # индексам уже в порядке выдачи, остальные условия – фильтром.
+            models.Index(
+                fields=["customer", "-created", "-id"],
+                name="order_customer_created_idx",
+            ),
+            models.Index(
+                fields=["provider", "-created", "-id"],
+                name="order_provider_created_idx",
+            ),
+            # Группы из одного статуса ("Очікують" заказчика) и пересчёт
+            # счётчиков по статусам.
+            models.Index(
+                fields=["customer", "status", "-created", "-id"],
+                name="order_customer_status_idx",
+            ),
+            models.Index(
+                fields=["provider", "status", "-created", "-id"],
+                name="order_provider_status_idx",
+            ),
+        ]
+        constraints = [
+            # Заказ не может относиться сразу к послуге и к проєкту. Оба поля
+            # пустые, только если предмет заказа удалён.
+            models.CheckConstraint(
+                check=~models.Q(service__isnull=False, project__isnull=False),
+                name="order_service_or_project",
+            ),
+        ]
 
     def __str__(self):
         return f"Заказ №{self.id}"
+
+    @property
+    def item(self):
+        """Предмет заказа: Service или Project (None, если он удалён)."""
+        return self.service or self.project
@@ -1,34 +1,88 @@
-from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q, QuerySet
-from projects.models import Project
+from django_project.rds import redis
 
 from orders.models import Order
 
+# Hash в Redis: статус заказа -> количество заказов пользователя в роли
+# "customer" или "provider". Обновляется в orders.services, сверяется с БД
+# задачей order_counters_reconcile_task.
+ORDER_COUNTERS_KEY = "order_counters:{user_id}:{role}"
+
+# Фильтры списка заказов: группа статусов для заказчика и для исполнителя
+ORDER_STATUS_GROUPS = {
+    "active": (Order.ACTIVE_STATUSES, Order.ACTIVE_STATUSES),
+    "awaiting": (Order.AWAITING_CUSTOMER_STATUSES, Order.AWAITING_PROVIDER_STATUSES),
+    "completed": (Order.COMPLETED_STATUSES, Order.COMPLETED_STATUSES),
+    "cancelled": (Order.CANCELLED_STATUSES, Order.CANCELLED_STATUSES),
+}
+
+
+def _order_list_filter_status(
+    queryset: QuerySet, status_group: str | None, as_customer: bool
+) -> QuerySet:
+    if status_group in ORDER_STATUS_GROUPS:
+        customer_statuses, provider_statuses = ORDER_STATUS_GROUPS[status_group]
+        queryset = queryset.filter(
+            status__in=customer_statuses if as_customer else provider_statuses
+        )
+    return queryset.select_related("customer", "provider", "service", "project")
+
 
 def order_list(user_id: int) -> QuerySet:
     """Выбирает заказы, где пользователь с user_id заказчик или исполнитель."""
     orders = Order.objects.filter(Q(customer_id=user_id) | Q(provider_id=user_id)).all()
-    return orders
+    return orders.select_related("service", "project")
 
 
-def order_list_as_customer(user_id: int) -> QuerySet:
-    return Order.objects.filter(customer_id=user_id).all()
+def order_list_as_customer(user_id: int, status_group: str | None = None) -> QuerySet:
+    """Заказы пользователя как заказчика; `status_group` – ключ ORDER_STATUS_GROUPS."""
+    return _order_list_filter_status(
+        Order.objects.filter(customer_id=user_id), status_group, as_customer=True
+    )
 
 
-def order_list_as_provider(user_id: int) -> QuerySet:
-    return Order.objects.filter(provider_id=user_id).all()
+def order_list_as_provider(user_id: int, status_group: str | None = None) -> QuerySet:
+    """Заказы пользователя как исполнителя; `status_group` – ключ ORDER_STATUS_GROUPS."""
+    return _order_list_filter_status(
+        Order.objects.filter(provider_id=user_id), status_group, as_customer=False
+    )
 
 
 def order_get_by_id(order_id: int) -> Order | None:
-    return Order.objects.filter(id=order_id).first()
+    return (
+        Order.objects.filter(id=order_id)
+        .select_related("customer", "provider", "service", "project")
+        .first()
+    )
 
 
 def order_get_by_project_id(project_id: int, user) -> Order | None:
     """Вовзращает заказ указанного проекта, где пользователь является заказчиком или исполнителем."""
     return (
-        Order.objects.filter(
-            item_ct=ContentType.objects.get_for_model(Project), item_id=project_id
-        )
+        Order.objects.filter(project_id=project_id)
         .filter(Q(customer=user) | Q(provider=user))
         .first()
     )
+
+
+def order_counters(user_id: int, role: str) -> dict[str, int]:
+    """Количество заказов пользователя по статусам в роли `role` ("customer" или
+    "provider"). Читается из Redis, без запросов к БД."""
+    counters = redis.hgetall(ORDER_COUNTERS_KEY.format(user_id=user_id, role=role))
+    return {
+        status.decode(): int(count)
+        for status, count in counters.items()
+        if int(count) > 0
+    }
+
+
+def order_awaiting_count(user_id: int, as_customer: bool) -> int:
+    """Количество заказов, ожидающих действия пользователя (один HMGET в Redis)."""
+    statuses: tuple[str, ...]
+    if as_customer:
+        key = ORDER_COUNTERS_KEY.format(user_id=user_id, role="customer")
+        statuses = Order.AWAITING_CUSTOMER_STATUSES
+    else:
+        key = ORDER_COUNTERS_KEY.format(user_id=user_id, role="provider")
+        statuses = Order.AWAITING_PROVIDER_STATUSES
+    return sum(max(int(count or 0), 0) for count in redis.hmget(key, list(statuses)))
@@ -1,4 +1,7 @@
-from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from django_project.rds import redis
 from projects.models import Project
 from services.models import Service
 from users.models import Action, CustomUser
@@ -9,6 +12,7 @@ from users.services import (
 )
 
 from orders.models import Order
+from orders.selectors import ORDER_COUNTERS_KEY
 
 
 def order_create(
@@ -22,12 +26,13 @@ def order_create(
     order = Order(
         customer=customer,
         provider=provider,
-        item_ct=ContentType.objects.get_for_model(item),
-        item_id=item.pk,
+        service=item if isinstance(item, Service) else None,
+        project=item if isinstance(item, Project) else None,
         price=price,
         comment=comment,
     )
     order.save()
+    order_counters_move(order, old_status=None)
 
     # Создадим соответствующие действия для заказчика и исполнителя
     action_create(customer, verb=Action.PLACE_ORDER, target=order)
@@ -36,52 +41,129 @@ def order_create(
     return order
 
 
+# Переходы статусов: новый статус -> (допустимые текущие статусы, кто из
+# участников заказа может его установить)
+ORDER_TRANSITIONS = {
+    "cancelled_by_customer": (("created",), "customer"),
+    "rejected_by_provider": (("created",), "provider"),
+    "in_progress": (("created",), "provider"),
+    "submitted_by_provider": (("in_progress", "returned_by_customer"), "provider"),
+    "returned_by_customer": (("submitted_by_provider",), "customer"),
+    "accepted_by_customer": (("submitted_by_provider",), "customer"),
+}
+
+
 def order_set_status(order: Order, new_status: str, actor: CustomUser) -> None:
-    """Изменяет статус заказа на указанный (если это возможно) и создаёт соответствующее действие
-    пользователя с этим заказом."""
-    match new_status:
-        case "cancelled_by_customer":
-            # Заказчик может отменить заказ, только если он ещё не был принят в работу исполнителем
-            if (order.status == "created") and (actor == order.customer):
-                order.status = "cancelled_by_customer"
-                order.is_cancelled = True
-                user_refund_to_balance(user=order.customer, item=order.item)
+    """
+    Изменяет статус заказа на указанный (если это возможно) и создаёт соответствующее
+    действие пользователя с этим заказом.
+
+    Текущий статус читается из заблокированной строки (SELECT ... FOR UPDATE
+    WHERE status IN <допустимые>), затем меняется одним условным UPDATE: из
+    одновременных переходов (например, отмена заказчиком и отказ исполнителя)
+    проходит только первый, остальные ждут блокировку и не находят допустимый
+    статус. Поэтому возврат или оплата выполняются ровно один раз.
+    """
+    if new_status not in ORDER_TRANSITIONS:
+        return None
+    from_statuses, role = ORDER_TRANSITIONS[new_status]
+    if actor.pk != getattr(order, f"{role}_id"):
+        return None
+
+    fields = {"status": new_status, "updated": timezone.now()}
+    if new_status in Order.CANCELLED_STATUSES:
+        fields["is_cancelled"] = True
+    if new_status == "accepted_by_customer":
+        fields["is_completed"] = True
+
+    with transaction.atomic():
+        old_status = (
+            Order.objects.select_for_update()
+            .filter(pk=order.pk, status__in=from_statuses)
+            .values_list("status", flat=True)
+            .first()
+        )
+        if old_status is None:
+            return None
+        Order.objects.filter(pk=order.pk, status__in=from_statuses).update(**fields)
+
+        for field, value in fields.items():
+            setattr(order, field, value)
+
+        match new_status:
+            case "cancelled_by_customer":
+                user_refund_to_balance(user=order.customer, amount=order.price)
                 action_create(user=actor, verb=Action.CANCEL_ORDER, target=order)
-        case "rejected_by_provider":
-            # Исполнитель может отклонить заказ, пока он только создан заказчиком:
-            if (order.status == "created") and (actor == order.provider):
-                order.status = "rejected_by_provider"
-                order.is_cancelled = True
-                user_refund_to_balance(user=order.customer, item=order.item)
+            case "rejected_by_provider":
+                user_refund_to_balance(user=order.customer, amount=order.price)
                 action_create(user=actor, verb=Action.REJECT_ORDER, target=order)
-        case "in_progress":
-            if (order.status == "created") and (actor == order.provider):
-                order.status = "in_progress"
+            case "in_progress":
                 action_create(user=actor, verb=Action.ACCEPT_ORDER, target=order)
-        case "submitted_by_provider":
-            # Исполнитель может "сдать" заказ находящийся в работе или возвращенный на доработку
-            if (order.status in ["in_progress", "returned_by_customer"]) and (
-                actor == order.provider
-            ):
-                order.status = "submitted_by_provider"
+            case "submitted_by_provider":
                 action_create(user=actor, verb=Action.SUBMIT_ORDER, target=order)
-        case "returned_by_customer":
-            # Заказчик может вернуть на доработку "сданный" исполнителем заказ
-            if (order.status == "submitted_by_provider") and (actor == order.customer):
-                order.status = "returned_by_customer"
+            case "returned_by_customer":
                 action_create(user=actor, verb=Action.RETURN_ORDER, target=order)
-        case "accepted_by_customer":
-            # Заказчик может принять "сданный" исполнителем заказ
-            if (order.status == "submitted_by_provider") and (actor == order.customer):
-                order.status = "accepted_by_customer"
-                order.is_completed = True
-                user_payment_to_balance(user=order.provider, item=order.item)
+            case "accepted_by_customer":
+                user_payment_to_balance(user=order.provider, amount=order.price)
                 action_create(
                     user=order.customer, verb=Action.RECEIVE_RESULT, target=order
                 )
                 action_create(
                     user=order.provider, verb=Action.COMPLETE_ORDER, target=order
                 )
-        case _:
-            return None
-    order.save()
+
+        order_counters_move(order, old_status=old_status)
+
+
+def order_counters_move(order: Order, old_status: str | None) -> None:
+    """Переносит заказ в счётчиках заказчика и исполнителя из `old_status` в
+    текущий статус (None – новый заказ). Redis обновляется после коммита."""
+    new_status = order.status
+    users = (("customer", order.customer_id), ("provider", order.provider_id))
+
+    def move():
+        pipeline = redis.pipeline(transaction=False)
+        for role, user_id in users:
+            key = ORDER_COUNTERS_KEY.format(user_id=user_id, role=role)
+            if old_status:
+                pipeline.hincrby(key, old_status, -1)
+            pipeline.hincrby(key, new_status, 1)
+        pipeline.execute()
+
+    transaction.on_commit(move)
+
+
+def order_counters_reconcile() -> int:
+    """
+    Пересчитывает счётчики заказов по БД (двумя GROUP BY) и заменяет ими hash'и
+    в Redis; счётчики пользователей без заказов удаляются. Изменение заказа во
+    время пересчёта может потеряться до следующего запуска. Возвращает
+    количество записанных счётчиков.
+    """
+    counters: dict[str, dict[str, int]] = {}
+    for role in ("customer", "provider"):
+        rows = (
+            Order.objects.order_by()
+            .values(f"{role}_id", "status")
+            .annotate(count=Count("id"))
+            .values_list(f"{role}_id", "status", "count")
+        )
+        for user_id, status, count in rows:
+            key = ORDER_COUNTERS_KEY.format(user_id=user_id, role=role)
+            counters.setdefault(key, {})[status] = count
+
+    stale_keys = {
+        key.decode()
+        for key in redis.scan_iter(
+            match=ORDER_COUNTERS_KEY.format(user_id="*", role="*")
+        )
+    } - counters.keys()
+
+    pipeline = redis.pipeline()
+    for key, mapping in counters.items():
+        pipeline.delete(key)
+        pipeline.hset(key, mapping=mapping)
+    if stale_keys:
+        pipeline.delete(*stale_keys)
+    pipeline.execute()
+    return len(counters)
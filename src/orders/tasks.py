@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from orders.services import order_counters_reconcile
+
+
+@shared_task
+def order_counters_reconcile_task() -> int:
+    return order_counters_reconcile()
@@ -0,0 +1,41 @@
+from core.tests.factories import CustomUserFactory, OrderFactory, ProjectFactory
+from django.db import IntegrityError
+from django.test import TestCase
+from projects.selectors import project_list
+
+from orders.models import Order
+from orders.selectors import order_get_by_id, order_list_as_customer
+
+
+class OrderItemTest(TestCase):
+    def setUp(self):
+        self.order = OrderFactory()
+        self.project = ProjectFactory()
+        self.project_order = OrderFactory(
+            service=None,
+            project=self.project,
+            provider=CustomUserFactory(),
+            price=self.project.price,
+        )
+
+    def test_item_is_joined(self):
+        with self.assertNumQueries(1):
+            order = order_get_by_id(self.order.pk)
+            self.assertEqual(order.item, self.order.service)
+
+        with self.assertNumQueries(1):
+            items = [
+                order.item
+                for order in order_list_as_customer(self.project_order.customer_id)
+            ]
+        self.assertEqual(items, [self.project])
+
+    def test_project_list_excludes_ordered(self):
+        free = ProjectFactory()
+        projects = list(project_list(exclude_with_orders=True))
+        self.assertIn(free, projects)
+        self.assertNotIn(self.project, projects)
+
+    def test_service_and_project_exclusive(self):
+        with self.assertRaises(IntegrityError):
+            Order.objects.filter(pk=self.order.pk).update(project=self.project)
@@ -0,0 +1,157 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core.tests.factories import CustomUserFactory, OrderFactory, ServiceFactory
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django_project.rds import redis
+
+from orders.models import Order
+from orders.selectors import (
+    ORDER_COUNTERS_KEY,
+    order_awaiting_count,
+    order_counters,
+    order_get_by_id,
+)
+from orders.services import order_counters_reconcile, order_create, order_set_status
+
+
+class OrderCountersTest(TestCase):
+    def setUp(self):
+        for key in redis.scan_iter(
+            match=ORDER_COUNTERS_KEY.format(user_id="*", role="*")
+        ):
+            redis.delete(key)
+        self.customer = CustomUserFactory()
+        self.service = ServiceFactory()
+        self.provider = self.service.provider
+
+    def create_order(self) -> Order:
+        with self.captureOnCommitCallbacks(execute=True):
+            return order_create(
+                customer=self.customer,
+                provider=self.provider,
+                item=self.service,
+                price=self.service.price,
+            )
+
+    def test_counters_follow_status(self):
+        order = self.create_order()
+        self.create_order()
+        self.assertEqual(order_counters(self.customer.pk, "customer"), {"created": 2})
+        self.assertEqual(order_awaiting_count(self.provider.pk, as_customer=False), 2)
+        self.assertEqual(order_awaiting_count(self.customer.pk, as_customer=True), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order_set_status(order, "in_progress", actor=self.provider)
+            order_set_status(order, "submitted_by_provider", actor=self.provider)
+            # Недопустимый переход не меняет счётчики
+            order_set_status(order, "in_progress", actor=self.provider)
+
+        self.assertEqual(
+            order_counters(self.provider.pk, "provider"),
+            {"created": 1, "submitted_by_provider": 1},
+        )
+        self.assertEqual(order_awaiting_count(self.customer.pk, as_customer=True), 1)
+        self.assertEqual(order_awaiting_count(self.provider.pk, as_customer=False), 1)
+
+    def test_transition_with_several_sources(self):
+        order = self.create_order()
+        with self.captureOnCommitCallbacks(execute=True):
+            order_set_status(order, "in_progress", actor=self.provider)
+            order_set_status(order, "submitted_by_provider", actor=self.provider)
+            order_set_status(order, "returned_by_customer", actor=self.customer)
+
+        # Второй из допустимых статусов – всё равно один UPDATE заказа.
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                order_set_status(order, "submitted_by_provider", actor=self.provider)
+
+        updates = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('UPDATE "orders_order"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            order_counters(self.provider.pk, "provider"), {"submitted_by_provider": 1}
+        )
+
+    def test_reconcile(self):
+        order = self.create_order()
+        Order.objects.filter(pk=order.pk).update(status="in_progress")
+        stale_key = ORDER_COUNTERS_KEY.format(user_id=0, role="customer")
+        redis.hset(stale_key, "created", 5)
+
+        self.assertEqual(order_counters_reconcile(), 2)
+        self.assertEqual(
+            order_counters(self.customer.pk, "customer"), {"in_progress": 1}
+        )
+        self.assertEqual(
+            order_counters(self.provider.pk, "provider"), {"in_progress": 1}
+        )
+        self.assertFalse(redis.exists(stale_key))
+
+    def test_badge_in_navigation(self):
+        self.create_order()
+        self.client.force_login(self.provider)
+        response = self.client.get("/")
+        self.assertEqual(response.context["orders_awaiting_count"], 1)
+        self.assertContains(response, "?status=awaiting")
+
+
+class OrderSetStatusConcurrencyTest(TransactionTestCase):
+    """Одновременные переходы из одного статуса: проходит ровно один."""
+
+    workers = 8
+
+    def create_order(self, **kwargs) -> Order:
+        # Неактивная услуга не ставит задач Celery после коммита
+        return OrderFactory(service__is_active=False, **kwargs)
+
+    def run_concurrently(self, order: Order, attempts: list[tuple[str, str]]) -> None:
+        barrier = threading.Barrier(len(attempts))
+
+        def attempt(new_status: str, role: str):
+            try:
+                # Каждый поток читает заказ до того, как кто-либо его изменил
+                current = order_get_by_id(order.pk)
+                barrier.wait()
+                order_set_status(current, new_status, actor=getattr(current, role))
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=len(attempts)) as executor:
+            for future in [executor.submit(attempt, *args) for args in attempts]:
+                future.result()
+
+    def balances(self, order: Order):
+        order.customer.refresh_from_db()
+        order.provider.refresh_from_db()
+        return order.customer.balance, order.provider.balance
+
+    def test_cancel_and_reject_refund_once(self):
+        order = self.create_order(price=500)
+        attempts = [("cancelled_by_customer", "customer")] * (self.workers // 2)
+        attempts += [("rejected_by_provider", "provider")] * (self.workers // 2)
+        self.run_concurrently(order, attempts)
+
+        order.refresh_from_db()
+        self.assertIn(order.status, ("cancelled_by_customer", "rejected_by_provider"))
+        self.assertTrue(order.is_cancelled)
+        self.assertEqual(self.balances(order), (500, 0))
+
+    def test_accept_pays_once(self):
+        order = self.create_order(price=700, status="submitted_by_provider")
+        attempts = [("accepted_by_customer", "customer")] * (self.workers // 2)
+        attempts += [("returned_by_customer", "customer")] * (self.workers // 2)
+        self.run_concurrently(order, attempts)
+
+        order.refresh_from_db()
+        if order.status == "accepted_by_customer":
+            self.assertTrue(order.is_completed)
+            self.assertEqual(self.balances(order), (0, 700))
+        else:
+            self.assertEqual(order.status, "returned_by_customer")
+            self.assertEqual(self.balances(order), (0, 0))
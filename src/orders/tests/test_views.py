@@ -0,0 +1,45 @@
+from core.tests.factories import CustomUserFactory, OrderFactory
+from django.test import TestCase
+from django.urls import reverse
+
+from orders.models import Order
+
+
+class OrderListViewTest(TestCase):
+    def setUp(self):
+        self.customer = CustomUserFactory()
+        self.client.force_login(self.customer)
+        session = self.client.session
+        session["user_mode"] = "buyer"
+        session.save()
+
+    def test_status_filter(self):
+        submitted = OrderFactory(customer=self.customer, status="submitted_by_provider")
+        in_progress = OrderFactory(customer=self.customer, status="in_progress")
+        cancelled = OrderFactory(customer=self.customer, status="cancelled_by_customer")
+        OrderFactory(status="submitted_by_provider")
+
+        def listed(status):
+            response = self.client.get(reverse("orders:list"), {"status": status})
+            return set(response.context["order_list"])
+
+        self.assertEqual(listed("active"), {submitted, in_progress})
+        self.assertEqual(listed("awaiting"), {submitted})
+        self.assertEqual(listed("cancelled"), {cancelled})
+        self.assertEqual(listed(""), {submitted, in_progress, cancelled})
+
+    def test_keyset_pages(self):
+        OrderFactory.create_batch(25, customer=self.customer)
+        url = reverse("orders:list")
+
+        response = self.client.get(url)
+        first_page = list(response.context["order_list"])
+        self.assertEqual(len(first_page), 20)
+
+        response = self.client.get(f"{url}?{response.context['next_page_query']}")
+        second_page = list(response.context["order_list"])
+        self.assertEqual(len(second_page), 5)
+        self.assertEqual(
+            {order.pk for order in first_page + second_page},
+            set(Order.objects.values_list("pk", flat=True)),
+        )
@@ -1,3 +1,5 @@
+from core.mixins import PartialResponseMixin
+from core.pagination import KeysetPaginationMixin
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
@@ -15,6 +17,7 @@ from users.services import user_pay_from_balance
 from orders.forms import CreateServiceOrderForm, OrderChangeStatusForm
 from orders.models import Order
 from orders.selectors import (
+    ORDER_STATUS_GROUPS,
     order_get_by_id,
     order_list_as_customer,
     order_list_as_provider,
@@ -92,6 +95,9 @@ def order_set_status_view(request: HttpRequest, order_id: int) -> HttpResponse:
 
 class OrderDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
     model = Order
+    queryset = Order.objects.select_related(
+        "customer", "provider", "service", "project"
+    )
     template_name = "orders/order_detail.html"
 
     def test_func(self):
@@ -111,15 +117,41 @@ class OrderDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
         return context
 
 
-class OrderListView(LoginRequiredMixin, ListView):
+class OrderListView(
+    LoginRequiredMixin, PartialResponseMixin, KeysetPaginationMixin, ListView
+):
     model = Order
     template_name = "orders/order_list.html"
+    partial_template_name = "orders/order_list_results.html"
+    partial_page_template_name = "orders/order_list_page.html"
+    paginate_by = 20
+    count_results = False
+
+    def get_status_group(self) -> str | None:
+        status_group = self.request.GET.get("status")
+        return status_group if status_group in ORDER_STATUS_GROUPS else None
 
     def get_queryset(self):
         """Фильтруем замовлення в зависимиости от режима пользователя – покупатель или продавец."""
         user_mode = self.request.session.get("user_mode")
         if user_mode == "buyer":
-            queryset = order_list_as_customer(user_id=self.request.user.pk)
+            queryset = order_list_as_customer(
+                user_id=self.request.user.pk, status_group=self.get_status_group()
+            )
         else:
-            queryset = order_list_as_provider(user_id=self.request.user.pk)
+            queryset = order_list_as_provider(
+                user_id=self.request.user.pk, status_group=self.get_status_group()
+            )
         return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["status_group"] = self.get_status_group()
+        context["status_groups"] = [
+            (None, "Усі"),
+            ("active", "В роботі"),
+            ("awaiting", "Чекають на мене"),
+            ("completed", "Завершені"),
+            ("cancelled", "Скасовані"),
+        ]
+        return context
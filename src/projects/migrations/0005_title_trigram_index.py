@@ -0,0 +1,25 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:42
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("projects", "0004_alter_project_options_alter_offer_candidate_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"], name="project_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("projects", "0005_title_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["created", "id"], name="project_created_id_idx"),
+        ),
+    ]
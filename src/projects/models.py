@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from exchange.models import Category
 from users.models import CustomUser
@@ -71,6 +72,13 @@ class Project(models.Model):
         ordering = ["-created"]
         verbose_name = "проєкт"
         verbose_name_plural = "проєкти"
+        indexes = [
+            # Keyset-пагинация каталога: ORDER BY created DESC, id DESC.
+            models.Index(fields=["created", "id"], name="project_created_id_idx"),
+            GinIndex(
+                fields=["title"], name="project_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ]
 
     def __str__(self):
         return self.title
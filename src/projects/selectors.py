@@ -1,7 +1,8 @@
-from django.contrib.contenttypes.models import ContentType
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Count, Exists, OuterRef, Q, QuerySet, Subquery
+from exchange.selectors import category_subtree_ids
 from orders.models import Order
+from search.models import SearchDocument
+from search.selectors import search_document_ranked, search_with_trigram_fallback
 from users.models import CustomUser
 
 from projects.models import Offer, Project
@@ -13,43 +14,37 @@ def project_list(
     exclude_with_orders: bool = False,
     search: str | None = None,
 ) -> QuerySet:
-    queryset = Project.objects.select_related(
-        "category", "category__parent", "category__parent__parent", "customer"
-    ).annotate(
+    queryset = Project.objects.select_related("category", "customer").annotate(
         offer_count=Count(
             "offers",
             filter=Q(offers__is_cancelled=False) & ~Q(offers__status="accepted"),
-        )
+        ),
+        customer_project_count=Subquery(
+            Project.objects.filter(customer_id=OuterRef("customer_id"))
+            .order_by()
+            .values("customer_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
     )
 
     if category_id:
-        queryset = queryset.filter(category_id=category_id)
+        queryset = queryset.filter(category_id__in=category_subtree_ids(category_id))
 
     if customer_id:
         queryset = queryset.filter(customer_id=customer_id)
 
     if exclude_with_orders:
-        # Выбираем все заказы на проекты
-        orders = Order.objects.filter(
-            item_ct=ContentType.objects.get_for_model(Project)
-        ).all()
-        # Выбираем в список id всех проектов в этих заказов
-        projects_with_orders_pks = list(orders.values_list("item_id", flat=True))
-        # Исключаем проекты с id в списке
-        queryset = queryset.exclude(id__in=projects_with_orders_pks)
+        # Анти-join по индексу orders_order.project_id
+        queryset = queryset.filter(
+            ~Exists(Order.objects.filter(project_id=OuterRef("pk")))
+        )
 
     if search:
-        search_vector = SearchVector(
-            "title", weight="A", config="russian"
-        ) + SearchVector("description", weight="B", config="russian")
-        search_query = SearchQuery(search, config="russian")
-        queryset = (
-            queryset.annotate(
-                search=search_vector, rank=SearchRank(search_vector, search_query)
-            )
-            .filter(rank__gte=0.1)
-            .order_by("-rank")
+        fulltext = search_document_ranked(
+            queryset, SearchDocument.EntityType.PROJECT, search
         )
+        queryset = search_with_trigram_fallback(fulltext, queryset, search)
 
     return queryset.all()
 
@@ -57,7 +52,7 @@ def project_list(
 def project_get_by_id(project_id: int) -> Project | None:
     return (
         Project.objects.filter(id=project_id)
-        .select_related("category__parent__parent", "customer")
+        .select_related("category", "customer")
         .prefetch_related("offers", "offers__candidate")
         .first()
     )
@@ -1,3 +1,5 @@
+from core.mixins import PartialResponseMixin
+from core.pagination import KeysetPaginationMixin
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
@@ -15,12 +17,13 @@ from django.views.generic import (
     UpdateView,
 )
 from django_project.rds import redis
+from exchange.mixins import CategoryPickerMixin
 from exchange.selectors import (
     category_get_by_id,
-    category_list_only_available,
     category_list_only_with_projects,
 )
 from orders.selectors import order_get_by_project_id
+from search.mixins import CatalogResultCacheMixin, SearchAnalyticsMixin
 from users.models import Action
 from users.services import action_create
 
@@ -35,17 +38,34 @@ from projects.selectors import (
 from projects.services import offer_create, offer_set_status
 
 
-class ProjectListView(ListView):
+class ProjectListView(
+    PartialResponseMixin,
+    SearchAnalyticsMixin,
+    CatalogResultCacheMixin,
+    KeysetPaginationMixin,
+    ListView,
+):
     model = Project
     template_name = "projects/project_list.html"
+    partial_template_name = "projects/project_list_results.html"
+    partial_page_template_name = "projects/project_list_page.html"
+    catalog_kind = "project"
 
-    def get_queryset(self):
+    def get_keyset_ordering(self):
+        if self.request.GET.get("search"):
+            return ("-rank", "-id")
+        return super().get_keyset_ordering()
+
+    def get_catalog_queryset(self):
         category_id = self.request.GET.get("category_id", None)
         search = self.request.GET.get("search", None)
         return project_list(
             category_id=category_id, exclude_with_orders=True, search=search
         )
 
+    def get_catalog_objects_queryset(self):
+        return project_list()
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
@@ -55,7 +75,8 @@ class ProjectListView(ListView):
             category = category_get_by_id(category_id)
             context["category"] = category
 
-        context["categories"] = category_list_only_with_projects()
+        if not context["partial"]:
+            context["categories"] = category_list_only_with_projects()
         context["search"] = self.request.GET.get("search", None)
         return context
 
@@ -127,7 +148,7 @@ class ProjectDetailView(DetailView):
         return context
 
 
-class ProjectCreateView(LoginRequiredMixin, CreateView):
+class ProjectCreateView(LoginRequiredMixin, CategoryPickerMixin, CreateView):
     model = Project
     template_name = "projects/project_create.html"
     fields = [
@@ -139,12 +160,6 @@ class ProjectCreateView(LoginRequiredMixin, CreateView):
         "max_price",
     ]
 
-    def get_form(self, form_class=None):
-        """Оставляем в списке формы только категорії, доступные для назначения услуге."""
-        form = super().get_form(form_class)
-        form.fields["category"].queryset = category_list_only_available()
-        return form
-
     def form_valid(self, form):
         """Set logged in user as `customer` of new Project."""
         service = form.save(commit=False)
@@ -157,7 +172,11 @@ class ProjectCreateView(LoginRequiredMixin, CreateView):
 
 
 class ProjectUpdateView(
-    LoginRequiredMixin, UserPassesTestMixin, SuccessMessageMixin, UpdateView
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    SuccessMessageMixin,
+    CategoryPickerMixin,
+    UpdateView,
 ):
     model = Project
     fields = [
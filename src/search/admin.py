@@ -0,0 +1,70 @@
+from core.pagination import EstimatedCountPaginator
+from django.contrib import admin
+
+from search.models import SavedSearch, SavedSearchMatch, SearchDocument, SearchStat
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    model = SearchDocument
+    list_display = [
+        "id",
+        "entity_type",
+        "title",
+        "category",
+        "updated",
+    ]
+    list_filter = ["entity_type"]
+    search_fields = ["title"]
+    readonly_fields = ["updated"]
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    model = SavedSearch
+    list_display = [
+        "id",
+        "user",
+        "entity_type",
+        "query",
+        "category",
+        "created",
+    ]
+    list_filter = ["entity_type"]
+    search_fields = ["query", "user__username"]
+    raw_id_fields = ["user", "category"]
+    readonly_fields = ["terms", "created"]
+
+
+@admin.register(SavedSearchMatch)
+class SavedSearchMatchAdmin(admin.ModelAdmin):
+    model = SavedSearchMatch
+    list_display = [
+        "id",
+        "saved_search",
+        "entity_type",
+        "title",
+        "is_sent",
+        "created",
+    ]
+    list_filter = ["entity_type", "is_sent"]
+    raw_id_fields = ["saved_search"]
+
+
+@admin.register(SearchStat)
+class SearchStatAdmin(admin.ModelAdmin):
+    model = SearchStat
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_display = [
+        "hour",
+        "entity_type",
+        "query",
+        "filters",
+        "search_count",
+        "zero_result_count",
+        "max_time_ms",
+    ]
+    list_filter = ["entity_type"]
+    search_fields = ["query"]
+    date_hierarchy = "hour"
@@ -0,0 +1,28 @@
+from django import forms
+
+from search.models import SavedSearch
+from search.selectors import search_query_lexemes
+
+
+class SavedSearchForm(forms.ModelForm):
+    """Форма збереження пошуку – надсилається з каталогу послуг або проєктів."""
+
+    class Meta:
+        model = SavedSearch
+        fields = ["entity_type", "query", "category", "price_min", "price_max"]
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        query = cleaned_data.get("query")
+        if not cleaned_data.get("category") and (
+            not query or not search_query_lexemes(query)
+        ):
+            raise forms.ValidationError("Вкажіть пошуковий запит або рубрику.")
+
+        price_min = cleaned_data.get("price_min")
+        price_max = cleaned_data.get("price_max")
+        if price_min is not None and price_max is not None and price_min > price_max:
+            raise forms.ValidationError("Мінімальна ціна більша за максимальну.")
+
+        return cleaned_data
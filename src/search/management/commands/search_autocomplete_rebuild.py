@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from search.services import autocomplete_rebuild
+
+
+class Command(BaseCommand):
+    help = "Перестраивает индекс подсказок поиска в Redis (услуги и рубрики)."
+
+    def handle(self, *args, **options):
+        total = autocomplete_rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Проиндексировано подсказок: {total}"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from search.services import search_document_rebuild
+
+
+class Command(BaseCommand):
+    help = "Перестраивает таблицу поисковых документов (услуги, проекты, исполнители)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = search_document_rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Проиндексировано документов: {total}"))
@@ -0,0 +1,32 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from search.selectors import search_stat_report
+
+
+class Command(BaseCommand):
+    help = "Отчёт по поиску в каталогах: самые медленные запросы и запросы без результатов."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=int, default=24)
+        parser.add_argument("--limit", type=int, default=20)
+
+    def handle(self, *args, **options):
+        since = timezone.now() - datetime.timedelta(hours=options["hours"])
+        report = search_stat_report(since=since, limit=options["limit"])
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Самые медленные запросы"))
+        for row in report["slowest"]:
+            self.stdout.write(
+                f"{row['avg_time_ms']:9.1f} мс (макс. {row['max_time_ms']:.1f})"
+                f"  {row['searches']:6}×  [{row['entity_type']}] {row['query']}"
+            )
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Запросы без результатов"))
+        for row in report["zero_results"]:
+            self.stdout.write(
+                f"{row['zero_results']:6} из {row['searches']:<6}"
+                f"  [{row['entity_type']}] {row['query']}"
+            )
@@ -0,0 +1,96 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:41
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[
+                            ("service", "послуга"),
+                            ("project", "проєкт"),
+                            ("provider", "виконавець"),
+                        ],
+                        max_length=16,
+                        verbose_name="тип",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.PositiveBigIntegerField(verbose_name="ID об'єкта"),
+                ),
+                ("title", models.CharField(max_length=255, verbose_name="назва")),
+                ("body", models.TextField(blank=True, verbose_name="текст")),
+                ("url", models.CharField(max_length=255, verbose_name="посилання")),
+                (
+                    "price",
+                    models.IntegerField(blank=True, null=True, verbose_name="вартість"),
+                ),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        blank=True,
+                        editable=False,
+                        null=True,
+                        verbose_name="пошуковий документ",
+                    ),
+                ),
+                (
+                    "updated",
+                    models.DateTimeField(auto_now=True, verbose_name="оновлено"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="exchange.category",
+                        verbose_name="рубрика",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "пошуковий документ",
+                "verbose_name_plural": "пошукові документи",
+                "ordering": ["-updated"],
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["search_vector"], name="search_document_vector_gin"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchdocument",
+            constraint=models.UniqueConstraint(
+                fields=("entity_type", "object_id"),
+                name="search_document_unique_object",
+            ),
+        ),
+    ]
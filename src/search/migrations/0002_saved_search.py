@@ -0,0 +1,175 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:53
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("search", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SavedSearch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[("service", "послуги"), ("project", "проєкти")],
+                        default="service",
+                        max_length=16,
+                        verbose_name="що шукати",
+                    ),
+                ),
+                (
+                    "query",
+                    models.CharField(blank=True, max_length=200, verbose_name="запит"),
+                ),
+                (
+                    "price_min",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="ціна від"
+                    ),
+                ),
+                (
+                    "price_max",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="ціна до"
+                    ),
+                ),
+                (
+                    "terms",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=100),
+                        blank=True,
+                        default=list,
+                        editable=False,
+                        size=None,
+                        verbose_name="лексеми",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="створений"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="exchange.category",
+                        verbose_name="рубрика",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="saved_searches",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="користувач",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "збережений пошук",
+                "verbose_name_plural": "збережені пошуки",
+                "ordering": ["-created"],
+            },
+        ),
+        migrations.CreateModel(
+            name="SavedSearchMatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[("service", "послуги"), ("project", "проєкти")],
+                        max_length=16,
+                        verbose_name="тип",
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.PositiveBigIntegerField(verbose_name="ID об'єкта"),
+                ),
+                ("title", models.CharField(max_length=255, verbose_name="назва")),
+                ("url", models.CharField(max_length=255, verbose_name="посилання")),
+                (
+                    "is_sent",
+                    models.BooleanField(default=False, verbose_name="надіслано"),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="створено"),
+                ),
+                (
+                    "saved_search",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="matches",
+                        to="search.savedsearch",
+                        verbose_name="збережений пошук",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "збіг збереженого пошуку",
+                "verbose_name_plural": "збіги збережених пошуків",
+                "ordering": ["created"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="savedsearch",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["terms"], name="saved_search_terms_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="savedsearch",
+            index=models.Index(
+                fields=["entity_type", "category"], name="saved_search_category_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="savedsearchmatch",
+            index=models.Index(
+                condition=models.Q(("is_sent", False)),
+                fields=["created"],
+                name="saved_search_match_unsent",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="savedsearchmatch",
+            constraint=models.UniqueConstraint(
+                fields=("saved_search", "entity_type", "object_id"),
+                name="saved_search_match_unique",
+            ),
+        ),
+    ]
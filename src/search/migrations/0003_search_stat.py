@@ -0,0 +1,81 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0002_saved_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hour", models.DateTimeField(verbose_name="година")),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[("service", "послуги"), ("project", "проєкти")],
+                        max_length=16,
+                        verbose_name="каталог",
+                    ),
+                ),
+                ("query", models.CharField(max_length=200, verbose_name="запит")),
+                (
+                    "filters",
+                    models.CharField(
+                        blank=True, max_length=200, verbose_name="фільтри"
+                    ),
+                ),
+                (
+                    "search_count",
+                    models.PositiveIntegerField(default=0, verbose_name="пошуків"),
+                ),
+                (
+                    "zero_result_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="без результатів"
+                    ),
+                ),
+                (
+                    "result_count",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="сума результатів"
+                    ),
+                ),
+                (
+                    "total_time_ms",
+                    models.FloatField(default=0, verbose_name="сумарний час БД, мс"),
+                ),
+                (
+                    "max_time_ms",
+                    models.FloatField(
+                        default=0, verbose_name="максимальний час БД, мс"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "статистика пошуку",
+                "verbose_name_plural": "статистика пошуку",
+                "ordering": ["-hour"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchstat",
+            constraint=models.UniqueConstraint(
+                fields=("hour", "entity_type", "query", "filters"),
+                name="search_stat_unique_bucket",
+            ),
+        ),
+    ]
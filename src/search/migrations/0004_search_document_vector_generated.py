@@ -0,0 +1,51 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:20
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Обычную колонку нельзя превратить в генерируемую через ALTER, поэтому
+    search_vector пересоздаётся вместе с индексом; значения Postgres вычисляет
+    для всех документов при добавлении колонки."""
+
+    dependencies = [
+        ("search", "0003_search_stat"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="searchdocument",
+            name="search_document_vector_gin",
+        ),
+        migrations.RemoveField(
+            model_name="searchdocument",
+            name="search_vector",
+        ),
+        migrations.AddField(
+            model_name="searchdocument",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "title", config="russian", weight="A"
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "body", config="russian", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("russian"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+                verbose_name="пошуковий документ",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="searchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="search_document_vector_gin"
+            ),
+        ),
+    ]
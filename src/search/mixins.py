@@ -0,0 +1,167 @@
+import time
+
+from core.pagination import KeysetPage
+from django.db import connection
+from django.http import HttpRequest
+
+from search.selectors import (
+    autocomplete_normalize,
+    catalog_cache_get,
+    catalog_cache_key,
+)
+from search.services import catalog_cache_set, search_event_record
+
+
+class CatalogResultCacheMixin:
+    """
+    Кэш выдачи каталога для анонимных посетителей (ставится перед
+    KeysetPaginationMixin). В Redis хранится упорядоченный список id страницы
+    и курсор следующей, поэтому при попадании в кэш поиск и ранжирование не
+    выполняются – остаётся только выборка строк по первичному ключу.
+
+    Вью определяет `catalog_kind`, `get_catalog_queryset()` – полную выдачу с
+    фильтрами – и `get_catalog_objects_queryset()` – базовый queryset для
+    выборки объектов по id.
+    """
+
+    request: HttpRequest
+    catalog_kind: str
+
+    def get_catalog_queryset(self):
+        raise NotImplementedError
+
+    def get_catalog_objects_queryset(self):
+        raise NotImplementedError
+
+    def get_catalog_params(self) -> dict:
+        return {
+            "search": autocomplete_normalize(self.request.GET.get("search", "")),
+            "category_id": self.request.GET.get("category_id", ""),
+        }
+
+    def get_catalog_category_id(self):
+        return self.request.GET.get("category_id") or None
+
+    def catalog_cached(self, part: str, params: dict, build, category_id=None):
+        """Значение из кэша или результат `build()`, который сразу кэшируется.
+        Для залогиненных пользователей кэш не используется."""
+        if self.request.user.is_authenticated:
+            return build()
+
+        key = catalog_cache_key(self.catalog_kind, part, params, category_id)
+        value = catalog_cache_get(key)
+        if value is None:
+            value = build()
+            catalog_cache_set(key, value)
+        return value
+
+    def get_queryset(self):
+        self.cached_page = None
+        self.page_cache_key = None
+        if not self.request.user.is_authenticated:
+            params = {
+                **self.get_catalog_params(),
+                "ordering": list(self.get_keyset_ordering()),
+                "cursor": self.request.GET.get("cursor", ""),
+                "per_page": self.get_paginate_by(None),
+            }
+            self.page_cache_key = catalog_cache_key(
+                self.catalog_kind, "page", params, self.get_catalog_category_id()
+            )
+            self.cached_page = catalog_cache_get(self.page_cache_key)
+
+        if self.cached_page is not None:
+            return self.get_catalog_objects_queryset().filter(
+                pk__in=self.cached_page["ids"]
+            )
+        return self.get_catalog_queryset()
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.cached_page is not None:
+            objects = {obj.pk: obj for obj in queryset}
+            page = KeysetPage(
+                object_list=[
+                    objects[pk] for pk in self.cached_page["ids"] if pk in objects
+                ],
+                next_cursor=self.cached_page["next_cursor"],
+            )
+            return None, page, page.object_list, page.has_next()
+
+        result = super().paginate_queryset(queryset, page_size)
+        if self.page_cache_key:
+            page = result[1]
+            catalog_cache_set(
+                self.page_cache_key,
+                {"ids": [obj.pk for obj in page], "next_cursor": page.next_cursor},
+            )
+        return result
+
+    def get_result_count(self, queryset) -> tuple[int, bool]:
+        def build():
+            if self.cached_page is not None:
+                return super(CatalogResultCacheMixin, self).get_result_count(
+                    self.get_catalog_queryset()
+                )
+            return super(CatalogResultCacheMixin, self).get_result_count(queryset)
+
+        result_count, is_estimate = self.catalog_cached(
+            "result_count",
+            self.get_catalog_params(),
+            build,
+            self.get_catalog_category_id(),
+        )
+        return result_count, is_estimate
+
+
+class DatabaseTimer:
+    """execute_wrapper, суммирующий время SQL-запросов."""
+
+    def __init__(self):
+        self.elapsed_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.elapsed_ms += (time.perf_counter() - start) * 1000
+
+
+class SearchAnalyticsMixin:
+    """
+    Записывает событие для каждого поиска в каталоге `catalog_kind`: запрос,
+    фильтры, количество результатов и время БД на формирование выдачи. Листание
+    следующих страниц (cursor) новым поиском не считается.
+    """
+
+    request: HttpRequest
+    catalog_kind: str
+
+    def get_search_event_filters(self) -> dict:
+        ignored = {"search", "cursor", "per_page"}
+        return {
+            key: value for key, value in self.request.GET.items() if key not in ignored
+        }
+
+    def get(self, request, *args, **kwargs):
+        search = request.GET.get("search", "").strip()
+        if not search or request.GET.get("cursor"):
+            return super().get(request, *args, **kwargs)
+
+        timer = DatabaseTimer()
+        with connection.execute_wrapper(timer):
+            response = super().get(request, *args, **kwargs)
+
+        search_event_record(
+            entity_type=self.catalog_kind,
+            query=search,
+            filters=self.get_search_event_filters(),
+            # Оценку планировщика в статистику не пишем, только точное число.
+            result_count=(
+                None
+                if response.context_data.get("result_count_is_estimate")
+                else response.context_data.get("result_count") or 0
+            ),
+            db_time_ms=timer.elapsed_ms,
+        )
+        return response
@@ -0,0 +1,282 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import models
+from exchange.models import Category
+from users.models import CustomUser
+
+
+class SearchDocument(models.Model):
+    """
+    Денормалізований пошуковий документ для наскрізного пошуку по сайту.
+
+    Для кожної активної послуги, активного проєкту і профілю виконавця зберігається
+    один рядок з назвою, текстом і посиланням, тож пошук по всьому сайту – це один
+    запит до GIN-індексу цієї таблиці. По ній же шукають каталоги послуг і
+    проєктів. Документи оновлюються сигналами, див. search.signals.
+    """
+
+    class EntityType(models.TextChoices):
+        SERVICE = "service", "послуга"
+        PROJECT = "project", "проєкт"
+        PROVIDER = "provider", "виконавець"
+
+    entity_type = models.CharField(
+        verbose_name="тип",
+        max_length=16,
+        choices=EntityType.choices,
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name="ID об'єкта",
+    )
+    title = models.CharField(
+        verbose_name="назва",
+        max_length=255,
+    )
+    body = models.TextField(
+        verbose_name="текст",
+        blank=True,
+    )
+    url = models.CharField(
+        verbose_name="посилання",
+        max_length=255,
+    )
+    category = models.ForeignKey(
+        verbose_name="рубрика",
+        to=Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    price = models.IntegerField(
+        verbose_name="вартість",
+        null=True,
+        blank=True,
+    )
+    # Генерована колонка: вектор рахується в тому ж INSERT/UPDATE, що й документ.
+    search_vector = models.GeneratedField(
+        verbose_name="пошуковий документ",
+        expression=SearchVector("title", weight="A", config="russian")
+        + SearchVector("body", weight="B", config="russian"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    updated = models.DateTimeField(
+        verbose_name="оновлено",
+        auto_now=True,
+    )
+
+    class Meta:
+        ordering = ["-updated"]
+        verbose_name = "пошуковий документ"
+        verbose_name_plural = "пошукові документи"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entity_type", "object_id"],
+                name="search_document_unique_object",
+            ),
+        ]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="search_document_vector_gin"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_entity_type_display()}: {self.title}"
+
+
+class SavedSearch(models.Model):
+    """
+    Збережений пошук: користувач отримує лист, коли з'являється нова послуга
+    або новий проєкт, що йому відповідає.
+
+    Пошук працює "навпаки": замість того щоб перевіряти всі збережені пошуки при
+    кожній новій публікації, в `terms` зберігаються лексеми запиту, і кандидати
+    знаходяться одним запитом `terms <@ лексеми_документа` по GIN-індексу.
+    """
+
+    class EntityType(models.TextChoices):
+        SERVICE = "service", "послуги"
+        PROJECT = "project", "проєкти"
+
+    user = models.ForeignKey(
+        verbose_name="користувач",
+        to=CustomUser,
+        on_delete=models.CASCADE,
+        related_name="saved_searches",
+    )
+    entity_type = models.CharField(
+        verbose_name="що шукати",
+        max_length=16,
+        choices=EntityType.choices,
+        default=EntityType.SERVICE,
+    )
+    query = models.CharField(
+        verbose_name="запит",
+        max_length=200,
+        blank=True,
+    )
+    category = models.ForeignKey(
+        verbose_name="рубрика",
+        to=Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    price_min = models.PositiveIntegerField(
+        verbose_name="ціна від",
+        null=True,
+        blank=True,
+    )
+    price_max = models.PositiveIntegerField(
+        verbose_name="ціна до",
+        null=True,
+        blank=True,
+    )
+    #
+    # terms - лексеми запиту (to_tsvector('russian', query)), заповнюються при
+    # збереженні, див. search.services.saved_search_create.
+    #
+    terms = ArrayField(
+        models.CharField(max_length=100),
+        verbose_name="лексеми",
+        default=list,
+        blank=True,
+        editable=False,
+    )
+    created = models.DateTimeField(
+        verbose_name="створений",
+        auto_now_add=True,
+    )
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "збережений пошук"
+        verbose_name_plural = "збережені пошуки"
+        indexes = [
+            GinIndex(fields=["terms"], name="saved_search_terms_gin"),
+            models.Index(
+                fields=["entity_type", "category"], name="saved_search_category_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return self.query or str(self.category or "")
+
+
+class SavedSearchMatch(models.Model):
+    """Нова публікація, що відповідає збереженому пошуку. Листи надсилаються
+    пачками періодичною задачею, див. search.tasks."""
+
+    saved_search = models.ForeignKey(
+        verbose_name="збережений пошук",
+        to=SavedSearch,
+        on_delete=models.CASCADE,
+        related_name="matches",
+    )
+    entity_type = models.CharField(
+        verbose_name="тип",
+        max_length=16,
+        choices=SavedSearch.EntityType.choices,
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name="ID об'єкта",
+    )
+    title = models.CharField(
+        verbose_name="назва",
+        max_length=255,
+    )
+    url = models.CharField(
+        verbose_name="посилання",
+        max_length=255,
+    )
+    is_sent = models.BooleanField(
+        verbose_name="надіслано",
+        default=False,
+    )
+    created = models.DateTimeField(
+        verbose_name="створено",
+        auto_now_add=True,
+    )
+
+    class Meta:
+        ordering = ["created"]
+        verbose_name = "збіг збереженого пошуку"
+        verbose_name_plural = "збіги збережених пошуків"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["saved_search", "entity_type", "object_id"],
+                name="saved_search_match_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["created"],
+                condition=models.Q(is_sent=False),
+                name="saved_search_match_unsent",
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class SearchStat(models.Model):
+    """
+    Почасова статистика пошуку по каталогах. Події пошуку пишуться в Redis stream
+    (search.services.search_event_record), а задача search.tasks.search_events_rollup
+    згортає їх у рядки цієї таблиці.
+    """
+
+    hour = models.DateTimeField(
+        verbose_name="година",
+    )
+    entity_type = models.CharField(
+        verbose_name="каталог",
+        max_length=16,
+        choices=SavedSearch.EntityType.choices,
+    )
+    query = models.CharField(
+        verbose_name="запит",
+        max_length=200,
+    )
+    filters = models.CharField(
+        verbose_name="фільтри",
+        max_length=200,
+        blank=True,
+    )
+    search_count = models.PositiveIntegerField(
+        verbose_name="пошуків",
+        default=0,
+    )
+    zero_result_count = models.PositiveIntegerField(
+        verbose_name="без результатів",
+        default=0,
+    )
+    result_count = models.PositiveBigIntegerField(
+        verbose_name="сума результатів",
+        default=0,
+    )
+    total_time_ms = models.FloatField(
+        verbose_name="сумарний час БД, мс",
+        default=0,
+    )
+    max_time_ms = models.FloatField(
+        verbose_name="максимальний час БД, мс",
+        default=0,
+    )
+
+    class Meta:
+        ordering = ["-hour"]
+        verbose_name = "статистика пошуку"
+        verbose_name_plural = "статистика пошуку"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["hour", "entity_type", "query", "filters"],
+                name="search_stat_unique_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.hour:%Y-%m-%d %H:00} {self.query}"
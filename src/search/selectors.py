@@ -0,0 +1,328 @@
+import hashlib
+import json
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    F,
+    FloatField,
+    Func,
+    Max,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast
+from django.urls import reverse
+from django.utils.http import urlencode
+from django_project.rds import redis
+from exchange.selectors import category_path_ids
+
+from search.models import SavedSearch, SearchDocument, SearchStat
+
+# Если полнотекстовый поиск нашёл меньше результатов, подключается нечёткий поиск.
+SEARCH_FUZZY_MIN_RESULTS = 3
+
+#
+# Префиксный индекс подсказок живёт в Redis:
+#   AUTOCOMPLETE_TITLES_KEY – sorted set с одинаковым score, элементы
+#       "<нормализованная фраза>\0<тип>\0<id>\0<подпись>", поиск по префиксу
+#       через ZRANGEBYLEX;
+#   AUTOCOMPLETE_QUERIES_KEY.format(prefix=...) – популярные запросы для префикса,
+#       score – количество поисков;
+#   AUTOCOMPLETE_QUERY_COUNTS_KEY.format(day=...) – счётчики всех запросов за
+#       сутки; в подсказки запрос попадает, только набрав порог за день.
+#
+AUTOCOMPLETE_TITLES_KEY = "autocomplete:titles"
+AUTOCOMPLETE_MEMBERS_KEY = "autocomplete:members:{kind}:{object_id}"
+AUTOCOMPLETE_QUERIES_KEY = "autocomplete:queries:{prefix}"
+AUTOCOMPLETE_QUERY_COUNTS_KEY = "autocomplete:query_counts:{day}"
+AUTOCOMPLETE_MIN_PREFIX = 2
+AUTOCOMPLETE_MAX_PREFIX = 20
+AUTOCOMPLETE_LIMIT = 10
+
+#
+# Кэш выдачи каталога. Ключ включает номер версии: общей для каталога
+# (CATALOG_VERSION_KEY) или рубрики (CATALOG_CATEGORY_VERSION_KEY). Сохранение и
+# удаление услуги/проекта увеличивает версии, и старые ключи просто истекают.
+#
+CATALOG_VERSION_KEY = "catalog:{kind}:version"
+CATALOG_CATEGORY_VERSION_KEY = "catalog:{kind}:category:{category_id}:version"
+CATALOG_CACHE_KEY = "catalog:{kind}:{part}:{version}:{digest}"
+CATALOG_CACHE_TIMEOUT = 300
+
+# Поток событий поиска и группа его потребителя (см. search.tasks).
+SEARCH_EVENTS_STREAM = "search:events"
+SEARCH_EVENTS_GROUP = "rollup"
+SEARCH_EVENTS_MAXLEN = 100_000
+
+
+def search_document_list(search: str, entity_type: str | None = None) -> QuerySet:
+    """Ранжированный поиск по всем типам документов (или по одному типу)."""
+    search_query = SearchQuery(search, config="russian")
+    queryset = SearchDocument.objects.filter(search_vector=search_query)
+
+    if entity_type:
+        queryset = queryset.filter(entity_type=entity_type)
+
+    return queryset.annotate(
+        rank=SearchRank(F("search_vector"), search_query)
+    ).order_by("-rank", "-updated")
+
+
+def search_document_facets(search: str) -> dict[str, int]:
+    """Количество найденных документов каждого типа – один GROUP BY по GIN-индексу."""
+    rows = (
+        SearchDocument.objects.filter(
+            search_vector=SearchQuery(search, config="russian")
+        )
+        .values("entity_type")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    return {row["entity_type"]: row["count"] for row in rows}
+
+
+def search_document_ranked(
+    queryset: QuerySet, entity_type: str, search: str
+) -> QuerySet:
+    """
+    Строки каталога `queryset`, найденные по поисковым документам типа
+    `entity_type` (GIN-индекс общей таблицы), с рангом документа в `rank`.
+    Векторы самих услуг и проектов на лету не считаются. Документы есть только
+    у активных публикаций.
+    """
+    search_query = SearchQuery(search, config="russian")
+    documents = SearchDocument.objects.filter(
+        entity_type=entity_type, search_vector=search_query
+    )
+    # ts_rank возвращает real; ранг попадает в курсор пагинации, поэтому
+    # приводим его к double precision, который точно переживает float Python.
+    document_rank = documents.filter(object_id=OuterRef("pk")).annotate(
+        rank=Cast(SearchRank(F("search_vector"), search_query), FloatField())
+    )
+    return (
+        queryset.filter(id__in=documents.values("object_id"))
+        .annotate(rank=Subquery(document_rank.values("rank")[:1]))
+        .filter(rank__gte=0.1)
+        .order_by("-rank")
+    )
+
+
+def search_with_trigram_fallback(
+    fulltext: QuerySet, queryset: QuerySet, search: str, field: str = "title"
+) -> QuerySet:
+    """
+    Возвращает результаты полнотекстового поиска `fulltext`, если их достаточно.
+
+    Если полнотекстовый поиск не нашёл ничего или почти ничего (опечатки,
+    транслитерация, украинские формы слов при конфигурации "russian"), ищет по
+    `queryset` нечётко: оператор pg_trgm `%>` по полю `field` использует
+    триграммный GIN-индекс, поэтому последовательного сканирования, как при
+    ILIKE, не будет. Найденное полнотекстовым поиском остаётся в начале выдачи.
+    """
+    fulltext_ids = list(
+        fulltext.values_list("pk", flat=True)[:SEARCH_FUZZY_MIN_RESULTS]
+    )
+    if len(fulltext_ids) >= SEARCH_FUZZY_MIN_RESULTS:
+        return fulltext
+
+    return (
+        queryset.filter(
+            Q(pk__in=fulltext_ids) | Q(**{f"{field}__trigram_word_similar": search})
+        )
+        .annotate(
+            rank=Case(
+                When(pk__in=fulltext_ids, then=Value(1.0)),
+                # similarity() возвращает real – см. search_document_ranked.
+                default=Cast(TrigramWordSimilarity(search, field), FloatField()),
+                output_field=FloatField(),
+            )
+        )
+        .order_by("-rank")
+    )
+
+
+def autocomplete_normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def autocomplete_suggestions(
+    prefix: str, limit: int = AUTOCOMPLETE_LIMIT
+) -> list[dict[str, str]]:
+    """
+    Подсказки для строки поиска: популярные запросы, названия услуг и рубрик,
+    начинающиеся с `prefix`. Один round trip в Redis, без запросов к БД.
+    """
+    prefix = autocomplete_normalize(prefix)
+    if len(prefix) < AUTOCOMPLETE_MIN_PREFIX:
+        return []
+
+    encoded = prefix.encode()
+    pipeline = redis.pipeline(transaction=False)
+    pipeline.zrevrange(
+        AUTOCOMPLETE_QUERIES_KEY.format(prefix=prefix[:AUTOCOMPLETE_MAX_PREFIX]),
+        0,
+        limit - 1,
+    )
+    pipeline.zrangebylex(
+        AUTOCOMPLETE_TITLES_KEY,
+        b"[" + encoded,
+        b"[" + encoded + b"\xff",
+        start=0,
+        num=limit * 2,
+    )
+    queries, titles = pipeline.execute()
+
+    list_url = reverse("services:list")
+    suggestions = []
+    seen = set()
+    for query in queries:
+        query = query.decode()
+        if query.startswith(prefix):
+            suggestions.append(
+                {
+                    "kind": "query",
+                    "label": query,
+                    "url": f"{list_url}?{urlencode({'search': query})}",
+                }
+            )
+
+    for member in titles:
+        _, kind, object_id, label = member.decode().split("\0", 3)
+        if (kind, object_id) in seen:
+            continue
+        seen.add((kind, object_id))
+        if kind == "service":
+            url = reverse("services:detail", kwargs={"pk": object_id})
+        else:
+            url = f"{list_url}?{urlencode({'category_id': object_id})}"
+        suggestions.append({"kind": kind, "label": label, "url": url})
+
+    return suggestions[:limit]
+
+
+def catalog_version(kind: str, category_id: int | str | None = None) -> str:
+    if category_id:
+        key = CATALOG_CATEGORY_VERSION_KEY.format(kind=kind, category_id=category_id)
+        prefix = "c"
+    else:
+        key = CATALOG_VERSION_KEY.format(kind=kind)
+        prefix = "g"
+    return f"{prefix}{int(redis.get(key) or 0)}"
+
+
+def catalog_cache_key(
+    kind: str, part: str, params: dict, category_id: int | str | None = None
+) -> str:
+    """
+    Ключ кэша для части ответа (`part`: страница, фасеты, количество). Если
+    задана рубрика, ключ зависит от её версии, иначе – от версии всего каталога.
+    """
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return CATALOG_CACHE_KEY.format(
+        kind=kind,
+        part=part,
+        version=catalog_version(kind, category_id),
+        digest=digest,
+    )
+
+
+def catalog_cache_get(key: str):
+    value = redis.get(key)
+    return None if value is None else json.loads(value)
+
+
+def saved_search_list(user_id: int) -> QuerySet:
+    return SavedSearch.objects.filter(user_id=user_id).select_related("category")
+
+
+def search_document_lexemes(entity_type: str, object_id: int) -> dict | None:
+    """Документ услуги или проекта вместе с массивом его лексем."""
+    return (
+        SearchDocument.objects.filter(entity_type=entity_type, object_id=object_id)
+        .annotate(
+            lexemes=Func(
+                F("search_vector"),
+                function="tsvector_to_array",
+                output_field=ArrayField(CharField()),
+            )
+        )
+        .values("title", "url", "category_id", "price", "lexemes")
+        .first()
+    )
+
+
+def search_query_lexemes(query: str) -> list[str]:
+    """Лексемы запроса по тому же словарю, что и у поисковых документов
+    (стоп-слова отбрасываются)."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT tsvector_to_array(to_tsvector('russian', %s))", [query])
+        return cursor.fetchone()[0]
+
+
+def saved_search_candidates(
+    entity_type: str,
+    lexemes: list[str],
+    category_id: int | None,
+    price: int | None,
+) -> QuerySet:
+    """
+    Збережені пошуки, яким відповідає документ: всі лексеми запиту є в документі
+    (`terms <@ lexemes`, GIN-індекс), рубрика документа входить у рубрику пошуку
+    (або збігається з нею), ціна в межах фільтрів.
+    """
+    queryset = (
+        SavedSearch.objects.filter(
+            entity_type=entity_type, terms__contained_by=lexemes
+        ).filter(
+            Q(category__isnull=True)
+            | Q(category_id__in=category_path_ids([category_id]))
+        )
+        # Пустой массив входит в любой – поиск без лексем и без рубрики
+        # совпадал бы со всеми публикациями.
+        .exclude(terms=[], category__isnull=True)
+    )
+
+    if price is not None:
+        queryset = queryset.filter(
+            Q(price_min__isnull=True) | Q(price_min__lte=price),
+            Q(price_max__isnull=True) | Q(price_max__gte=price),
+        )
+    return queryset
+
+
+def search_stat_report(since, limit: int = 20) -> dict[str, list[dict]]:
+    """Самые медленные запросы (по среднему времени БД) и запросы без
+    результатов за период начиная с `since`."""
+    rows = (
+        SearchStat.objects.filter(hour__gte=since)
+        .values("entity_type", "query")
+        .annotate(
+            searches=Sum("search_count"),
+            zero_results=Sum("zero_result_count"),
+            total_time_ms=Sum("total_time_ms"),
+            max_time_ms=Max("max_time_ms"),
+        )
+        .annotate(avg_time_ms=F("total_time_ms") / F("searches"))
+    )
+    return {
+        "slowest": list(rows.order_by("-avg_time_ms")[:limit]),
+        "zero_results": list(
+            rows.filter(zero_results__gt=0).order_by("-zero_results")[:limit]
+        ),
+    }
@@ -0,0 +1,495 @@
+import datetime
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import redis as _redis
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import SearchVector
+from django.core.mail import send_mass_mail
+from django.db import transaction
+from django.db.models import CharField, F, Func, QuerySet
+from django.db.models.functions import Greatest
+from django.urls import reverse
+from django.utils.http import urlencode
+from django_project.rds import redis
+from exchange.models import Category
+from exchange.selectors import category_path_ids
+from projects.models import Project
+from services.models import Service
+from users.models import CustomUser
+
+from search.models import SavedSearch, SavedSearchMatch, SearchDocument, SearchStat
+from search.selectors import (
+    AUTOCOMPLETE_MAX_PREFIX,
+    AUTOCOMPLETE_MEMBERS_KEY,
+    AUTOCOMPLETE_MIN_PREFIX,
+    AUTOCOMPLETE_QUERIES_KEY,
+    AUTOCOMPLETE_QUERY_COUNTS_KEY,
+    AUTOCOMPLETE_TITLES_KEY,
+    CATALOG_CACHE_TIMEOUT,
+    CATALOG_CATEGORY_VERSION_KEY,
+    CATALOG_VERSION_KEY,
+    SEARCH_EVENTS_GROUP,
+    SEARCH_EVENTS_MAXLEN,
+    SEARCH_EVENTS_STREAM,
+    autocomplete_normalize,
+    saved_search_candidates,
+    search_document_lexemes,
+)
+
+# Сколько популярных запросов хранить на каждый префикс.
+AUTOCOMPLETE_QUERIES_PER_PREFIX = 50
+# Запрос показывается в подсказках, только если его искали столько раз за сутки.
+AUTOCOMPLETE_QUERY_MIN_COUNT = 3
+# Сколько разных запросов считать за сутки: реже всего встречавшиеся вытесняются.
+AUTOCOMPLETE_QUERY_COUNTS_MAX = 10_000
+# Популярные запросы, которые давно не искали, пропадают из подсказок.
+AUTOCOMPLETE_QUERIES_TTL = 30 * 24 * 60 * 60
+# Подсказка ищется и по началу названия, и по началу каждого из первых слов.
+AUTOCOMPLETE_MAX_WORDS = 6
+
+UPSERT_FIELDS = [
+    "title",
+    "body",
+    "url",
+    "category",
+    "price",
+    "updated",
+]
+
+
+def search_document_build_for_service(service: Service) -> SearchDocument | None:
+    """Возвращает документ услуги, или None, если услуга не должна находиться поиском."""
+    if not service.is_active:
+        return None
+    return SearchDocument(
+        entity_type=SearchDocument.EntityType.SERVICE,
+        object_id=service.pk,
+        title=service.title,
+        body=service.description,
+        url=reverse("services:detail", kwargs={"pk": service.pk}),
+        category_id=service.category_id,
+        price=service.price,
+    )
+
+
+def search_document_build_for_project(project: Project) -> SearchDocument | None:
+    """Возвращает документ проекта, или None, если проект не должен находиться поиском."""
+    if not project.is_active:
+        return None
+    return SearchDocument(
+        entity_type=SearchDocument.EntityType.PROJECT,
+        object_id=project.pk,
+        title=project.title,
+        body=project.description,
+        url=reverse("projects:detail", kwargs={"pk": project.pk}),
+        category_id=project.category_id,
+        price=project.price,
+    )
+
+
+def search_document_build_for_provider(user: CustomUser) -> SearchDocument | None:
+    """Возвращает документ профиля исполнителя. Профили без специальности, навыков
+    и описания не индексируются – искать в них нечего."""
+    if not user.is_active or not (user.speciality or user.skills or user.description):
+        return None
+    body = " ".join(
+        part
+        for part in [user.speciality, " ".join(user.skills or []), user.description]
+        if part
+    )
+    return SearchDocument(
+        entity_type=SearchDocument.EntityType.PROVIDER,
+        object_id=user.pk,
+        title=user.full_name or user.username,
+        body=body,
+        url=reverse("users:public_profile", kwargs={"username": user.username}),
+    )
+
+
+def search_document_bulk_upsert(documents: list[SearchDocument]) -> None:
+    """Вставляет или обновляет документы одним INSERT ... ON CONFLICT; поисковый
+    вектор – генерируемая колонка, Postgres пересчитывает его в той же записи."""
+    if not documents:
+        return
+
+    SearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["entity_type", "object_id"],
+        update_fields=UPSERT_FIELDS,
+    )
+
+
+def search_document_delete(entity_type: str, object_id: int) -> None:
+    SearchDocument.objects.filter(entity_type=entity_type, object_id=object_id).delete()
+
+
+def search_document_save(
+    entity_type: str, object_id: int, document: SearchDocument | None
+) -> None:
+    """Создаёт или обновляет документ объекта; удаляет его, если document is None."""
+    if document is None:
+        search_document_delete(entity_type=entity_type, object_id=object_id)
+    else:
+        search_document_bulk_upsert([document])
+
+
+@transaction.atomic
+def search_document_rebuild(batch_size: int = 1000) -> int:
+    """Полностью перестраивает таблицу документов по услугам, проектам и профилям.
+    Возвращает количество проиндексированных документов."""
+    SearchDocument.objects.all().delete()
+
+    sources: list[tuple[QuerySet, Callable[[Any], SearchDocument | None]]] = [
+        (Service.objects.filter(is_active=True), search_document_build_for_service),
+        (Project.objects.filter(is_active=True), search_document_build_for_project),
+        (CustomUser.objects.filter(is_active=True), search_document_build_for_provider),
+    ]
+
+    total = 0
+    for queryset, build in sources:
+        batch = []
+        for obj in queryset.iterator(chunk_size=batch_size):
+            document = build(obj)
+            if document is not None:
+                batch.append(document)
+            if len(batch) >= batch_size:
+                search_document_bulk_upsert(batch)
+                total += len(batch)
+                batch = []
+        search_document_bulk_upsert(batch)
+        total += len(batch)
+
+    return total
+
+
+def _autocomplete_members(kind: str, object_id: int, title: str) -> list[str]:
+    words = autocomplete_normalize(title).split()[:AUTOCOMPLETE_MAX_WORDS]
+    label = " ".join(title.split())
+    return [
+        f"{' '.join(words[i:])}\0{kind}\0{object_id}\0{label}"
+        for i in range(len(words))
+    ]
+
+
+def autocomplete_index(kind: str, object_id: int, title: str | None) -> None:
+    """Заменяет подсказки объекта в префиксном индексе. Если title пустой – только
+    удаляет старые подсказки (например, для неактивной или удалённой услуги)."""
+    members_key = AUTOCOMPLETE_MEMBERS_KEY.format(kind=kind, object_id=object_id)
+    old_members = redis.smembers(members_key)
+
+    pipeline = redis.pipeline()
+    if old_members:
+        pipeline.zrem(AUTOCOMPLETE_TITLES_KEY, *old_members)
+        pipeline.delete(members_key)
+    if title:
+        members = _autocomplete_members(kind, object_id, title)
+        pipeline.zadd(AUTOCOMPLETE_TITLES_KEY, {member: 0 for member in members})
+        pipeline.sadd(members_key, *members)
+    pipeline.execute()
+
+
+def autocomplete_index_service(service: Service) -> None:
+    autocomplete_index(
+        "service", service.pk, service.title if service.is_active else None
+    )
+
+
+def autocomplete_index_category(category: Category) -> None:
+    autocomplete_index("category", category.pk, category.title)
+
+
+def autocomplete_record_query(search: str) -> None:
+    """
+    Учитывает запрос в популярных. Сначала запрос считается в суточном счётчике
+    (ограничен AUTOCOMPLETE_QUERY_COUNTS_MAX запросами); в подсказки для каждого
+    префикса он попадает, только набрав AUTOCOMPLETE_QUERY_MIN_COUNT поисков за
+    день, поэтому единичные запросы посетителям не показываются. Все ключи
+    с TTL, так что индекс не растёт бесконечно.
+    """
+    query = autocomplete_normalize(search)
+    if len(query) < AUTOCOMPLETE_MIN_PREFIX:
+        return
+
+    counts_key = AUTOCOMPLETE_QUERY_COUNTS_KEY.format(day=datetime.date.today())
+    pipeline = redis.pipeline()
+    pipeline.zincrby(counts_key, 1, query)
+    pipeline.zremrangebyrank(counts_key, 0, -AUTOCOMPLETE_QUERY_COUNTS_MAX - 1)
+    pipeline.expire(counts_key, 2 * 24 * 60 * 60)
+    count = pipeline.execute()[0]
+    if count < AUTOCOMPLETE_QUERY_MIN_COUNT:
+        return
+
+    pipeline = redis.pipeline(transaction=False)
+    for length in range(
+        AUTOCOMPLETE_MIN_PREFIX, min(len(query), AUTOCOMPLETE_MAX_PREFIX) + 1
+    ):
+        key = AUTOCOMPLETE_QUERIES_KEY.format(prefix=query[:length])
+        pipeline.zincrby(key, 1, query)
+        pipeline.zremrangebyrank(key, 0, -AUTOCOMPLETE_QUERIES_PER_PREFIX - 1)
+        pipeline.expire(key, AUTOCOMPLETE_QUERIES_TTL)
+    pipeline.execute()
+
+
+def autocomplete_rebuild() -> int:
+    """Перестраивает индекс подсказок по названиям активных услуг и рубрик.
+    Популярные запросы сохраняются. Возвращает количество проиндексированных объектов.
+    """
+    stale_keys = [AUTOCOMPLETE_TITLES_KEY]
+    stale_keys += redis.scan_iter(
+        match=AUTOCOMPLETE_MEMBERS_KEY.format(kind="*", object_id="*")
+    )
+    redis.delete(*stale_keys)
+
+    total = 0
+    for service in (
+        Service.objects.filter(is_active=True)
+        .only("id", "title", "is_active")
+        .iterator()
+    ):
+        autocomplete_index_service(service)
+        total += 1
+    for category in Category.objects.only("id", "title").iterator():
+        autocomplete_index_category(category)
+        total += 1
+    return total
+
+
+def catalog_cache_set(key: str, value, timeout: int = CATALOG_CACHE_TIMEOUT) -> None:
+    redis.set(key, json.dumps(value), ex=timeout)
+
+
+def catalog_version_bump(kind: str, category_ids) -> None:
+    """
+    Сбрасывает кэш выдачи: общий для каталога `kind` и для указанных рубрик
+    вместе с их предками – выдача рубрики включает все подрубрики. Версии
+    увеличиваются сразу и ещё раз после коммита: выдача, закэшированная
+    параллельным запросом до коммита по устаревшим строкам, после коммита уже
+    не используется.
+    """
+    keys = [CATALOG_VERSION_KEY.format(kind=kind)] + [
+        CATALOG_CATEGORY_VERSION_KEY.format(kind=kind, category_id=category_id)
+        for category_id in category_path_ids(
+            [category_id for category_id in category_ids if category_id]
+        )
+    ]
+
+    def bump():
+        pipeline = redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.incr(key)
+        pipeline.execute()
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def saved_search_create(
+    user: CustomUser,
+    entity_type: str,
+    query: str = "",
+    category: Category | None = None,
+    price_min: int | None = None,
+    price_max: int | None = None,
+) -> SavedSearch:
+    saved_search = SavedSearch.objects.create(
+        user=user,
+        entity_type=entity_type,
+        query=" ".join(query.split()),
+        category=category,
+        price_min=price_min,
+        price_max=price_max,
+    )
+    # Лексемы считает Postgres тем же словарём, что и поисковые документы.
+    SavedSearch.objects.filter(pk=saved_search.pk).update(
+        terms=Func(
+            SearchVector("query", config="russian"),
+            function="tsvector_to_array",
+            output_field=ArrayField(CharField()),
+        )
+    )
+    saved_search.refresh_from_db(fields=["terms"])
+    return saved_search
+
+
+def saved_search_match(entity_type: str, object_id: int, owner_id: int) -> int:
+    """
+    Находит сохранённые поиски, которым соответствует новая услуга или проект,
+    и откладывает совпадения для рассылки. Возвращает количество совпадений.
+    """
+    document = search_document_lexemes(entity_type, object_id)
+    if document is None:
+        return 0
+
+    candidates = saved_search_candidates(
+        entity_type=entity_type,
+        lexemes=document["lexemes"],
+        category_id=document["category_id"],
+        price=document["price"],
+    ).exclude(user_id=owner_id)
+
+    matches = SavedSearchMatch.objects.bulk_create(
+        [
+            SavedSearchMatch(
+                saved_search_id=saved_search_id,
+                entity_type=entity_type,
+                object_id=object_id,
+                title=document["title"][:255],
+                url=document["url"],
+            )
+            for saved_search_id in candidates.values_list("id", flat=True)
+        ],
+        ignore_conflicts=True,
+    )
+    return len(matches)
+
+
+@transaction.atomic
+def saved_search_send_notifications(batch_size: int = 1000) -> int:
+    """
+    Рассылает неотправленные совпадения: одно письмо на пользователя со всеми
+    найденными для него публикациями, все письма – через одно SMTP-соединение.
+    Возвращает количество отправленных писем.
+    """
+    matches = list(
+        SavedSearchMatch.objects.filter(is_sent=False)
+        .select_related("saved_search__user")
+        .select_for_update(skip_locked=True, of=("self",))
+        .order_by("created")[:batch_size]
+    )
+    if not matches:
+        return 0
+
+    by_user: dict[CustomUser, list[SavedSearchMatch]] = {}
+    for match in matches:
+        by_user.setdefault(match.saved_search.user, []).append(match)
+
+    site_url = settings.SITE_URL.rstrip("/")
+    messages = []
+    for user, user_matches in by_user.items():
+        if not user.email:
+            continue
+        lines = [
+            f"{match.title}\n{site_url}{match.url}"
+            for match in {
+                (m.entity_type, m.object_id): m for m in user_matches
+            }.values()
+        ]
+        messages.append(
+            (
+                "Нові публікації за вашими збереженими пошуками",
+                "За вашими збереженими пошуками з'явилися нові публікації:\n\n"
+                + "\n\n".join(lines),
+                None,
+                [user.email],
+            )
+        )
+
+    send_mass_mail(messages, fail_silently=False)
+    SavedSearchMatch.objects.filter(pk__in=[match.pk for match in matches]).update(
+        is_sent=True
+    )
+    return len(messages)
+
+
+def search_event_record(
+    entity_type: str,
+    query: str,
+    filters: dict,
+    result_count: int | None,
+    db_time_ms: float,
+) -> None:
+    """Пишет событие поиска в Redis stream – один XADD, без обращения к БД.
+    Поток ограничен по длине, поэтому при остановленном потребителе не растёт.
+    `result_count=None` – точное количество неизвестно, в сумму не входит."""
+    redis.xadd(
+        SEARCH_EVENTS_STREAM,
+        {
+            "ts": int(time.time()),
+            "type": entity_type,
+            "q": autocomplete_normalize(query)[:200],
+            "f": urlencode(sorted((k, v) for k, v in filters.items() if v))[:200],
+            "n": "" if result_count is None else result_count,
+            "ms": round(db_time_ms, 2),
+        },
+        maxlen=SEARCH_EVENTS_MAXLEN,
+        approximate=True,
+    )
+
+
+def _search_events_read(batch_size: int, pending: bool = False) -> list[tuple]:
+    """Новые события группы или (pending=True) уже выданные этому потребителю,
+    но не подтверждённые – например, если предыдущий запуск упал до XACK."""
+    response = redis.xreadgroup(
+        SEARCH_EVENTS_GROUP,
+        "worker",
+        {SEARCH_EVENTS_STREAM: "0" if pending else ">"},
+        count=batch_size,
+    )
+    return response[0][1] if response else []
+
+
+def _search_events_rollup_batch(events: list[tuple]) -> None:
+    buckets: dict[tuple, dict] = {}
+    for _, event in events:
+        if not event:
+            # Событие выдано, но уже вытеснено из потока по MAXLEN.
+            continue
+        event = {key.decode(): value.decode() for key, value in event.items()}
+        hour = datetime.datetime.fromtimestamp(
+            int(event["ts"]), tz=datetime.timezone.utc
+        ).replace(minute=0, second=0)
+        bucket = buckets.setdefault(
+            (hour, event["type"], event["q"], event["f"]),
+            {"searches": 0, "zero": 0, "results": 0, "time": 0.0, "max": 0.0},
+        )
+        bucket["searches"] += 1
+        if event["n"]:
+            bucket["zero"] += int(event["n"]) == 0
+            bucket["results"] += int(event["n"])
+        bucket["time"] += float(event["ms"])
+        bucket["max"] = max(bucket["max"], float(event["ms"]))
+
+    with transaction.atomic():
+        for (hour, entity_type, query, filters), bucket in buckets.items():
+            stat, _ = SearchStat.objects.select_for_update().get_or_create(
+                hour=hour, entity_type=entity_type, query=query, filters=filters
+            )
+            SearchStat.objects.filter(pk=stat.pk).update(
+                search_count=F("search_count") + bucket["searches"],
+                zero_result_count=F("zero_result_count") + bucket["zero"],
+                result_count=F("result_count") + bucket["results"],
+                total_time_ms=F("total_time_ms") + bucket["time"],
+                max_time_ms=Greatest("max_time_ms", bucket["max"]),
+            )
+
+    event_ids = [event_id for event_id, _ in events]
+    redis.xack(SEARCH_EVENTS_STREAM, SEARCH_EVENTS_GROUP, *event_ids)
+    redis.xdel(SEARCH_EVENTS_STREAM, *event_ids)
+
+
+def search_events_rollup(batch_size: int = 1000) -> int:
+    """
+    Забирает события из потока и добавляет их в почасовые строки SearchStat.
+    События подтверждаются (XACK) только после коммита. Каждый запуск сначала
+    дообрабатывает выданные, но не подтверждённые события, так что при падении
+    они будут обработаны повторно. Возвращает количество обработанных событий.
+    """
+    try:
+        redis.xgroup_create(
+            SEARCH_EVENTS_STREAM, SEARCH_EVENTS_GROUP, id="0", mkstream=True
+        )
+    except _redis.ResponseError:
+        pass  # BUSYGROUP: группа уже создана
+
+    processed = 0
+    for pending in (True, False):
+        while events := _search_events_read(batch_size, pending=pending):
+            _search_events_rollup_batch(events)
+            processed += len(events)
+
+    return processed
@@ -0,0 +1,191 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from exchange.models import Category
+from orders.models import Order
+from projects.models import Project
+from services.models import Service
+from users.models import CustomUser
+
+from search.models import SavedSearch, SearchDocument
+from search.services import (
+    autocomplete_index,
+    autocomplete_index_category,
+    autocomplete_index_service,
+    catalog_version_bump,
+    search_document_build_for_project,
+    search_document_build_for_provider,
+    search_document_build_for_service,
+    search_document_delete,
+    search_document_save,
+)
+from search.tasks import saved_search_match_task
+
+# Поля, от которых зависит документ. Сохранения с update_fields без этих полей
+# (например, обновление last_login при входе) не трогают индекс.
+SERVICE_FIELDS = {"title", "description", "category", "price", "is_active"}
+PROJECT_FIELDS = {"title", "description", "category", "price", "is_active"}
+PROVIDER_FIELDS = {
+    "username",
+    "first_name",
+    "last_name",
+    "speciality",
+    "skills",
+    "description",
+    "is_active",
+}
+
+
+def _is_affected(update_fields, fields: set[str]) -> bool:
+    return update_fields is None or bool(fields & set(update_fields))
+
+
+@receiver(post_save, sender=Service)
+def search_document_service_saved(
+    sender, instance: Service, update_fields=None, **kwargs
+):
+    if _is_affected(update_fields, SERVICE_FIELDS):
+        search_document_save(
+            entity_type=SearchDocument.EntityType.SERVICE,
+            object_id=instance.pk,
+            document=search_document_build_for_service(instance),
+        )
+
+
+@receiver(post_save, sender=Service)
+def autocomplete_service_saved(sender, instance: Service, update_fields=None, **kwargs):
+    if _is_affected(update_fields, {"title", "is_active"}):
+        autocomplete_index_service(instance)
+
+
+@receiver(post_save, sender=Category)
+def autocomplete_category_saved(sender, instance: Category, **kwargs):
+    autocomplete_index_category(instance)
+
+
+@receiver(post_save, sender=Project)
+def search_document_project_saved(
+    sender, instance: Project, update_fields=None, **kwargs
+):
+    if _is_affected(update_fields, PROJECT_FIELDS):
+        search_document_save(
+            entity_type=SearchDocument.EntityType.PROJECT,
+            object_id=instance.pk,
+            document=search_document_build_for_project(instance),
+        )
+
+
+@receiver(post_save, sender=CustomUser)
+def search_document_provider_saved(
+    sender, instance: CustomUser, update_fields=None, **kwargs
+):
+    if _is_affected(update_fields, PROVIDER_FIELDS):
+        search_document_save(
+            entity_type=SearchDocument.EntityType.PROVIDER,
+            object_id=instance.pk,
+            document=search_document_build_for_provider(instance),
+        )
+
+
+@receiver(post_delete, sender=Service)
+def search_document_service_deleted(sender, instance: Service, **kwargs):
+    search_document_delete(SearchDocument.EntityType.SERVICE, instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+def search_document_project_deleted(sender, instance: Project, **kwargs):
+    search_document_delete(SearchDocument.EntityType.PROJECT, instance.pk)
+
+
+@receiver(post_delete, sender=CustomUser)
+def search_document_provider_deleted(sender, instance: CustomUser, **kwargs):
+    search_document_delete(SearchDocument.EntityType.PROVIDER, instance.pk)
+
+
+@receiver(post_delete, sender=Service)
+def autocomplete_service_deleted(sender, instance: Service, **kwargs):
+    autocomplete_index("service", instance.pk, None)
+
+
+@receiver(post_delete, sender=Category)
+def autocomplete_category_deleted(sender, instance: Category, **kwargs):
+    autocomplete_index("category", instance.pk, None)
+
+
+#
+# Версии кэша выдачи каталога. Прежнюю рубрику публикации запоминает
+# exchange.signals.publication_remember_saved, чтобы при переносе услуги
+# сбросить кэш обеих рубрик.
+#
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def catalog_service_changed(sender, instance: Service, **kwargs):
+    catalog_version_bump(
+        "service",
+        [instance.category_id, getattr(instance, "_saved_category_id", None)],
+    )
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def catalog_project_changed(sender, instance: Project, **kwargs):
+    catalog_version_bump(
+        "project",
+        [instance.category_id, getattr(instance, "_saved_category_id", None)],
+    )
+
+
+@receiver(pre_save, sender=Category)
+def catalog_remember_parent(sender, instance, **kwargs):
+    if instance.pk:
+        instance._catalog_old_parent_id = (
+            Category.objects.filter(pk=instance.pk)
+            .values_list("parent_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Category)
+def catalog_category_moved(sender, instance: Category, created=False, **kwargs):
+    """Перенос рубрики меняет выдачу прежних и новых предков."""
+    old_parent_id = getattr(instance, "_catalog_old_parent_id", None)
+    if not created and old_parent_id != instance.parent_id:
+        for kind in ("service", "project"):
+            catalog_version_bump(kind, [old_parent_id, instance.parent_id])
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def catalog_order_changed(sender, instance: Order, **kwargs):
+    """Проекты с заказом не показываются в каталоге."""
+    if instance.project_id:
+        category_id = (
+            Project.objects.filter(pk=instance.project_id)
+            .values_list("category_id", flat=True)
+            .first()
+        )
+        catalog_version_bump("project", [category_id])
+
+
+#
+# Сохранённые поиски: новая активная публикация проверяется в Celery после
+# коммита, когда поисковый документ уже записан.
+#
+@receiver(post_save, sender=Service)
+def saved_search_service_created(sender, instance: Service, created=False, **kwargs):
+    if created and instance.is_active:
+        transaction.on_commit(
+            lambda: saved_search_match_task.delay(
+                SavedSearch.EntityType.SERVICE, instance.pk, instance.provider_id
+            )
+        )
+
+
+@receiver(post_save, sender=Project)
+def saved_search_project_created(sender, instance: Project, created=False, **kwargs):
+    if created and instance.is_active:
+        transaction.on_commit(
+            lambda: saved_search_match_task.delay(
+                SavedSearch.EntityType.PROJECT, instance.pk, instance.customer_id
+            )
+        )
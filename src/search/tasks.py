@@ -0,0 +1,33 @@
+from celery import shared_task
+
+from search.services import (
+    saved_search_match,
+    saved_search_send_notifications,
+    search_document_rebuild,
+    search_events_rollup,
+)
+
+
+@shared_task
+def search_document_rebuild_all() -> int:
+    """Перестраивает все поисковые документы. Сигналы поддерживают таблицу в
+    актуальном состоянии, задача нужна для исправления расхождений после
+    массовых изменений в обход save() (QuerySet.update, loaddata и т.п.)."""
+    return search_document_rebuild()
+
+
+@shared_task
+def saved_search_match_task(entity_type: str, object_id: int, owner_id: int) -> int:
+    """Проверяет новую публикацию по кандидатам среди сохранённых поисков."""
+    return saved_search_match(entity_type, object_id, owner_id)
+
+
+@shared_task
+def saved_search_send_notifications_task() -> int:
+    return saved_search_send_notifications()
+
+
+@shared_task
+def search_events_rollup_task() -> int:
+    """Сворачивает события поиска из Redis stream в почасовую статистику."""
+    return search_events_rollup()
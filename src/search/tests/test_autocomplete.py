@@ -0,0 +1,71 @@
+from http import HTTPStatus
+
+from core.tests.factories import ServiceFactory
+from django.test import TestCase
+from django.urls import reverse
+from django_project.rds import redis
+
+from search.selectors import (
+    AUTOCOMPLETE_QUERIES_KEY,
+    AUTOCOMPLETE_QUERY_COUNTS_KEY,
+    autocomplete_suggestions,
+)
+from search.services import (
+    AUTOCOMPLETE_QUERY_MIN_COUNT,
+    autocomplete_rebuild,
+    autocomplete_record_query,
+)
+
+
+class AutocompleteTest(TestCase):
+    def setUp(self):
+        for pattern in (
+            AUTOCOMPLETE_QUERIES_KEY.format(prefix="*"),
+            AUTOCOMPLETE_QUERY_COUNTS_KEY.format(day="*"),
+        ):
+            for key in redis.scan_iter(match=pattern):
+                redis.delete(key)
+        self.service = ServiceFactory(title="Ремонт пральних машин")
+        autocomplete_rebuild()
+
+    def test_suggestions_match_title_and_word_prefix(self):
+        for prefix in ("рем", "ПРАЛЬ"):
+            labels = [s["label"] for s in autocomplete_suggestions(prefix)]
+            self.assertIn(self.service.title, labels)
+
+    def test_suggestions_follow_title_changes(self):
+        self.service.title = "Ремонт холодильників"
+        self.service.save()
+
+        labels = [s["label"] for s in autocomplete_suggestions("прал")]
+        self.assertNotIn("Ремонт пральних машин", labels)
+        self.assertIn(
+            "Ремонт холодильників",
+            [s["label"] for s in autocomplete_suggestions("холод")],
+        )
+
+        self.service.delete()
+        self.assertEqual(autocomplete_suggestions("холод"), [])
+
+    def test_popular_queries_come_first(self):
+        for _ in range(AUTOCOMPLETE_QUERY_MIN_COUNT - 1):
+            autocomplete_record_query("ремонт техніки")
+        # Редкий запрос посетителям не показывается.
+        self.assertNotIn("query", [s["kind"] for s in autocomplete_suggestions("рем")])
+
+        autocomplete_record_query("ремонт техніки")
+        suggestions = autocomplete_suggestions("рем")
+
+        self.assertEqual(suggestions[0]["kind"], "query")
+        self.assertEqual(suggestions[0]["label"], "ремонт техніки")
+        self.assertGreater(redis.ttl(AUTOCOMPLETE_QUERIES_KEY.format(prefix="рем")), 0)
+
+    def test_autocomplete_view(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("search:autocomplete"), {"q": "рем"})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json()["suggestions"][0]["url"],
+            reverse("services:detail", kwargs={"pk": self.service.pk}),
+        )
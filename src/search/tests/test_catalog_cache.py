@@ -0,0 +1,51 @@
+from core.tests.factories import ServiceFactory
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+class CatalogResultCacheTest(TestCase):
+    def setUp(self):
+        self.service = ServiceFactory(title="Ремонт пральних машин")
+        self.url = reverse("services:list")
+        self.params = {"search": "ремонт", "category_id": self.service.category_id}
+
+    def _get(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, self.params)
+        return response, len(queries)
+
+    def test_repeated_request_served_from_cache(self):
+        first, first_queries = self._get()
+        second, second_queries = self._get()
+
+        self.assertEqual(
+            list(first.context["service_list"]), list(second.context["service_list"])
+        )
+        self.assertEqual(second.context["result_count"], 1)
+        self.assertLess(second_queries, first_queries)
+
+    def test_save_invalidates_cache(self):
+        self._get()
+        ServiceFactory(title="Ремонт холодильників", category=self.service.category)
+
+        response, _ = self._get()
+
+        self.assertEqual(len(response.context["service_list"]), 2)
+        self.assertEqual(response.context["result_count"], 2)
+
+    def test_page_cached_before_commit_not_reused(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.service.title = "Ремонт холодильників"
+                self.service.save()
+                # Запрос во время транзакции кэширует выдачу под новой версией.
+                _, before_commit_queries = self._get()
+
+        response, after_commit_queries = self._get()
+        _, cached_queries = self._get()
+
+        self.assertEqual(response.context["service_list"][0].title, self.service.title)
+        self.assertEqual(after_commit_queries, before_commit_queries)
+        self.assertLess(cached_queries, after_commit_queries)
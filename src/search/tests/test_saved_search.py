@@ -0,0 +1,89 @@
+from core.tests.factories import CategoryFactory, CustomUserFactory, ServiceFactory
+from django.core import mail
+from django.test import TestCase
+from django.urls import reverse
+
+from search.forms import SavedSearchForm
+from search.models import SavedSearch, SavedSearchMatch
+from search.services import (
+    saved_search_create,
+    saved_search_match,
+    saved_search_send_notifications,
+)
+
+
+class SavedSearchMatchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUserFactory()
+        cls.category = CategoryFactory()
+        cls.matching = saved_search_create(
+            user=cls.user, entity_type="service", query="Ремонт пральних машин"
+        )
+        cls.other_category = saved_search_create(
+            user=cls.user,
+            entity_type="service",
+            query="ремонт",
+            category=CategoryFactory(),
+        )
+        cls.too_cheap = saved_search_create(
+            user=cls.user, entity_type="service", query="ремонт", price_max=100
+        )
+
+    def test_stopword_query_requires_category(self):
+        data = {"entity_type": "service", "query": "и в на"}
+        self.assertFalse(SavedSearchForm(data).is_valid())
+        self.assertTrue(
+            SavedSearchForm({**data, "category": self.category.pk}).is_valid()
+        )
+
+        # Такой поиск, сохранённый раньше, ни с чем не совпадает.
+        saved_search_create(user=self.user, entity_type="service", query="и в на")
+        service = ServiceFactory(title="Ремонт", price=500)
+        self.assertEqual(
+            saved_search_match("service", service.pk, service.provider_id), 0
+        )
+
+    def test_terms_are_lexemes(self):
+        self.assertCountEqual(self.matching.terms, ["ремонт", "пральн", "машин"])
+
+    def test_new_service_matches_only_candidates(self):
+        service = ServiceFactory(
+            title="Терміновий ремонт пральних машин",
+            category=self.category,
+            price=500,
+        )
+
+        self.assertEqual(
+            saved_search_match("service", service.pk, service.provider_id), 1
+        )
+        self.assertEqual(
+            list(SavedSearchMatch.objects.values_list("saved_search", flat=True)),
+            [self.matching.pk],
+        )
+
+    def test_notifications_sent_in_one_batch(self):
+        for title in ("Ремонт пральних машин", "Ремонт пральних машин вдома"):
+            service = ServiceFactory(title=title, price=500)
+            saved_search_match("service", service.pk, service.provider_id)
+
+        self.assertEqual(saved_search_send_notifications(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("вдома", mail.outbox[0].body)
+        self.assertFalse(SavedSearchMatch.objects.filter(is_sent=False).exists())
+
+
+class SavedSearchViewTest(TestCase):
+    def test_create_and_delete(self):
+        user = CustomUserFactory()
+        self.client.force_login(user)
+
+        self.client.post(
+            reverse("search:saved_create"),
+            {"entity_type": "project", "query": "дизайн сайту"},
+        )
+        saved_search = SavedSearch.objects.get(user=user)
+        self.assertEqual(saved_search.terms, ["дизайн", "сайт"])
+
+        self.client.post(reverse("search:saved_delete", kwargs={"pk": saved_search.pk}))
+        self.assertFalse(SavedSearch.objects.exists())
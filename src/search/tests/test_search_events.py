@@ -0,0 +1,67 @@
+from io import StringIO
+from unittest import mock
+
+from core.tests.factories import ProjectFactory, ServiceFactory
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import reverse
+from django_project.rds import redis
+
+from search.models import SearchStat
+from search.selectors import SEARCH_EVENTS_GROUP, SEARCH_EVENTS_STREAM
+from search.services import search_events_rollup
+
+
+class SearchEventsTest(TestCase):
+    def setUp(self):
+        redis.delete(SEARCH_EVENTS_STREAM)
+        ServiceFactory(title="Ремонт пральних машин")
+
+    def test_searches_rolled_up_hourly(self):
+        for search in ("ремонт", "Ремонт ", "кондитер"):
+            self.client.get(reverse("services:list"), {"search": search})
+
+        self.assertEqual(search_events_rollup(), 3)
+
+        repair = SearchStat.objects.get(query="ремонт")
+        self.assertEqual(repair.search_count, 2)
+        self.assertEqual(repair.zero_result_count, 0)
+        self.assertEqual(SearchStat.objects.get(query="кондитер").zero_result_count, 1)
+        self.assertGreater(repair.total_time_ms, 0)
+
+        out = StringIO()
+        call_command("search_report", stdout=out)
+        self.assertIn("кондитер", out.getvalue())
+
+    def test_failed_rollup_retried(self):
+        for search in ("ремонт", "ремонт", "кондитер"):
+            self.client.get(reverse("services:list"), {"search": search})
+
+        with mock.patch.object(
+            SearchStat.objects, "select_for_update", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                search_events_rollup()
+        self.assertFalse(SearchStat.objects.exists())
+
+        # Выданные, но не подтверждённые события обрабатываются при повторе.
+        self.assertEqual(search_events_rollup(), 3)
+        self.assertEqual(SearchStat.objects.get(query="ремонт").search_count, 2)
+        pending = redis.xpending(SEARCH_EVENTS_STREAM, SEARCH_EVENTS_GROUP)
+        self.assertEqual(pending["pending"], 0)
+
+    def test_estimated_count_not_recorded(self):
+        ProjectFactory(title="Ремонт даху")
+
+        with mock.patch(
+            "core.pagination.queryset_count_or_estimate", return_value=(20_000, True)
+        ):
+            response = self.client.get(reverse("projects:list"), {"search": "ремонт"})
+        self.assertContains(response, "≈ 20000")
+
+        self.assertEqual(search_events_rollup(), 1)
+        stat = SearchStat.objects.get(query="ремонт")
+        self.assertEqual(stat.search_count, 1)
+        self.assertEqual(stat.result_count, 0)
+        self.assertEqual(stat.zero_result_count, 0)
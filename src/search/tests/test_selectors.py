@@ -0,0 +1,60 @@
+from core.tests.factories import CustomUserFactory, ProjectFactory, ServiceFactory
+from django.test import TestCase
+from projects.selectors import project_list
+
+from search.models import SearchDocument
+from search.selectors import search_document_facets, search_document_list
+from search.services import search_document_rebuild
+
+
+class SearchDocumentTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = ServiceFactory(
+            title="Переклад документів", description="Переклад з англійської."
+        )
+        cls.project = ProjectFactory(
+            title="Потрібен переклад сайту", description="Переклад на українську."
+        )
+        cls.provider = CustomUserFactory(
+            speciality="Перекладач", skills=["переклад", "редагування"]
+        )
+        cls.other = ServiceFactory(title="Ремонт авто", description="Діагностика.")
+
+    def test_documents_created_on_save(self):
+        self.assertEqual(SearchDocument.objects.count(), 4)
+
+    def test_search_across_entity_types(self):
+        documents = search_document_list(search="переклад")
+
+        self.assertEqual(
+            {(d.entity_type, d.object_id) for d in documents},
+            {
+                (SearchDocument.EntityType.SERVICE, self.service.pk),
+                (SearchDocument.EntityType.PROJECT, self.project.pk),
+                (SearchDocument.EntityType.PROVIDER, self.provider.pk),
+            },
+        )
+
+    def test_facets(self):
+        self.assertEqual(
+            search_document_facets(search="переклад"),
+            {"service": 1, "project": 1, "provider": 1},
+        )
+
+    def test_inactive_service_removed(self):
+        self.service.is_active = False
+        self.service.save()
+
+        documents = search_document_list(search="переклад", entity_type="service")
+        self.assertFalse(documents.exists())
+
+    def test_project_list_search_uses_documents(self):
+        self.assertEqual(list(project_list(search="переклад")), [self.project])
+
+    def test_rebuild(self):
+        SearchDocument.objects.all().delete()
+        self.assertEqual(search_document_rebuild(), 4)
+        self.assertEqual(
+            search_document_list(search="ремонт").get().title, "Ремонт авто"
+        )
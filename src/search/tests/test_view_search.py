@@ -0,0 +1,27 @@
+from http import HTTPStatus
+
+from core.tests.factories import ProjectFactory, ServiceFactory
+from django.test import TestCase
+from django.urls import reverse
+
+
+class SearchViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = ServiceFactory(title="Дизайн логотипу")
+        cls.project = ProjectFactory(title="Потрібен дизайн сайту")
+
+    def test_search_view_shows_all_entity_types(self):
+        response = self.client.get(reverse("search:results"), {"search": "дизайн"})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, self.service.title)
+        self.assertContains(response, self.project.title)
+
+    def test_search_view_filters_by_type(self):
+        response = self.client.get(
+            reverse("search:results"), {"search": "дизайн", "type": "project"}
+        )
+
+        self.assertNotContains(response, self.service.title)
+        self.assertContains(response, self.project.title)
@@ -0,0 +1,18 @@
+from django.urls import path
+
+from search.views import (
+    AutocompleteView,
+    SavedSearchListView,
+    SearchView,
+    saved_search_create_view,
+    saved_search_delete_view,
+)
+
+app_name = "search"
+urlpatterns = [
+    path("", SearchView.as_view(), name="results"),
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+    path("saved/", SavedSearchListView.as_view(), name="saved_list"),
+    path("saved/create/", saved_search_create_view, name="saved_create"),
+    path("saved/delete/<int:pk>/", saved_search_delete_view, name="saved_delete"),
+]
@@ -0,0 +1,112 @@
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import redirect
+from django.urls import reverse_lazy
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views import View
+from django.views.decorators.http import require_POST
+from django.views.generic import ListView
+
+from search.forms import SavedSearchForm
+from search.models import SavedSearch, SearchDocument
+from search.selectors import (
+    autocomplete_suggestions,
+    saved_search_list,
+    search_document_facets,
+    search_document_list,
+)
+from search.services import saved_search_create
+
+SEARCH_RESULTS_LIMIT = 50
+
+
+class SearchView(ListView):
+    """Пошук по всьому сайту: послуги, проєкти та виконавці в одній видачі."""
+
+    model = SearchDocument
+    template_name = "search/search_results.html"
+
+    def get_queryset(self):
+        search = self.request.GET.get("search", "").strip()
+        if not search:
+            return SearchDocument.objects.none()
+
+        entity_type = self.request.GET.get("type", None)
+        if entity_type not in SearchDocument.EntityType.values:
+            entity_type = None
+
+        queryset = search_document_list(search=search, entity_type=entity_type)
+        return queryset.select_related("category")[:SEARCH_RESULTS_LIMIT]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        search = self.request.GET.get("search", "").strip()
+        facets = search_document_facets(search=search) if search else {}
+
+        context["search"] = search
+        context["entity_type"] = self.request.GET.get("type", None)
+        context["total"] = sum(facets.values())
+        context["facets"] = [
+            (value, label, facets.get(value, 0))
+            for value, label in SearchDocument.EntityType.choices
+        ]
+        return context
+
+
+class AutocompleteView(View):
+    """
+    Підказки для рядка пошуку. Відповідь не залежить від користувача, тому
+    в'юха не звертається до сесії й до request.user і не ходить у БД.
+    """
+
+    def get(self, request, *args, **kwargs):
+        prefix = request.GET.get("q", "")
+        response = JsonResponse({"suggestions": autocomplete_suggestions(prefix)})
+        response["Cache-Control"] = "public, max-age=60"
+        return response
+
+
+class SavedSearchListView(LoginRequiredMixin, ListView):
+    """Збережені пошуки користувача – сторінка "Збережені пошуки"."""
+
+    model = SavedSearch
+    template_name = "search/saved_search_list.html"
+
+    def get_queryset(self):
+        return saved_search_list(user_id=self.request.user.id)
+
+
+@require_POST
+@login_required
+def saved_search_create_view(request: HttpRequest) -> HttpResponse:
+    form = SavedSearchForm(request.POST)
+
+    if form.is_valid():
+        saved_search_create(user=request.user, **form.cleaned_data)
+        messages.success(
+            request, "Пошук збережено. Ми повідомимо вас про нові публікації."
+        )
+    else:
+        messages.warning(
+            request,
+            " ".join(map(str, form.non_field_errors())) or "Не вдалося зберегти пошук.",
+        )
+
+    next_url = request.POST.get("next", "")
+    if url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+    return redirect(reverse_lazy("search:saved_list"))
+
+
+@require_POST
+@login_required
+def saved_search_delete_view(request: HttpRequest, pk: int) -> HttpResponse:
+    deleted, _ = saved_search_list(user_id=request.user.id).filter(pk=pk).delete()
+    if not deleted:
+        raise Http404
+
+    messages.success(request, "Збережений пошук видалено.")
+    return redirect(reverse_lazy("search:saved_list"))
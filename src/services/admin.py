@@ -1,3 +1,4 @@
+from core.pagination import EstimatedCountPaginator
 from django.contrib import admin
 
 from services.models import Service
@@ -7,6 +8,8 @@ from services.models import Service
 class ServiceAdmin(admin.ModelAdmin):
 
     model = Service
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = [
         "title",
         "category",
@@ -0,0 +1,115 @@
+import random
+import statistics
+import time
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from exchange.models import Category
+from search.models import SearchDocument
+from search.services import (
+    search_document_build_for_service,
+    search_document_bulk_upsert,
+)
+from users.models import CustomUser
+
+from services.models import Service
+from services.selectors import service_list
+
+WORDS = (
+    "ремонт квартира дизайн логотип сайт розробка переклад текст прибирання "
+    "сантехнік електрик фото відео монтаж маркетинг реклама бухгалтерія "
+    "консультація юрист репетитор англійська математика програмування "
+    "верстка магазин доставка меблі збирання авто діагностика шиномонтаж "
+    "догляд тварини вигул собака кіт няня дитина масаж манікюр стрижка"
+).split()
+
+SYLLABLES = "ба ве ги до жу за ки ло му на по ри са ту фа хо ци че ша ю я".split()
+
+QUERIES = ["ремонт", "дизайн логотип", "переклад текст", "шиномонтаж"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает время поиска по услугам: вычисление SearchVector на лету "
+        "против таблицы поисковых документов с GIN-индексом. Тестовые данные "
+        "создаются внутри транзакции и откатываются после замера."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.populate(options["count"])
+            self.stdout.write(f"Услуг в каталоге: {Service.objects.count()}")
+            self.stdout.write(f"{'запрос':<20}{'на лету, мс':>14}{'индекс, мс':>14}")
+            for query in QUERIES:
+                legacy = self.measure(self.legacy_search(query), options["repeat"])
+                indexed = self.measure(service_list(search=query), options["repeat"])
+                self.stdout.write(f"{query:<20}{legacy:>14.1f}{indexed:>14.1f}")
+            transaction.set_rollback(True)
+
+    def populate(self, count: int) -> None:
+        rnd = random.Random(0)
+        provider = CustomUser.objects.create(username="search-benchmark")
+        category = Category.objects.create(title="search-benchmark")
+
+        # Словарь из реальных слов и тысяч "шумовых", чтобы каждый запрос
+        # совпадал с небольшой долей каталога, как в живых данных.
+        vocabulary = WORDS + [
+            "".join(rnd.choice(SYLLABLES) for _ in range(4)) for _ in range(20_000)
+        ]
+
+        def text(n: int) -> str:
+            return " ".join(rnd.choice(vocabulary) for _ in range(n))
+
+        Service.objects.bulk_create(
+            (
+                Service(
+                    provider=provider,
+                    category=category,
+                    title=text(4)[:70],
+                    description=text(40),
+                    requirements=text(10),
+                    price=rnd.randint(100, 10_000),
+                    term=rnd.randint(1, 30),
+                )
+                for _ in range(count)
+            ),
+            batch_size=5000,
+        )
+        # bulk_create не вызывает сигналы – документы создаются здесь.
+        batch = []
+        for service in Service.objects.filter(provider=provider).iterator(5000):
+            batch.append(search_document_build_for_service(service))
+            if len(batch) >= 5000:
+                search_document_bulk_upsert(batch)
+                batch = []
+        search_document_bulk_upsert(batch)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Service._meta.db_table}")
+            cursor.execute(f"ANALYZE {SearchDocument._meta.db_table}")
+
+    @staticmethod
+    def legacy_search(query: str):
+        """Поиск в том виде, в котором он был до появления поисковых документов."""
+        search_vector = SearchVector(
+            "title", weight="A", config="russian"
+        ) + SearchVector("description", weight="B", config="russian")
+        search_query = SearchQuery(query, config="russian")
+        return (
+            Service.objects.annotate(rank=SearchRank(search_vector, search_query))
+            .filter(rank__gte=0.1)
+            .order_by("-rank")
+        )
+
+    @staticmethod
+    def measure(queryset, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset.all()[:20])
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:22
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("services", "0004_alter_service_options_alter_service_category_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="service",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True, verbose_name="пошуковий документ"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="service_search_vector_gin"
+            ),
+        ),
+    ]
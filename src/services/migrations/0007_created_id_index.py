@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("services", "0006_title_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(fields=["created", "id"], name="service_created_id_idx"),
+        ),
+    ]
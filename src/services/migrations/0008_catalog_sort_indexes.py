@@ -0,0 +1,67 @@
+# Generated by Django 5.0.4 on 2026-10-18 08:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("services", "0007_created_id_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="service",
+            name="service_created_id_idx",
+        ),
+        migrations.AddField(
+            model_name="service",
+            name="view_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="перегляди"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "created", "id"], name="service_active_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "price", "id"], name="service_active_price_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "view_count", "id"],
+                name="service_active_views_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "category", "created", "id"],
+                name="service_cat_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "category", "price", "id"],
+                name="service_cat_price_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "category", "view_count", "id"],
+                name="service_cat_views_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exchange", "0003_alter_category_options_alter_chat_options_and_more"),
+        ("services", "0008_catalog_sort_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "term", "price"], name="service_active_term_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=models.Index(
+                fields=["is_active", "category", "term", "price"],
+                name="service_cat_term_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Обычную колонку нельзя превратить в генерируемую через ALTER, поэтому
+    search_vector пересоздаётся вместе с индексом; значения Postgres вычисляет
+    для всех строк при добавлении колонки."""
+
+    dependencies = [
+        ("services", "0009_range_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="service",
+            name="service_search_vector_gin",
+        ),
+        migrations.RemoveField(
+            model_name="service",
+            name="search_vector",
+        ),
+        migrations.AddField(
+            model_name="service",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "title", config="russian", weight="A"
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description", config="russian", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("russian"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+                verbose_name="пошуковий документ",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="service",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="service_search_vector_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("services", "0010_service_search_vector_generated"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="service",
+            name="service_search_vector_gin",
+        ),
+        migrations.RemoveField(
+            model_name="service",
+            name="search_vector",
+        ),
+    ]
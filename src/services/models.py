@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from exchange.models import Category
 from users.models import CustomUser
@@ -79,6 +80,16 @@ class Service(models.Model):
         help_text="Зніміть галочку, щоб виключити послугу з каталогу, не видаляючи її.",
         default=True,
     )
+    #
+    # view_count - количество просмотров. Просмотры считаются в Redis
+    # (service:<id>:views), в базу переносятся периодической задачей
+    # services.tasks.service_sync_view_counts для сортировки по популярности.
+    #
+    view_count = models.PositiveIntegerField(
+        verbose_name="перегляди",
+        default=0,
+        editable=False,
+    )
     created = models.DateTimeField(
         verbose_name="створена",
         auto_now_add=True,
@@ -92,6 +103,44 @@ class Service(models.Model):
         ordering = ["-created"]
         verbose_name = "послуга"
         verbose_name_plural = "послуги"
+        indexes = [
+            # Сортировки каталога с keyset-пагинацией (см. SERVICE_SORT_ORDERINGS):
+            # по всем активным услугам и внутри рубрики.
+            models.Index(
+                fields=["is_active", "created", "id"], name="service_active_created_idx"
+            ),
+            models.Index(
+                fields=["is_active", "price", "id"], name="service_active_price_idx"
+            ),
+            models.Index(
+                fields=["is_active", "view_count", "id"],
+                name="service_active_views_idx",
+            ),
+            models.Index(
+                fields=["is_active", "category", "created", "id"],
+                name="service_cat_created_idx",
+            ),
+            models.Index(
+                fields=["is_active", "category", "price", "id"],
+                name="service_cat_price_idx",
+            ),
+            models.Index(
+                fields=["is_active", "category", "view_count", "id"],
+                name="service_cat_views_idx",
+            ),
+            # Фильтр по сроку: цена во втором поле, чтобы диапазон цены
+            # проверялся по индексу, без чтения строк таблицы.
+            models.Index(
+                fields=["is_active", "term", "price"], name="service_active_term_idx"
+            ),
+            models.Index(
+                fields=["is_active", "category", "term", "price"],
+                name="service_cat_term_idx",
+            ),
+            GinIndex(
+                fields=["title"], name="service_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -1,47 +1,236 @@
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
+from django.template.loader import render_to_string
+from django.utils.safestring import SafeString, mark_safe
+from django_project.rds import redis
 
+from search.models import SearchDocument
+from search.selectors import search_document_ranked, search_with_trigram_fallback
 from services.models import Service
 from users.models import CustomUser
 from users.models import DetailedQuestionnaire
 from exchange.models import Category
+from exchange.selectors import category_subtree_ids
+
+
+#
+# Режимы сортировки каталога -> порядок для keyset-пагинации. Каждый покрыт
+# составным индексом (is_active[, category], поле, id), см. Service.Meta.
+#
+SERVICE_SORT_ORDERINGS = {
+    "newest": ("-created", "-id"),
+    "price": ("price", "id"),
+    "-price": ("-price", "-id"),
+    "popular": ("-view_count", "-id"),
+}
+SERVICE_SORT_CHOICES = [
+    ("newest", "Спочатку нові"),
+    ("price", "Спочатку дешевші"),
+    ("-price", "Спочатку дорожчі"),
+    ("popular", "Популярні"),
+]
+
+
+def service_range_filter(
+    field: str, minimum: int | None = None, maximum: int | None = None
+) -> Q:
+    """Условие `minimum <= field <= maximum`, пустые границы не ограничивают."""
+    condition = Q()
+    if minimum is not None:
+        condition &= Q(**{f"{field}__gte": minimum})
+    if maximum is not None:
+        condition &= Q(**{f"{field}__lte": maximum})
+    return condition
+
+
+def service_filter_ranges(
+    queryset: QuerySet,
+    price_min: int | None = None,
+    price_max: int | None = None,
+    term_min: int | None = None,
+    term_max: int | None = None,
+) -> QuerySet:
+    """
+    Фильтр по диапазонам цены и срока. Диапазоны покрыты составными индексами
+    (is_active[, category], price, id) и (is_active[, category], term, price),
+    планировщик выбирает более селективный, второе условие проверяется по индексу.
+    """
+    return queryset.filter(
+        service_range_filter("price", price_min, price_max),
+        service_range_filter("term", term_min, term_max),
+    )
 
 
 def service_list(
     category_id: int | None = None,
     provider_id: int | None = None,
     search: str | None = None,
+    only_active: bool = False,
+    price_min: int | None = None,
+    price_max: int | None = None,
+    term_min: int | None = None,
+    term_max: int | None = None,
 ) -> QuerySet:
-    queryset = Service.objects.select_related(
-        "category", "category__parent", "category__parent__parent", "provider"
-    )
+    queryset = Service.objects.select_related("category", "provider")
+
+    if only_active:
+        queryset = queryset.filter(is_active=True)
 
     if category_id:
-        queryset = queryset.filter(category_id=category_id)
+        queryset = queryset.filter(category_id__in=category_subtree_ids(category_id))
 
     if provider_id:
         queryset = queryset.filter(provider_id=provider_id)
 
+    queryset = service_filter_ranges(
+        queryset,
+        price_min=price_min,
+        price_max=price_max,
+        term_min=term_min,
+        term_max=term_max,
+    )
+
     if search:
-        search_vector = SearchVector(
-            "title", weight="A", config="russian"
-        ) + SearchVector("description", weight="B", config="russian")
-        search_query = SearchQuery(search, config="russian")
-        queryset = (
-            queryset.annotate(
-                search=search_vector, rank=SearchRank(search_vector, search_query)
-            )
-            .filter(rank__gte=0.1)
-            .order_by("-rank")
+        fulltext = search_document_ranked(
+            queryset, SearchDocument.EntityType.SERVICE, search
         )
+        queryset = search_with_trigram_fallback(fulltext, queryset, search)
 
     return queryset.all()
 
 
+#
+# Интервалы фасетов: (ключ, подпись, нижняя граница включительно, верхняя – нет).
+#
+SERVICE_PRICE_BUCKETS = [
+    ("price_0", "до 500 ₴", None, 500),
+    ("price_1", "500 – 2000 ₴", 500, 2000),
+    ("price_2", "2000 – 5000 ₴", 2000, 5000),
+    ("price_3", "від 5000 ₴", 5000, None),
+]
+SERVICE_TERM_BUCKETS = [
+    ("term_0", "до 3 днів", None, 3),
+    ("term_1", "3 – 7 днів", 3, 7),
+    ("term_2", "7 – 14 днів", 7, 14),
+    ("term_3", "від 14 днів", 14, None),
+]
+
+
+def _bucket_filter(field: str, lower: int | None, upper: int | None) -> Q:
+    condition = Q()
+    if lower is not None:
+        condition &= Q(**{f"{field}__gte": lower})
+    if upper is not None:
+        condition &= Q(**{f"{field}__lt": upper})
+    return condition
+
+
+def service_facets(
+    queryset: QuerySet,
+    category_id: int | None = None,
+    price_range: tuple[int | None, int | None] = (None, None),
+    term_range: tuple[int | None, int | None] = (None, None),
+) -> dict:
+    """
+    Фасеты для текущей выдачи за один GROUP BY: количество услуг по рубрикам и
+    по интервалам цены и срока (условная агрегация внутри каждой рубрики).
+
+    `queryset` – выдача без фильтров по рубрике и диапазонам, чтобы счётчики
+    показывали, сколько найдётся при смене фильтра. Интервалы цены считаются с
+    учётом диапазона срока и наоборот, рубрики – с учётом обоих; интервалы
+    считаются только по выбранной рубрике `category_id` вместе с подрубриками,
+    если она задана.
+    `matched` – количество услуг, подходящих под все фильтры.
+    """
+    price_filter = service_range_filter("price", *price_range)
+    term_filter = service_range_filter("term", *term_range)
+    buckets = {
+        key: Count("id", filter=_bucket_filter(field, lower, upper) & other_filter)
+        for field, bucket_list, other_filter in (
+            ("price", SERVICE_PRICE_BUCKETS, term_filter),
+            ("term", SERVICE_TERM_BUCKETS, price_filter),
+        )
+        for key, _, lower, upper in bucket_list
+    }
+    rows = list(
+        queryset.order_by()
+        .values("category_id", "category__title")
+        .annotate(
+            service_count=Count("id", filter=price_filter & term_filter), **buckets
+        )
+        .order_by("-service_count", "category__title")
+    )
+
+    subtree = set(category_subtree_ids(category_id)) if category_id else None
+    selected = [row for row in rows if subtree is None or row["category_id"] in subtree]
+
+    def bucket_counts(bucket_list):
+        return [
+            {
+                "key": key,
+                "label": label,
+                "min": lower,
+                "max": upper,
+                "count": sum(row[key] for row in selected),
+            }
+            for key, label, lower, upper in bucket_list
+        ]
+
+    return {
+        "matched": sum(row["service_count"] for row in selected),
+        "categories": [
+            {
+                "pk": row["category_id"],
+                "title": row["category__title"],
+                "service_count": row["service_count"],
+            }
+            for row in rows
+            if row["service_count"]
+        ],
+        "price": bucket_counts(SERVICE_PRICE_BUCKETS),
+        "term": bucket_counts(SERVICE_TERM_BUCKETS),
+    }
+
+
+# Отрендеренные карточки каталога. В ключе – время изменения услуги, так что
+# сохранение услуги само делает старую карточку неактуальной; TTL ограничивает
+# устаревание при изменении рубрики или профиля исполнителя.
+SERVICE_CARD_KEY = "service_card:{service_id}:{updated}"
+SERVICE_CARD_TIMEOUT = 60 * 60
+
+
+def service_card_list(services: list[Service]) -> list[SafeString]:
+    """
+    HTML карточек услуг в том же порядке. Готовые карточки берутся из Redis
+    одним MGET, отсутствующие рендерятся и сохраняются одним pipeline.
+    """
+    if not services:
+        return []
+
+    keys = [
+        SERVICE_CARD_KEY.format(
+            service_id=service.pk, updated=int(service.updated.timestamp() * 1e6)
+        )
+        for service in services
+    ]
+    cards = redis.mget(keys)
+
+    pipeline = redis.pipeline(transaction=False)
+    for index, (service, key, card) in enumerate(zip(services, keys, cards)):
+        if card is None:
+            card = render_to_string(
+                "services/service_card.html", {"service": service}
+            ).encode()
+            pipeline.set(key, card, ex=SERVICE_CARD_TIMEOUT)
+        cards[index] = mark_safe(card.decode())
+    pipeline.execute()
+
+    return cards
+
+
 def service_get_by_id(service_id: int) -> Service | None:
     return (
         Service.objects.filter(id=service_id)
-        .select_related("category__parent__parent")
+        .select_related("category")
         .select_related("provider")
         .first()
     )
@@ -0,0 +1,40 @@
+from celery import shared_task
+from django_project.rds import redis
+
+from services.models import Service
+
+VIEW_COUNT_BATCH_SIZE = 1000
+
+
+@shared_task
+def service_sync_view_counts() -> int:
+    """
+    Переносит счётчики просмотров услуг из Redis в Service.view_count, по
+    которому работает сортировка "Популярні". Обновляются только изменившиеся
+    строки, пачками. Возвращает количество обновлённых услуг.
+    """
+    counters = {}
+    for key in redis.scan_iter(match="service:*:views", count=VIEW_COUNT_BATCH_SIZE):
+        service_id = key.decode().split(":")[1]
+        if service_id.isdigit():
+            counters[int(service_id)] = key
+
+    ids = list(counters)
+    updated = 0
+    for start in range(0, len(ids), VIEW_COUNT_BATCH_SIZE):
+        batch = ids[start : start + VIEW_COUNT_BATCH_SIZE]
+        views = dict(zip(batch, redis.mget([counters[pk] for pk in batch])))
+
+        services = [
+            service
+            for service in Service.objects.filter(id__in=batch).only("id", "view_count")
+            if views[service.pk] is not None
+            and service.view_count != int(views[service.pk])
+        ]
+        for service in services:
+            service.view_count = int(views[service.pk])
+        # bulk_update не вызывает сигналы – поисковые индексы тут не затронуты.
+        Service.objects.bulk_update(services, ["view_count"])
+        updated += len(services)
+
+    return updated
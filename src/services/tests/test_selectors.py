@@ -0,0 +1,119 @@
+from core.tests.factories import ServiceFactory
+from django.test import TestCase
+from search.models import SearchDocument
+from search.selectors import search_document_list
+
+from services.selectors import service_card_list, service_facets, service_list
+
+
+class ServiceListSearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.repair = ServiceFactory(
+            title="Ремонт квартир під ключ",
+            description="Виконуємо ремонт будь-якої складності.",
+        )
+        cls.design = ServiceFactory(
+            title="Дизайн логотипу",
+            description="Створюю логотипи та фірмовий стиль.",
+        )
+
+    def test_search_matches_site_search(self):
+        # Каталог и поиск по сайту ищут по одним и тем же документам.
+        documents = search_document_list("ремонт", SearchDocument.EntityType.SERVICE)
+
+        self.assertEqual(
+            [service.pk for service in service_list(search="ремонт")],
+            [document.object_id for document in documents],
+        )
+
+    def test_search_by_title(self):
+        result = list(service_list(search="ремонт"))
+        self.assertEqual(result, [self.repair])
+
+    def test_search_follows_save(self):
+        self.design.title = "Переклад текстів"
+        self.design.save()
+
+        self.assertEqual(list(service_list(search="дизайн")), [])
+        self.assertEqual(list(service_list(search="переклад")), [self.design])
+
+
+class ServiceListFuzzySearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.repair = ServiceFactory(title="Ремонт квартир під ключ")
+        cls.logo = ServiceFactory(title="Дизайн логотипу")
+
+    def test_misspelled_query_falls_back_to_trigrams(self):
+        self.assertEqual(list(service_list(search="ремнот")), [self.repair])
+
+    def test_word_form_falls_back_to_trigrams(self):
+        self.assertEqual(list(service_list(search="логотипи")), [self.logo])
+
+    def test_unrelated_query_returns_nothing(self):
+        self.assertEqual(list(service_list(search="бухгалтерія")), [])
+
+
+class ServiceFacetsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.design = ServiceFactory(title="Дизайн логотипу", price=300, term=2)
+        ServiceFactory(
+            title="Дизайн сайту", category=cls.design.category, price=3000, term=10
+        )
+        cls.other = ServiceFactory(title="Дизайн інтер'єру", price=6000, term=20)
+        ServiceFactory(title="Ремонт квартири", category=cls.other.category)
+
+    def test_facets_follow_search_in_one_query(self):
+        with self.assertNumQueries(2):  # проверка FTS-выдачи + фасеты
+            facets = service_facets(service_list(search="дизайн"))
+
+        self.assertEqual(
+            [(c["pk"], c["service_count"]) for c in facets["categories"]],
+            [(self.design.category_id, 2), (self.other.category_id, 1)],
+        )
+        self.assertEqual([b["count"] for b in facets["price"]], [1, 0, 1, 1])
+
+    def test_buckets_follow_selected_category(self):
+        facets = service_facets(
+            service_list(search="дизайн"), category_id=self.design.category_id
+        )
+
+        self.assertEqual(len(facets["categories"]), 2)
+        self.assertEqual([b["count"] for b in facets["term"]], [1, 0, 1, 0])
+
+    def test_ranges(self):
+        services = service_list(search="дизайн", price_min=300, price_max=3000)
+        self.assertEqual(services.count(), 2)
+
+        facets = service_facets(
+            service_list(search="дизайн"),
+            price_range=(None, 3000),
+            term_range=(5, None),
+        )
+
+        # Интервалы цены учитывают только срок, интервалы срока – только цену.
+        self.assertEqual(facets["matched"], 1)
+        self.assertEqual([b["count"] for b in facets["price"]], [0, 0, 1, 1])
+        self.assertEqual([b["count"] for b in facets["term"]], [1, 0, 1, 0])
+        self.assertEqual(
+            [(c["pk"], c["service_count"]) for c in facets["categories"]],
+            [(self.design.category_id, 1)],
+        )
+
+
+class ServiceCardListTest(TestCase):
+    def test_cards_cached_until_service_changes(self):
+        service = ServiceFactory(title="Ремонт пральних машин")
+
+        with self.assertTemplateUsed("services/service_card.html"):
+            cards = service_card_list([service])
+        self.assertIn("Ремонт пральних машин", cards[0])
+
+        with self.assertTemplateNotUsed("services/service_card.html"):
+            self.assertEqual(service_card_list([service]), cards)
+
+        service.title = "Ремонт холодильників"
+        service.save()
+        self.assertIn("Ремонт холодильників", service_card_list([service])[0])
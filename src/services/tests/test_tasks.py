@@ -0,0 +1,17 @@
+from core.tests.factories import ServiceFactory
+from django.test import TestCase
+from django_project.rds import redis
+
+from services.tasks import service_sync_view_counts
+
+
+class ServiceSyncViewCountsTest(TestCase):
+    def test_view_counts_copied_from_redis(self):
+        service = ServiceFactory()
+        redis.set(f"service:{service.pk}:views", 42)
+        self.addCleanup(redis.delete, f"service:{service.pk}:views")
+
+        service_sync_view_counts()
+
+        service.refresh_from_db()
+        self.assertEqual(service.view_count, 42)
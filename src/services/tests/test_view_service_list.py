@@ -0,0 +1,198 @@
+from http import HTTPStatus
+
+from core.tests.factories import CategoryFactory, ServiceFactory
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from services.models import Service
+
+
+class ServiceListPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ServiceFactory.create_batch(5)
+        # Одинаковое время создания – порядок держится на id.
+        Service.objects.update(created=timezone.now())
+
+    def _collect_pages(self):
+        seen, pages, query = [], 0, {"per_page": 2}
+        while True:
+            response = self.client.get(reverse("services:list"), query)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            seen += [service.pk for service in response.context["service_list"]]
+            pages += 1
+            if not response.context["page_obj"].has_next():
+                return seen, pages, response
+            query["cursor"] = response.context["page_obj"].next_cursor
+
+    def test_pages_cover_catalog_without_duplicates(self):
+        seen, pages, response = self._collect_pages()
+
+        expected = list(Service.objects.order_by("-id").values_list("pk", flat=True))
+        self.assertEqual(seen, expected)
+        self.assertEqual(pages, 3)
+        self.assertEqual(response.context["result_count"], 5)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse("services:list"), {"cursor": "broken"})
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+
+class ServiceListSearchPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(7):
+            ServiceFactory(
+                title=f"Ремонт {'квартир ' * (index % 3)}№{index}",
+                description="Ремонт під ключ. " * (index + 1),
+            )
+
+    def test_search_pages_without_repeats_or_gaps(self):
+        seen, query = [], {"search": "ремонт", "per_page": 2}
+        for _ in range(10):
+            response = self.client.get(reverse("services:list"), query)
+            seen += [service.pk for service in response.context["service_list"]]
+            if not response.context["page_obj"].has_next():
+                break
+            query["cursor"] = response.context["page_obj"].next_cursor
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(set(seen), set(Service.objects.values_list("pk", flat=True)))
+
+
+class ServiceListSortTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for price, view_count in ((300, 5), (100, 50), (200, 0)):
+            ServiceFactory(price=price)
+            Service.objects.filter(price=price).update(view_count=view_count)
+        ServiceFactory(price=50, is_active=False)
+
+    def _prices(self, sort):
+        prices, query = [], {"sort": sort, "per_page": 2}
+        while True:
+            response = self.client.get(reverse("services:list"), query)
+            prices += [service.price for service in response.context["service_list"]]
+            if not response.context["page_obj"].has_next():
+                return prices
+            query["cursor"] = response.context["page_obj"].next_cursor
+
+    def test_sort_modes(self):
+        self.assertEqual(self._prices("price"), [100, 200, 300])
+        self.assertEqual(self._prices("-price"), [300, 200, 100])
+        self.assertEqual(self._prices("popular"), [100, 300, 200])
+
+
+class ServiceListPartialTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ServiceFactory.create_batch(3)
+
+    def test_htmx_request_renders_results_only(self):
+        response = self.client.get(
+            reverse("services:list"), {"per_page": 2}, HTTP_HX_REQUEST="true"
+        )
+
+        self.assertTemplateUsed(response, "services/service_list_results.html")
+        self.assertTemplateNotUsed(response, "base.html")
+        self.assertEqual(response.context["result_count"], 3)
+        self.assertIn("HX-Request", response["Vary"])
+
+        next_page = self.client.get(
+            reverse("services:list"),
+            {"per_page": 2, "cursor": response["X-Next-Cursor"]},
+            HTTP_HX_REQUEST="true",
+        )
+        self.assertTemplateUsed(next_page, "services/service_list_page.html")
+        self.assertEqual(len(next_page.context["service_list"]), 1)
+        self.assertNotIn("X-Next-Cursor", next_page)
+
+
+class ServiceListRangeTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for price, term in ((100, 1), (1000, 5), (1500, 20), (8000, 5)):
+            ServiceFactory(price=price, term=term)
+
+    def test_range_filters_and_bucket_links(self):
+        response = self.client.get(
+            reverse("services:list"), {"price_min": 500, "price_max": 1999}
+        )
+
+        prices = sorted(service.price for service in response.context["service_list"])
+        self.assertEqual(prices, [1000, 1500])
+        self.assertEqual(response.context["result_count"], 2)
+
+        price_links = response.context["facet_groups"][0][1]
+        self.assertTrue(price_links[1]["selected"])
+        self.assertNotIn("price_min", price_links[1]["query"])
+        self.assertIn("price_min=5000", price_links[3]["query"])
+
+        response = self.client.get(
+            reverse("services:list"), {"price_max": 1999, "term_max": 6}
+        )
+        self.assertEqual(
+            [service.price for service in response.context["service_list"]],
+            [1000, 100],
+        )
+
+    def test_htmx_ranges_applied_in_a_row(self):
+        def follow(query=""):
+            response = self.client.get(
+                f"{reverse('services:list')}?{query}", HTTP_HX_REQUEST="true"
+            )
+            self.assertContains(response, 'id="catalog-sidebar"')
+            self.assertContains(response, 'hx-swap-oob="true"')
+            price_links, term_links = (
+                links for _, links in response.context["facet_groups"]
+            )
+            prices = sorted(s.price for s in response.context["service_list"])
+            return prices, price_links, term_links
+
+        _, price_links, _ = follow()
+        prices, price_links, term_links = follow(price_links[1]["query"])
+        self.assertEqual(prices, [1000, 1500])
+        self.assertTrue(price_links[1]["selected"])
+
+        # Срок добавляется к уже выбранной цене
+        prices, price_links, term_links = follow(term_links[1]["query"])
+        self.assertEqual(prices, [1000])
+        self.assertTrue(price_links[1]["selected"])
+        self.assertTrue(term_links[1]["selected"])
+
+        # Повторный клик по выбранному сроку снимает только его
+        prices, price_links, term_links = follow(term_links[1]["query"])
+        self.assertEqual(prices, [1000, 1500])
+        self.assertFalse(term_links[1]["selected"])
+        self.assertTrue(price_links[1]["selected"])
+
+
+class ServiceListSubtreeTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root = CategoryFactory(title="Розробка")
+        cls.sites = CategoryFactory(title="Сайти", parent=cls.root)
+        cls.bots = CategoryFactory(title="Боти", parent=cls.root)
+        ServiceFactory(category=cls.sites, price=100)
+        ServiceFactory(category=cls.bots, price=200)
+        ServiceFactory(price=300)
+
+    def test_top_level_category_includes_subcategories(self):
+        response = self.client.get(
+            reverse("services:list"), {"category_id": self.root.pk}
+        )
+
+        self.assertEqual(
+            sorted(service.price for service in response.context["service_list"]),
+            [100, 200],
+        )
+        self.assertEqual(response.context["result_count"], 2)
+
+        response = self.client.get(
+            reverse("services:list"), {"category_id": self.bots.pk}
+        )
+        self.assertEqual(
+            [service.price for service in response.context["service_list"]], [200]
+        )
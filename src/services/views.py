@@ -1,3 +1,5 @@
+from core.mixins import PartialResponseMixin
+from core.pagination import KeysetPaginationMixin
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.http import Http404
@@ -10,28 +12,112 @@ from django.views.generic import (
     UpdateView,
 )
 from django_project.rds import redis
+from exchange.mixins import CategoryPickerMixin
 from exchange.selectors import (
     category_get_by_id,
-    category_list_only_available,
-    category_list_only_with_services,
+    category_subtree_ids,
 )
 from exchange.models import Category, CategoryProposal
+from search.mixins import CatalogResultCacheMixin, SearchAnalyticsMixin
+from search.services import autocomplete_record_query
 from users.models import Action
 from users.services import action_create
 
 from services.models import Service
 from services.forms import ServiceCreateForm
-from services.selectors import service_get_by_id, service_list
+from services.selectors import (
+    SERVICE_SORT_CHOICES,
+    SERVICE_SORT_ORDERINGS,
+    service_card_list,
+    service_facets,
+    service_filter_ranges,
+    service_get_by_id,
+    service_list,
+)
 
 
-class ServiceListView(ListView):
+class ServiceListView(
+    PartialResponseMixin,
+    SearchAnalyticsMixin,
+    CatalogResultCacheMixin,
+    KeysetPaginationMixin,
+    ListView,
+):
     model = Service
     template_name = "services/service_list.html"
-
-    def get_queryset(self):
+    partial_template_name = "services/service_list_results.html"
+    partial_page_template_name = "services/service_list_page.html"
+    catalog_kind = "service"
+    # Количество результатов берётся из фасетов, отдельный COUNT не нужен.
+    count_results = False
+
+    def get_sort(self) -> str | None:
+        sort = self.request.GET.get("sort")
+        return sort if sort in SERVICE_SORT_ORDERINGS else None
+
+    def get_keyset_ordering(self):
+        sort = self.get_sort()
+        if sort:
+            return SERVICE_SORT_ORDERINGS[sort]
+        if self.request.GET.get("search"):
+            return ("-rank", "-id")
+        return super().get_keyset_ordering()
+
+    def get_ranges(self) -> dict:
+        """Диапазоны цены и срока из GET, некорректные значения игнорируются."""
+        ranges: dict[str, int | None] = {}
+        for name in ("price_min", "price_max", "term_min", "term_max"):
+            try:
+                ranges[name] = max(0, int(self.request.GET[name]))
+            except (KeyError, ValueError):
+                ranges[name] = None
+        return ranges
+
+    def get_catalog_params(self):
+        return {**super().get_catalog_params(), **self.get_ranges()}
+
+    def get_catalog_queryset(self):
         category_id = self.request.GET.get("category_id", None)
-        search = self.request.GET.get("search", None)
-        return service_list(category_id=category_id, search=search)
+        queryset = service_filter_ranges(
+            self.get_unfiltered_catalog(), **self.get_ranges()
+        )
+        if category_id:
+            return queryset.filter(category_id__in=category_subtree_ids(category_id))
+        return queryset
+
+    def get_catalog_objects_queryset(self):
+        return service_list(only_active=True)
+
+    def get_unfiltered_catalog(self):
+        """Выдача без фильтров по рубрике и диапазонам – нужна для фасетов."""
+        if not hasattr(self, "catalog"):
+            self.catalog = service_list(
+                search=self.request.GET.get("search", None), only_active=True
+            )
+        return self.catalog
+
+    def get_facet_links(self, field: str, buckets: list[dict]) -> list[dict]:
+        """
+        Интервалы фасета `field` со ссылками: интервал [min, max) становится
+        фильтром field_min..field_max, повторный клик по выбранному его снимает.
+        """
+        ranges = self.get_ranges()
+        links = []
+        for bucket in buckets:
+            minimum = bucket["min"]
+            maximum = bucket["max"] - 1 if bucket["max"] is not None else None
+            selected = (ranges[f"{field}_min"], ranges[f"{field}_max"]) == (
+                minimum,
+                maximum,
+            )
+            query = self.request.GET.copy()
+            query.pop("cursor", None)
+            for name, value in ((f"{field}_min", minimum), (f"{field}_max", maximum)):
+                query.pop(name, None)
+                if value is not None and not selected:
+                    query[name] = value
+            links.append({**bucket, "query": query.urlencode(), "selected": selected})
+        return links
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -42,8 +128,48 @@ class ServiceListView(ListView):
             category = category_get_by_id(category_id)
             context["category"] = category
 
-        context["categories"] = category_list_only_with_services()
+        # Следующие страницы для htmx дописываются в выдачу – панель не нужна.
+        if not (context["partial"] and self.request.GET.get("cursor")):
+            # Фасеты зависят от всего каталога, поэтому кэшируются по его общей
+            # версии. Во фрагментах htmx панель тоже перерисовывается (out-of-band).
+            ranges = self.get_ranges()
+            facets = self.catalog_cached(
+                "facets",
+                self.get_catalog_params(),
+                lambda: service_facets(
+                    self.get_unfiltered_catalog(),
+                    category_id=category_id or None,
+                    price_range=(ranges["price_min"], ranges["price_max"]),
+                    term_range=(ranges["term_min"], ranges["term_max"]),
+                ),
+            )
+            context["categories"] = facets["categories"]
+            context["facet_groups"] = [
+                ("Вартість", self.get_facet_links("price", facets["price"])),
+                ("Термін", self.get_facet_links("term", facets["term"])),
+            ]
+            context["range_query"] = "&".join(
+                f"{name}={value}" for name, value in ranges.items() if value is not None
+            )
+            context["result_count"] = facets["matched"]
+        context["service_cards"] = service_card_list(context["service_list"])
         context["search"] = self.request.GET.get("search", None)
+        context["sort_links"] = []
+        for value, label in SERVICE_SORT_CHOICES:
+            query = self.request.GET.copy()
+            query.pop("cursor", None)
+            query["sort"] = value
+            context["sort_links"].append(
+                (label, query.urlencode(), value == self.get_sort())
+            )
+
+        # Популярные запросы для подсказок: учитываем только те, что что-то нашли.
+        if (
+            context["search"]
+            and context.get("result_count")
+            and not context.get("result_count_is_estimate")
+        ):
+            autocomplete_record_query(context["search"])
         return context
 
 
@@ -100,17 +226,11 @@ class ServiceDetailView(DetailView):
         return context
 
 
-class ServiceCreateView(LoginRequiredMixin, CreateView):
+class ServiceCreateView(LoginRequiredMixin, CategoryPickerMixin, CreateView):
     model = Service
     template_name = "services/service_create.html"
     form_class = ServiceCreateForm
 
-    def get_form(self, form_class=None):
-        """Оставляем в списке формы только категорії, доступные для назначения услуге."""
-        form = super().get_form(form_class)
-        form.fields["category"].queryset = category_list_only_available()
-        return form
-
     def form_valid(self, form):
         """Set logged in user as `provider` of new Service."""
         service = form.save(commit=False)
@@ -130,7 +250,11 @@ class ServiceCreateView(LoginRequiredMixin, CreateView):
 
 
 class ServiceUpdateView(
-    LoginRequiredMixin, UserPassesTestMixin, SuccessMessageMixin, UpdateView
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    SuccessMessageMixin,
+    CategoryPickerMixin,
+    UpdateView,
 ):
     model = Service
     fields = [
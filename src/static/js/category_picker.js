@@ -0,0 +1,77 @@
+// Выбор рубрики поиском (exchange.widgets.CategoryPickerWidget): варианты
+// подгружаются с сервера по мере ввода, выбранный id пишется в скрытое поле.
+(function () {
+  function initPicker(picker) {
+    var value = picker.querySelector("[data-category-picker-value]");
+    var input = picker.querySelector("[data-category-picker-input]");
+    var results = picker.querySelector("[data-category-picker-results]");
+    var timer = null;
+    var request = 0;
+
+    function hide() {
+      results.classList.add("hidden");
+      results.innerHTML = "";
+    }
+
+    function choose(item) {
+      value.value = item.id;
+      input.value = item.label;
+      input.setCustomValidity("");
+      hide();
+    }
+
+    function render(items) {
+      results.innerHTML = "";
+      if (!items.length) {
+        var empty = document.createElement("li");
+        empty.className = "px-3 py-2 text-gray-500";
+        empty.textContent = "Нічого не знайдено";
+        results.appendChild(empty);
+      }
+      items.forEach(function (item) {
+        var option = document.createElement("li");
+        option.className = "px-3 py-2 cursor-pointer hover:bg-gray-100";
+        option.setAttribute("role", "option");
+        option.textContent = item.label;
+        option.addEventListener("mousedown", function (event) {
+          event.preventDefault();
+          choose(item);
+        });
+        results.appendChild(option);
+      });
+      results.classList.remove("hidden");
+    }
+
+    function search() {
+      var current = ++request;
+      var url = picker.dataset.searchUrl + "?q=" + encodeURIComponent(input.value.trim());
+      fetch(url, { headers: { Accept: "application/json" } })
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          if (current === request) render(data.results);
+        })
+        .catch(hide);
+    }
+
+    input.addEventListener("input", function () {
+      // Текст изменён – прежний выбор больше не действует.
+      value.value = "";
+      input.setCustomValidity("");
+      clearTimeout(timer);
+      timer = setTimeout(search, 200);
+    });
+    input.addEventListener("focus", function () {
+      if (!value.value) search();
+    });
+    input.addEventListener("blur", function () {
+      if (!value.value && input.value.trim()) {
+        input.setCustomValidity("Оберіть рубрику зі списку");
+      }
+      hide();
+    });
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("[data-category-picker]").forEach(initPicker);
+  });
+})();
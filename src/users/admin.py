@@ -1,7 +1,9 @@
+from core.pagination import EstimatedCountPaginator
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
 from users.models import Action, CustomUser
+from users.selectors import action_target_prefetch
 
 
 @admin.register(CustomUser)
@@ -44,6 +46,12 @@ class CustomUserAdmin(UserAdmin):
 
 @admin.register(Action)
 class ActionAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ["user", "verb", "target", "created"]
+    list_select_related = ["user"]
     list_filter = ["created"]
     search_fields = ["verb"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(action_target_prefetch())
@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from django.db.models import QuerySet
 from orders.models import Order
 from projects.models import Project
@@ -21,12 +22,28 @@ def user_get_by_id(user_id: int) -> CustomUser | None:
     return CustomUser.objects.filter(id=user_id).first()
 
 
+def action_target_prefetch() -> GenericPrefetch:
+    """
+    Цели действий для prefetch_related: id группируются по типу цели, каждый тип
+    загружается одним запросом. У услуг и проектов берём только то, что
+    выводится в списках действий.
+    """
+    return GenericPrefetch(
+        "target",
+        [
+            Service.objects.only("id", "title"),
+            Project.objects.only("id", "title"),
+            Order.objects.all(),
+        ],
+    )
+
+
 def action_get_latest_service_views(user: CustomUser, count: int = 5) -> QuerySet:
     actions = Action.objects.filter(
         user=user,
         verb=Action.VIEW_SERVICE,
         target_ct=ContentType.objects.get_for_model(Service),
-    )
+    ).prefetch_related(action_target_prefetch())
 
     return actions[:count]
 
@@ -36,7 +53,7 @@ def action_get_latest_project_views(user: CustomUser, count: int = 5) -> QuerySe
         user=user,
         verb=Action.VIEW_PROJECT,
         target_ct=ContentType.objects.get_for_model(Project),
-    )
+    ).prefetch_related(action_target_prefetch())
 
     return actions[:count]
 
@@ -46,4 +63,4 @@ def action_list_for_order(order_id: int) -> QuerySet:
         target_ct=ContentType.objects.get_for_model(Order),
         target_id=order_id,
     ).select_related("user")
-    return actions
+    return actions.prefetch_related(action_target_prefetch())
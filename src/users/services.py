@@ -1,12 +1,12 @@
 import datetime
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.utils import timezone
 from projects.models import Project
 from services.models import Service
 
 from users.models import Action, CustomUser
-from users.selectors import user_get_by_id
 
 
 def action_create(user, verb: str, target=None) -> None:
@@ -31,27 +31,41 @@ def action_create(user, verb: str, target=None) -> None:
         Action.objects.create(user=user, verb=verb, target=target)
 
 
+def user_balance_add(user: CustomUser, amount) -> None:
+    """Изменяет баланс пользователя на `amount` (может быть отрицательным) под
+    блокировкой строки пользователя, чтобы одновременные списания и зачисления не
+    затирали друг друга. Баланс в переданном объекте тоже обновляется."""
+    with transaction.atomic():
+        balance = (
+            CustomUser.objects.select_for_update()
+            .filter(pk=user.pk)
+            .values_list("balance", flat=True)
+            .get()
+        )
+        user.balance = balance + amount
+        CustomUser.objects.filter(pk=user.pk).update(balance=user.balance)
+
+
 def user_pay_from_balance(user_id: int, item: Project | Service) -> bool:
     """Уменьшает баланс пользователя на сайте на размер стоимости услуги или проекта,
     если на балансе достаточно средств."""
-    user = user_get_by_id(user_id=user_id)
-    if user is None or user.balance < item.price:
-        return False
+    with transaction.atomic():
+        user = CustomUser.objects.select_for_update().filter(id=user_id).first()
+        if user is None or user.balance < item.price:
+            return False
 
-    user.balance -= item.price
-    user.save()
+        user.balance -= item.price
+        user.save(update_fields=["balance"])
     return True
 
 
-def user_refund_to_balance(user: CustomUser, item: Project | Service) -> None:
-    """Возвращает на баланс пользователя на сайте стоимость услуги или проекта
+def user_refund_to_balance(user: CustomUser, amount: int) -> None:
+    """Возвращает на баланс пользователя на сайте стоимость заказа
     (в случае отмены или отклонения заказа)."""
-    user.balance += item.price
-    user.save()
+    user_balance_add(user, amount)
 
 
-def user_payment_to_balance(user: CustomUser, item: Project | Service) -> None:
-    """Зачисляет на баланс исполнителя оплату за выполненную услугу или проект
+def user_payment_to_balance(user: CustomUser, amount: int) -> None:
+    """Зачисляет на баланс исполнителя оплату за выполненный заказ
     (когда работа принята заказчиком)."""
-    user.balance += item.price
-    user.save()
+    user_balance_add(user, amount)
@@ -1,6 +1,7 @@
 from celery import shared_task
 
 from users.models import CustomUser
+from users.services import user_balance_add
 
 
 @shared_task
@@ -14,5 +15,4 @@ def user_add_to_balance(user_id: int, amount: int, card_number: int):
         return
 
     print(f"Adding {amount} to {user} from card #{card_number}...")
-    user.balance += amount
-    user.save()
+    user_balance_add(user, amount)
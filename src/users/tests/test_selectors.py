@@ -0,0 +1,41 @@
+from core.tests.factories import CustomUserFactory, OrderFactory, ServiceFactory
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from orders.models import Order
+from projects.models import Project
+from services.models import Service
+
+from users.models import Action
+from users.selectors import action_get_latest_service_views, action_list_for_order
+from users.services import action_create
+
+
+class ActionTargetPrefetchTest(TestCase):
+    def setUp(self):
+        # Типы целей кэшируются ContentType после первого обращения.
+        ContentType.objects.get_for_models(Service, Project, Order)
+
+    def test_latest_views_load_targets_in_one_query(self):
+        user = CustomUserFactory()
+        services = ServiceFactory.create_batch(3)
+        for service in services:
+            action_create(user, verb=Action.VIEW_SERVICE, target=service)
+
+        with self.assertNumQueries(2):
+            titles = {
+                str(action.target)
+                for action in action_get_latest_service_views(user=user)
+            }
+        self.assertEqual(titles, {service.title for service in services})
+
+    def test_order_actions(self):
+        order = OrderFactory()
+        action_create(order.customer, verb=Action.PLACE_ORDER, target=order)
+        action_create(order.provider, verb=Action.RECEIVE_ORDER, target=order)
+
+        with self.assertNumQueries(2):
+            actions = list(action_list_for_order(order_id=order.pk))
+            self.assertEqual({action.target for action in actions}, {order})
+            self.assertEqual(
+                {action.user for action in actions}, {order.customer, order.provider}
+            )